@@ -26,6 +26,8 @@ load_dotenv()
 
 from src.config import hardened_config
 from src.graph import courtroom_swarm
+from src.nodes.judicial_nodes import get_concurrency_controller
+from src.nodes.report_generator import release_run_state
 
 console = Console()
 
@@ -173,6 +175,15 @@ class CourtroomDashboard:
         table.add_row("Errors Found", f"[bold red]{self.error_count}[/]")
         table.add_row("Elapsed Time", f"[white]{elapsed}[/]")
 
+        # Live adaptive concurrency windows (limit, in flight, last change)
+        concurrency = get_concurrency_controller().snapshot()
+        for endpoint, window in concurrency["endpoints"].items():
+            last = window["history"][-1]["reason"] if window["history"] else "-"
+            table.add_row(
+                f"LLM {endpoint.split(':', 1)[-1][:18]}",
+                f"[white]{window['in_flight']}/{window['limit']}[/] [dim]({last})[/]",
+            )
+
         return Panel(
             Align.center(table),
             title="[bold blue] 📊 SWARM VITALS [/bold blue]",
@@ -198,6 +209,7 @@ async def execute_swarm_with_ui(
     pdf_path: str,
     rubric_path: str,
     dashboard_ui: CourtroomDashboard,
+    cache_mode: str = "use",
 ):
     """Executes the swarm while aggressively intercepting all loggers."""
     correlation_id = str(uuid.uuid4())
@@ -236,6 +248,7 @@ async def execute_swarm_with_ui(
         "metadata": {
             "correlation_id": correlation_id,
             "run_status": "STARTED",
+            "response_cache_mode": cache_mode,
         },
         "re_eval_count": 0,
         "re_eval_needed": False,
@@ -260,6 +273,8 @@ async def execute_swarm_with_ui(
         logging.error(f"Catastrophic failure: {e}")
         raise e
     finally:
+        # Normally done by the report generator; also covers runs that abort before it
+        release_run_state(correlation_id)
         # Restoration of original logging state
         root.removeHandler(log_handler)
         for name, (prop, handlers, level) in original_configs.items():
@@ -313,6 +328,7 @@ async def run_audit(args):
                 pdf_path=validated_request.spec,
                 rubric_path=validated_request.rubric,
                 dashboard_ui=dashboard_ui,
+                cache_mode=validated_request.cache_mode,
             )
 
             dashboard_ui.update()
@@ -345,6 +361,41 @@ def show_config(_args):
     console.print(Panel(table, expand=False, border_style="blue"))
 
 
+async def tune_concurrency_command(args):
+    """Subcommand: tune-concurrency"""
+    from src.config import judicial_settings
+    from src.utils.concurrency_tuner import default_levels, tune_concurrency
+    from src.utils.llm_clients import get_chat_model
+
+    provider = args.provider or judicial_settings.judicial_provider
+    model = args.model or judicial_settings.techlead_model
+    options = {"base_url": judicial_settings.ollama_base_url} if provider == "ollama" else {}
+    llm = get_chat_model(provider, model, 0.0, **options)
+
+    async def probe():
+        return await llm.ainvoke("Reply with the single word: OK")
+
+    console.print(f"Tuning concurrency against [cyan]{provider}:{model}[/cyan] ...")
+    report = await tune_concurrency(probe, default_levels(args.max), args.requests, args.error_budget)
+
+    table = Table(title="Concurrency Sweep", box=box.ROUNDED)
+    for column in ("Concurrency", "Req/s", "p50 (s)", "p95 (s)", "Throttled", "Errors"):
+        table.add_column(column, justify="right")
+    for level in report.levels:
+        style = "bold green" if level.concurrency == report.recommended_limit else None
+        table.add_row(
+            str(level.concurrency),
+            f"{level.throughput_rps:.2f}",
+            f"{level.p50_latency_s:.2f}",
+            f"{level.p95_latency_s:.2f}",
+            str(level.throttled),
+            str(level.errors),
+            style=style,
+        )
+    console.print(table)
+    console.print(f"Recommended: [bold green]MAX_CONCURRENT_LLM_CALLS={report.recommended_limit}[/bold green]")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Digital Courtroom Production CLI")
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -353,13 +404,40 @@ def main():
     audit_parser.add_argument("--spec", required=True)
     audit_parser.add_argument("--rubric", default="rubric/week2_rubric.json")
     audit_parser.add_argument("--dashboard", action="store_true")
+    cache_group = audit_parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        dest="cache_mode",
+        action="store_const",
+        const="bypass",
+        default="use",
+        help="Bypass the judicial response cache for this run",
+    )
+    cache_group.add_argument(
+        "--refresh-cache",
+        dest="cache_mode",
+        action="store_const",
+        const="refresh",
+        help="Ignore cached judicial responses and store fresh ones",
+    )
     subparsers.add_parser("config", help="Show active configuration")
+    tune_parser = subparsers.add_parser(
+        "tune-concurrency",
+        help="Find the throughput-optimal LLM concurrency limit for an endpoint",
+    )
+    tune_parser.add_argument("--provider", choices=["google", "ollama"], default=None)
+    tune_parser.add_argument("--model", default=None)
+    tune_parser.add_argument("--max", type=int, default=32, help="Highest concurrency level to try")
+    tune_parser.add_argument("--requests", type=int, default=20, help="Requests per concurrency level")
+    tune_parser.add_argument("--error-budget", type=float, default=0.05, help="Tolerated failure rate")
     args = parser.parse_args()
 
     if args.command == "audit":
         asyncio.run(run_audit(args))
     elif args.command == "config":
         show_config(args)
+    elif args.command == "tune-concurrency":
+        asyncio.run(tune_concurrency_command(args))
     else:
         parser.print_help()
 
@@ -137,6 +137,14 @@ class DetectiveSettings(BaseSettings):
         validation_alias="VISION_MODEL",
     )
 
+    # Multi-image batching: pack up to K images into one vision request (1 = one image per call)
+    vision_batch_size: int = Field(
+        default=1,
+        ge=1,
+        le=16,
+        validation_alias=AliasChoices("vision_batch_size", "VISION_BATCH_SIZE"),
+    )
+
     ollama_base_url: str = Field(
         default="http://localhost:11434",
         validation_alias="OLLAMA_BASE_URL",
@@ -226,6 +234,41 @@ class JudicialSettings(BaseSettings):
         ),
     )
 
+    # Adaptive (AIMD) windows per provider endpoint, moving between the minimum and
+    # max_concurrent_llm_calls; the initial window defaults to half the cap, so additive
+    # increase can raise it on an endpoint with spare capacity.
+    adaptive_concurrency_enabled: bool = True
+    adaptive_concurrency_initial: int | None = Field(default=None, ge=1)
+    adaptive_concurrency_min: int = Field(default=1, ge=1)
+    adaptive_decrease_factor: float = Field(default=0.5, gt=0.0, lt=1.0)
+    # Calls slower than tolerance x the endpoint's latency baseline stop additive increase
+    adaptive_latency_tolerance: float = Field(default=2.0, ge=1.0)
+    adaptive_error_rate_threshold: float = Field(default=0.2, ge=0.0, le=1.0)
+
+    # Slot waiters are served by call type (re-evaluation, fallback, first pass) and
+    # criterion progress; every aging interval waited is worth one priority level.
+    priority_scheduling_enabled: bool = True
+    priority_aging_interval: float = Field(default=10.0, gt=0.0)
+    # Slots are shared round-robin between concurrent audits; optionally cap the
+    # slots a single audit may hold (None: limited only by the global cap).
+    max_in_flight_per_audit: int | None = Field(default=None, ge=1)
+
+    # Hedging: a judicial call still running past the model's tracked latency
+    # percentile fires one duplicate (optionally against hedge_model); the first
+    # valid response wins. Capped per run.
+    hedging_enabled: bool = False
+    hedge_latency_percentile: float = Field(default=0.95, gt=0.5, lt=1.0)
+    hedge_min_samples: int = Field(default=20, ge=1)
+    hedge_max_per_run: int = Field(default=10, ge=0)
+    hedge_model: str | None = None
+
+    # Rate limits per (provider, model): requests and prompt tokens per minute.
+    # Overrides are keyed "provider:model", e.g. {"google:gemini-2.5-flash": {"rpm": 10, "tpm": 250000}}
+    rate_limit_rpm: float = Field(default=120.0, gt=0.0)
+    rate_limit_tpm: int | None = Field(default=None, ge=1)
+    rate_limit_burst: float = Field(default=5.0, ge=1.0)
+    rate_limit_overrides: dict[str, dict[str, float]] = Field(default_factory=dict)
+
     # FR-002: Retry / Exponential Backoff
     retry_initial_delay: float = 1.0
     retry_max_delay: float = 60.0
@@ -234,9 +277,85 @@ class JudicialSettings(BaseSettings):
     # FR-008: Per-request timeout for hung calls (seconds)
     llm_call_timeout: float = 120.0
     batch_llm_call_timeout: float = 300.0
-
-    # FR-005: Toggle for structured batching mode
+    # Judges and vision stream completions: the call returns once a schema-valid JSON
+    # object closes and fails (retryably) when no tokens arrive within the first-token
+    # window (prompt prefill) or the stall window between chunks. The first-token window
+    # is llm_first_token_share of the call's own timeout (batch/panel calls: the batch
+    # timeout), unless llm_first_token_timeout fixes it
+    llm_streaming_enabled: bool = True
+    llm_first_token_share: float = Field(default=0.5, gt=0, le=1)
+    llm_first_token_timeout: float | None = Field(default=None, gt=0)
+    llm_stall_timeout: float = Field(default=15.0, gt=0)
+
+    # FR-005: Toggle for structured batching mode. The axis selects one call per judge
+    # across all criteria ("judge") or per criterion across all judges ("criterion").
+    # A criterion panel renders every persona on one model: techlead_model (or the
+    # cascade model), not the per-judge prosecutor/defense models
     batching_enabled: bool = False
+    batching_axis: Literal["judge", "criterion"] = "judge"
+    # Judge-axis batches are packed into micro-batches of criteria whose estimated
+    # prompt (base prompt + evidence slices) and response fit these token budgets and
+    # the model's context window ("provider:model" overrides); the criteria-per-batch
+    # cap adapts to each model's observed batch failure rate.
+    micro_batching_enabled: bool = True
+    micro_batch_prompt_tokens: int = Field(default=24000, ge=1000)
+    micro_batch_response_tokens: int = Field(default=4000, ge=256)
+    micro_batch_response_tokens_per_criterion: int = Field(default=400, ge=1)
+    micro_batch_context_window: int = Field(default=32768, ge=2048)
+    model_context_windows: dict[str, int] = Field(default_factory=dict)
+    micro_batch_max_criteria: int = Field(default=8, ge=1)
+    micro_batch_failure_threshold: float = Field(default=0.25, ge=0.0, le=1.0)
+
+    # Send each judicial task only the evidence relevant to its dimension
+    evidence_routing_enabled: bool = True
+    # Items matched only by vocabulary are limited to the top-k BM25 hits per dimension
+    # (queried with its instruction, success and failure patterns); 0 keeps every match
+    evidence_retrieval_top_k: int = Field(default=25, ge=0)
+    # Cluster repetitive found evidence (same source, class, file and pattern; at least
+    # compaction_min_cluster items) into summary evidence with representative samples
+    evidence_compaction_enabled: bool = True
+    compaction_min_cluster: int = Field(default=4, ge=2)
+    compaction_samples: int = Field(default=3, ge=1)
+    # Keep every judicial prompt within a token budget per model ("provider:model"
+    # overrides): evidence beyond it is dropped by priority (class, confidence,
+    # relevance) and summarized as per-class counts. The reserve covers instructions.
+    evidence_budget_enabled: bool = True
+    prompt_token_budget: int = Field(default=16000, ge=1000)
+    prompt_token_budgets: dict[str, int] = Field(default_factory=dict)
+    prompt_reserve_tokens: int = Field(default=2000, ge=0)
+
+    # Provider-side prompt prefix caching: Gemini cached content / Ollama keep-alive
+    prompt_cache_enabled: bool = False
+    prompt_cache_ttl: int = Field(default=900, ge=60)
+    # Prefixes shorter than this (estimated tokens) are not worth a Gemini cache entry
+    prompt_cache_min_tokens: int = Field(default=1024, ge=0)
+    ollama_keep_alive: str = "30m"
+    ollama_num_ctx: int | None = Field(default=None, ge=2048)
+
+    # Persistent cache of validated judicial responses (SQLite, keyed by request digest)
+    response_cache_enabled: bool = False
+    response_cache_path: str = "audit/cache/judicial_responses.sqlite"
+    response_cache_ttl: int = Field(default=7 * 24 * 3600, ge=60)
+    response_cache_max_entries: int = Field(default=5000, ge=1)
+
+    # Synthesize (and re-evaluate) each criterion as soon as its opinions are complete
+    streaming_synthesis_enabled: bool = True
+    # Budget of a completed criterion's follow-up calls (escalation, replicas, re-evaluation),
+    # kept under the 900 s judicial node timeout so the streamed verdict survives them
+    streaming_follow_up_timeout: float = Field(default=600.0, gt=0)
+
+    # Coalesce concurrent identical judicial requests into one LLM call (temperature 0 only)
+    singleflight_enabled: bool = True
+
+    # Model cascade: first-pass opinions come from cascade_model (small, fast, same
+    # provider); a criterion is escalated to the configured judge models when the small
+    # panel's variance exceeds cascade_max_variance, an opinion cites no evidence, fails
+    # validation, or cites invalid evidence. Needs streaming synthesis.
+    cascade_enabled: bool = False
+    cascade_model: str | None = None
+    cascade_max_variance: int = Field(default=1, ge=0, le=4)
+    # Seconds credited per avoided large-model call while that model has no latency history
+    cascade_large_latency_estimate: float = Field(default=30.0, gt=0)
 
     # (013-ironclad-hardening) Redundancy and Leader Election
     judicial_redundancy_factor: int = Field(
@@ -245,6 +364,10 @@ class JudicialSettings(BaseSettings):
         le=5,
         validation_alias="JUDICIAL_REDUNDANCY_FACTOR",
     )
+    # Launch one instance per judge and add replicas (up to the factor) only for judges
+    # whose opinion is inconclusive, until a majority of them agrees. Needs streaming
+    # synthesis; batching keeps static redundancy.
+    adaptive_redundancy_enabled: bool = True
 
     @field_validator("max_concurrent_llm_calls")
     @classmethod
@@ -52,6 +52,12 @@ class InvalidInputError(FatalException):
     pass
 
 
+class EvidenceUnavailableError(FatalException):
+    """Raised when a judicial task's evidence reference cannot be resolved (Fatal)."""
+
+    pass
+
+
 # --- ContextBuilder Node Exceptions ---
 
 
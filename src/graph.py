@@ -6,6 +6,7 @@ Wires together all forensic and judicial nodes into a deterministic swarm.
 from langgraph.graph import END, START, StateGraph
 from langgraph.types import Send
 
+from src.judicial.evidence_store import evidence_digest, get_evidence_store
 from src.nodes.consistency_guard import consistency_guard_node
 
 # Node Imports
@@ -13,9 +14,11 @@ from src.nodes.context_builder import build_context
 from src.nodes.detectives import doc_analyst, repo_investigator, vision_inspector
 from src.nodes.error_handler import error_handler_node
 from src.nodes.evidence_aggregator import aggregator_node
+from src.nodes.evidence_compactor import compactor_node
 from src.nodes.judges import (
     evaluate_batch_criterion,
     evaluate_criterion,
+    evaluate_panel_criterion,
     execute_judicial_layer,
 )
 from src.nodes.justice import chief_justice_node, route_after_justice
@@ -33,6 +36,7 @@ timed_doc_analyst = timeout_wrapper(900)(doc_analyst)
 timed_vision_inspector = timeout_wrapper(900)(vision_inspector)
 timed_evaluate_criterion = timeout_wrapper(900)(evaluate_criterion)
 timed_evaluate_batch_criterion = timeout_wrapper(900)(evaluate_batch_criterion)
+timed_evaluate_panel_criterion = timeout_wrapper(900)(evaluate_panel_criterion)
 
 
 # Routing Functions for US2 (Fault Tolerance)
@@ -45,10 +49,30 @@ def route_after_aggregator(state: AgentState) -> list[Send] | str:
     return execute_judicial_layer(state)
 
 
-def route_after_justice_with_errors(state: AgentState) -> str:
+def chief_justice_update(state: AgentState) -> dict:
+    """
+    Chief Justice as a graph node: returns only the keys it owns. Returning the whole
+    state would re-apply the `operator.add` reducers and duplicate opinions and errors.
+    """
+    result = chief_justice_node(state)
+    return {key: result[key] for key in ("criterion_results", "re_eval_needed", "re_eval_count") if key in result}
+
+
+def evidence_changed(state: AgentState) -> bool:
+    """True if the evidence differs from what was published to the judges of this run."""
+    correlation_id = state.get("metadata", {}).get("correlation_id", "unknown")
+    store = get_evidence_store(correlation_id)
+    return not store.published or evidence_digest(state.get("evidences", {})) != store.digest
+
+
+def route_after_justice_with_errors(state: AgentState) -> list[Send] | str:
     """Routes after justice, checking for errors first."""
     # US2: Proceed to report/re-eval even if errors occurred (they will be in the log)
-    return route_after_justice(state)
+    route = route_after_justice(state)
+    if route != "judges" or evidence_changed(state):
+        return route
+    # Unchanged evidence: skip the aggregator and re-judge only the flagged criteria
+    return execute_judicial_layer(state) or "report"
 
 
 def create_graph() -> StateGraph:
@@ -63,15 +87,17 @@ def create_graph() -> StateGraph:
     builder.add_node("doc_analyst", timed_doc_analyst)
     builder.add_node("vision_inspector", timed_vision_inspector)
 
-    # Layer 1.5: Aggregation
+    # Layer 1.5: Aggregation and compaction
     builder.add_node("aggregator", aggregator_node)
+    builder.add_node("evidence_compactor", compactor_node)
 
     # Layer 2: Judges (parallel via Send)
     builder.add_node("evaluate_criterion", timed_evaluate_criterion)
     builder.add_node("evaluate_batch_criterion", timed_evaluate_batch_criterion)
+    builder.add_node("evaluate_panel_criterion", timed_evaluate_panel_criterion)
 
     # Layer 3: Justice
-    builder.add_node("chief_justice", chief_justice_node)
+    builder.add_node("chief_justice", chief_justice_update)
 
     # Finalization
     builder.add_node("report_generator", report_generator_node)
@@ -91,16 +117,18 @@ def create_graph() -> StateGraph:
     builder.add_edge("doc_analyst", "aggregator")
     builder.add_edge("vision_inspector", "aggregator")
 
-    # Judge Fan-Out (Conditional Send)
+    # Evidence Compaction, then Judge Fan-Out (Conditional Send)
+    builder.add_edge("aggregator", "evidence_compactor")
     builder.add_conditional_edges(
-        "aggregator",
+        "evidence_compactor",
         route_after_aggregator,
-        ["evaluate_criterion", "evaluate_batch_criterion", "error_handler"],
+        ["evaluate_criterion", "evaluate_batch_criterion", "evaluate_panel_criterion", "error_handler"],
     )
 
     # Judge Fan-In
     builder.add_edge("evaluate_criterion", "chief_justice")
     builder.add_edge("evaluate_batch_criterion", "chief_justice")
+    builder.add_edge("evaluate_panel_criterion", "chief_justice")
 
     # Justice Routing (Re-evaluation Loop or Report)
     builder.add_conditional_edges(
@@ -110,6 +138,7 @@ def create_graph() -> StateGraph:
             "judges": "aggregator",
             "report": "consistency_guard",
             "error_handler": "error_handler",
+            "evaluate_criterion": "evaluate_criterion",
         },
     )
 
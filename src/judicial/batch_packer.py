@@ -0,0 +1,126 @@
+"""
+Token-budgeted micro-batching of rubric criteria for judge-axis batching.
+
+Instead of one call per judge over the whole rubric, criteria are packed (in
+rubric order) into micro-batches whose estimated prompt fits the prompt budget and
+the model's context window, and whose expected response fits the response budget.
+A criterion's prompt cost is the size of its evidence slice, so evidence-heavy
+criteria end up in smaller batches.
+
+The number of criteria per batch is additionally capped per model, and the cap
+adapts to observed batch failures (missing/corrupt items, failed or timed-out
+calls): it is halved when the failure rate exceeds its threshold and grows by one
+after a run of clean batches. Giant batches that time out or come back partial
+shrink; reliable ones grow back towards a single call.
+"""
+
+import threading
+
+from src.config import judicial_settings
+
+# Clean batches required before the cap grows by one criterion
+GROWTH_STREAK = 3
+# Weight of the latest batch in the failure-rate average
+FAILURE_SMOOTHING = 0.3
+
+
+class MicroBatchSizer:
+    """Adaptive cap on the number of criteria per batched call for one model."""
+
+    def __init__(self, model: str, maximum: int, failure_threshold: float):
+        self.model = model
+        self.maximum = maximum
+        self.limit = maximum
+        self.failure_threshold = failure_threshold
+        self.failure_rate = 0.0
+        self._streak = 0
+        self._lock = threading.Lock()
+
+    def record(self, requested: int, failed: int) -> None:
+        """Feeds back one batch: `failed` of its `requested` criteria were missing, corrupt or lost."""
+        if requested <= 0:
+            return
+        with self._lock:
+            rate = min(failed, requested) / requested
+            self.failure_rate += FAILURE_SMOOTHING * (rate - self.failure_rate)
+            if rate > self.failure_threshold and self.failure_rate > self.failure_threshold:
+                # Shrink below the batch that failed, not just below the current cap
+                self.limit = max(1, min(self.limit, requested) // 2)
+                self._streak = 0
+            elif rate == 0:
+                self._streak += 1
+                if self._streak >= GROWTH_STREAK and self.limit < self.maximum:
+                    self.limit += 1
+                    self._streak = 0
+
+    def snapshot(self) -> dict:
+        return {"limit": self.limit, "maximum": self.maximum, "failure_rate": round(self.failure_rate, 3)}
+
+
+def pack_criteria(
+    dimensions: list[dict],
+    criterion_tokens: dict[str, int],
+    *,
+    base_tokens: int,
+    prompt_tokens: int,
+    response_tokens: int,
+    response_tokens_per_criterion: int,
+    max_criteria: int,
+) -> list[list[dict]]:
+    """
+    Greedy, order-preserving packing: a batch is closed when the next criterion would
+    exceed the prompt budget (base prompt + evidence of its criteria), the response
+    budget, or `max_criteria`. A criterion that alone exceeds a budget gets a batch of its own.
+    """
+    per_response = max(1, response_tokens_per_criterion)
+    max_criteria = max(1, min(max_criteria, response_tokens // per_response or 1))
+
+    batches: list[list[dict]] = []
+    current: list[dict] = []
+    used = base_tokens
+    for dim in dimensions:
+        cost = criterion_tokens.get(dim["id"], 0)
+        if current and (len(current) >= max_criteria or used + cost > prompt_tokens):
+            batches.append(current)
+            current, used = [], base_tokens
+        current.append(dim)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def context_window(provider: str, model: str) -> int:
+    """Context window assumed for a judicial model (Ollama: the configured num_ctx, if any)."""
+    window = judicial_settings.model_context_windows.get(f"{provider}:{model}")
+    if window is None and provider == "ollama" and judicial_settings.ollama_num_ctx:
+        window = judicial_settings.ollama_num_ctx
+    return window or judicial_settings.micro_batch_context_window
+
+
+def prompt_budget(provider: str, model: str) -> int:
+    """Prompt tokens a micro-batch may use: the target, within the context window minus the response budget."""
+    room = context_window(provider, model) - judicial_settings.micro_batch_response_tokens
+    return max(1, min(judicial_settings.micro_batch_prompt_tokens, room))
+
+
+_sizers: dict[str, MicroBatchSizer] = {}
+_sizers_lock = threading.Lock()
+
+
+def get_batch_sizer(model: str) -> MicroBatchSizer:
+    """Adaptive batch-size cap of a model (shared across runs, like the rate limiters)."""
+    with _sizers_lock:
+        if model not in _sizers:
+            _sizers[model] = MicroBatchSizer(
+                model,
+                judicial_settings.micro_batch_max_criteria,
+                judicial_settings.micro_batch_failure_threshold,
+            )
+        return _sizers[model]
+
+
+def reset_batch_sizers() -> None:
+    """Drops every adaptive cap (tests, configuration reloads)."""
+    with _sizers_lock:
+        _sizers.clear()
@@ -0,0 +1,80 @@
+"""
+Per-criterion completion tracking for streaming synthesis.
+
+The judicial fan-out registers, for every criterion, the task slots it launched
+(one per judge and redundancy replica). Each judge task reports its opinion to
+the run's tracker; the task that completes a criterion receives the full set of
+opinions exactly once and synthesizes that criterion immediately, instead of
+waiting for the slowest task of the whole layer at the Chief Justice barrier.
+"""
+
+import threading
+
+from src.state import JudicialOpinion
+
+Slot = tuple[str, str]  # (judge, task correlation id)
+
+
+class CriterionTracker:
+    """Expected and arrived opinions per criterion for a single audit run."""
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self._expected: dict[str, set[Slot]] = {}
+        self._names: dict[str, str] = {}
+        self._arrived: dict[str, dict[Slot, list[JudicialOpinion]]] = {}
+        self._completed: set[str] = set()
+        self._lock = threading.Lock()
+
+    def expect(self, criterion_id: str, dimension_name: str, slots: list[Slot]) -> None:
+        """Registers the task slots of a criterion (re-registering resets it)."""
+        with self._lock:
+            self._expected[criterion_id] = set(slots)
+            self._names[criterion_id] = dimension_name
+            self._arrived[criterion_id] = {}
+            self._completed.discard(criterion_id)
+
+    def dimension_name(self, criterion_id: str) -> str:
+        return self._names.get(criterion_id, criterion_id)
+
+    def progress(self, criterion_id: str) -> float:
+        """Fraction of the criterion's slots that have reported (0.0 when untracked)."""
+        with self._lock:
+            expected = self._expected.get(criterion_id)
+            if not expected:
+                return 0.0
+            return len(self._arrived[criterion_id]) / len(expected)
+
+    def add(self, criterion_id: str, slot: Slot, opinions: list[JudicialOpinion]) -> list[JudicialOpinion] | None:
+        """
+        Records a slot's opinions. Returns every opinion of the criterion when this call
+        completes it, None otherwise (untracked slot, still pending, already completed).
+        """
+        with self._lock:
+            expected = self._expected.get(criterion_id)
+            if expected is None or slot not in expected or criterion_id in self._completed:
+                return None
+            arrived = self._arrived[criterion_id]
+            arrived.setdefault(slot, list(opinions))
+            if arrived.keys() < expected:
+                return None
+            self._completed.add(criterion_id)
+            return [op for ops in arrived.values() for op in ops]
+
+
+_registry: dict[str, CriterionTracker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_criterion_tracker(run_id: str = "unknown") -> CriterionTracker:
+    """Returns the criterion tracker of the given run."""
+    with _registry_lock:
+        if run_id not in _registry:
+            _registry[run_id] = CriterionTracker(run_id)
+        return _registry[run_id]
+
+
+def release_criterion_tracker(run_id: str) -> None:
+    """Forgets the tracking state of a finished run."""
+    with _registry_lock:
+        _registry.pop(run_id, None)
@@ -0,0 +1,82 @@
+"""
+In-process BM25 index over a run's evidence.
+
+Built once per run (per published evidence set) from each item's content and
+location terms; each rubric dimension is then a query over its forensic
+vocabulary (instruction, success and failure patterns). Postings are laid out as
+flat CSR-style arrays with the BM25 weight of every (term, item) pair precomputed,
+so a query is one slice per query term plus a single weighted `bincount` and costs
+well under a millisecond even for thousands of items and hundreds of dimensions.
+No network or embedding service is involved.
+
+NumPy is used when available; a pure-Python posting list gives identical scores otherwise.
+"""
+
+import math
+from collections import Counter
+from collections.abc import Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Standard Okapi BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+class BM25Index:
+    """BM25 scores of indexed documents (term counts) against term queries."""
+
+    def __init__(self, documents: list[Counter], k1: float = BM25_K1, b: float = BM25_B):
+        self.size = len(documents)
+        lengths = [sum(doc.values()) for doc in documents]
+        avg_length = (sum(lengths) / self.size) if self.size else 0.0
+
+        frequency = Counter(term for doc in documents for term in doc)
+        self.vocabulary = {term: i for i, term in enumerate(sorted(frequency))}
+        idf = {term: math.log(1 + (self.size - df + 0.5) / (df + 0.5)) for term, df in frequency.items()}
+
+        # Postings grouped by term id: (document, precomputed BM25 weight)
+        postings: list[list[tuple[int, float]]] = [[] for _ in self.vocabulary]
+        for doc_id, (doc, length) in enumerate(zip(documents, lengths, strict=True)):
+            norm = k1 * (1 - b + b * length / avg_length) if avg_length else k1
+            for term, tf in doc.items():
+                weight = idf[term] * tf * (k1 + 1) / (tf + norm)
+                postings[self.vocabulary[term]].append((doc_id, weight))
+
+        if np is not None:
+            counts = [len(p) for p in postings]
+            self._indptr = np.concatenate(([0], np.cumsum(counts, dtype=np.int64)))
+            self._docs = np.fromiter((d for p in postings for d, _w in p), dtype=np.int64, count=sum(counts))
+            self._weights = np.fromiter((w for p in postings for _d, w in p), dtype=np.float64, count=sum(counts))
+        else:
+            self._postings = postings
+
+    def search(self, terms: Iterable[str]) -> dict[int, tuple[float, int]]:
+        """Documents sharing at least one query term -> (BM25 score, number of matched query terms)."""
+        ids = sorted({self.vocabulary[t] for t in terms if t in self.vocabulary})
+        if not ids:
+            return {}
+
+        if np is not None:
+            docs = np.concatenate([self._docs[self._indptr[i] : self._indptr[i + 1]] for i in ids])
+            weights = np.concatenate([self._weights[self._indptr[i] : self._indptr[i + 1]] for i in ids])
+            scores = np.bincount(docs, weights=weights, minlength=self.size)
+            matches = np.bincount(docs, minlength=self.size)
+            hit = np.flatnonzero(matches)
+            return dict(zip(hit.tolist(), zip(scores[hit].tolist(), matches[hit].tolist(), strict=True), strict=True))
+
+        results: dict[int, tuple[float, int]] = {}
+        for i in ids:
+            for doc_id, weight in self._postings[i]:
+                score, matched = results.get(doc_id, (0.0, 0))
+                results[doc_id] = (score + weight, matched + 1)
+        return results
+
+    @staticmethod
+    def top_k(results: dict[int, tuple[float, int]], k: int, candidates: Iterable[int] | None = None) -> list[int]:
+        """The `k` best-scoring documents of a search (among `candidates`, if given); ties keep document order."""
+        pool = results if candidates is None else [d for d in candidates if d in results]
+        return sorted(pool, key=lambda d: (-results[d][0], d))[:k]
@@ -0,0 +1,127 @@
+"""
+Budget-aware evidence packing for judicial prompts.
+
+A large repository can yield thousands of evidence items; rendered verbatim they
+overflow the model's context window (truncation, hard failures, slow prefill).
+The packer keeps the rendered evidence block within a token budget: when the
+slice does not fit, items are ranked by evidence class, confidence and relevance
+to the criteria under evaluation, the highest-ranked items that fit are kept (in
+their original order, so the prompt prefix stays stable), and the rest are
+collapsed into per-class counts on a single omission line the judges can read.
+"""
+
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from src.config import judicial_settings
+from src.judicial.batch_packer import context_window
+from src.judicial.evidence_router import dimension_terms, extract_terms
+from src.state import EvidenceClass
+from src.utils.tokens import estimate_tokens
+
+# Weight of each evidence class in the ranking; security findings are never the first to go
+CLASS_PRIORITY: dict[str, float] = {
+    EvidenceClass.SECURITY_VIOLATION.value: 3.0,
+    EvidenceClass.GIT_FORENSIC.value: 2.0,
+    EvidenceClass.STATE_MANAGEMENT.value: 2.0,
+    EvidenceClass.MODEL_DEFINITIONS.value: 2.0,
+    EvidenceClass.DOCUMENT_CLAIM.value: 1.5,
+    EvidenceClass.ORCHESTRATION_PATTERN.value: 1.0,
+}
+# Relevance saturates at this many shared terms with the criteria
+RELEVANCE_TERMS = 3
+# Tokens kept free for the omission line
+OMISSION_RESERVE_TOKENS = 80
+
+
+class PackingStats(BaseModel):
+    """What a packed evidence block kept and what it left out."""
+
+    budget_tokens: int
+    tokens: int
+    kept: int
+    dropped: int = 0
+    dropped_by_class: dict[str, int] = Field(default_factory=dict)
+
+
+def _field(item: Any, name: str, default: Any = None) -> Any:
+    return item.get(name, default) if isinstance(item, dict) else getattr(item, name, default)
+
+
+def _class_of(item: Any) -> str:
+    ev_class = _field(item, "evidence_class", "unknown")
+    return str(getattr(ev_class, "value", ev_class))
+
+
+def evidence_priority(item: Any, terms: set[str]) -> float:
+    """Ranking score: class weight + confidence + relevance (+1 for detective failures, which are always telling)."""
+    relevance = len(terms & extract_terms(f"{_field(item, 'content') or ''} {_field(item, 'location') or ''}"))
+    score = CLASS_PRIORITY.get(_class_of(item), 1.0)
+    score += float(_field(item, "confidence", 0.0) or 0.0)
+    score += min(relevance, RELEVANCE_TERMS) / RELEVANCE_TERMS
+    if not _field(item, "found", True):
+        score += 1.0
+    return score
+
+
+def omission_line(stats: PackingStats) -> str:
+    counts = ", ".join(f"{cls}: {n}" for cls, n in sorted(stats.dropped_by_class.items()))
+    return (
+        f"- OMITTED: {stats.dropped} lower-priority evidence items ({counts}) did not fit the prompt "
+        "budget and are not shown; they cannot be cited.\n"
+    )
+
+
+def evidence_budget(provider: str, model: str) -> int:
+    """
+    Evidence tokens a judicial prompt of `model` may carry: its prompt budget (capped by the
+    context window minus the response budget) less the reserve for instructions and request.
+    """
+    budget = judicial_settings.prompt_token_budgets.get(f"{provider}:{model}", judicial_settings.prompt_token_budget)
+    budget = min(budget, context_window(provider, model) - judicial_settings.micro_batch_response_tokens)
+    return max(OMISSION_RESERVE_TOKENS * 2, budget - judicial_settings.prompt_reserve_tokens)
+
+
+def pack_evidence(
+    evidences: dict[str, list[Any]],
+    budget_tokens: int,
+    render_line: Callable[[Any], str],
+    dimensions: list[dict] | None = None,
+    model: str | None = None,
+) -> tuple[str, PackingStats]:
+    """
+    Renders the evidence (buckets in sorted order, one line per item) within
+    `budget_tokens`. Returns the block and its packing statistics; a slice that fits
+    is rendered exactly as without a budget.
+    """
+    items = [e for bucket in sorted(evidences) for e in evidences[bucket]]
+    lines = [render_line(e) for e in items]
+    costs = [estimate_tokens(line, model) for line in lines]
+    total = sum(costs)
+    if total <= budget_tokens:
+        return "".join(lines), PackingStats(budget_tokens=budget_tokens, tokens=total, kept=len(items))
+
+    terms = set().union(*(dimension_terms(d) for d in dimensions or []))
+    ranked = sorted(range(len(items)), key=lambda i: (-evidence_priority(items[i], terms), i))
+    room = budget_tokens - OMISSION_RESERVE_TOKENS
+    kept: set[int] = set()
+    used = 0
+    for i in ranked:
+        if used + costs[i] <= room:
+            kept.add(i)
+            used += costs[i]
+
+    dropped = Counter(_class_of(items[i]) for i in range(len(items)) if i not in kept)
+    stats = PackingStats(
+        budget_tokens=budget_tokens,
+        tokens=used,
+        kept=len(kept),
+        dropped=len(items) - len(kept),
+        dropped_by_class=dict(dropped),
+    )
+    omitted = omission_line(stats)
+    stats.tokens += estimate_tokens(omitted, model)
+    return "".join(lines[i] for i in sorted(kept)) + omitted, stats
@@ -0,0 +1,189 @@
+"""
+Relevance-sliced evidence routing for the judicial layer.
+
+Indexes the run's evidence once by source, evidence class and content terms (a
+BM25 index), and returns for each rubric dimension only the slice relevant to its
+`target_artifact` and forensic vocabulary (instruction, success and failure
+patterns). Judges then see one criterion's evidence instead of every commit
+message, AST finding and document chunk collected by the detectives.
+"""
+
+import re
+from collections import Counter
+from typing import Any
+
+from src.judicial.evidence_index import BM25Index
+from src.state import EvidenceClass
+
+# Rubric `target_artifact` -> detective sources that produce that artifact's evidence
+ARTIFACT_SOURCES: dict[str, tuple[str, ...]] = {
+    "github_repo": ("repo",),
+    "pdf_report": ("docs",),
+    "pdf_images": ("vision",),
+}
+
+# Evidence classes implied by a dimension's vocabulary. ORCHESTRATION_PATTERN is
+# deliberately absent: it is the catch-all class for AST findings and is matched by terms.
+CLASS_KEYWORDS: dict[EvidenceClass, tuple[str, ...]] = {
+    EvidenceClass.GIT_FORENSIC: ("git", "commit", "commits", "history"),
+    EvidenceClass.STATE_MANAGEMENT: ("state", "reducer", "reducers", "typeddict"),
+    EvidenceClass.SECURITY_VIOLATION: ("security", "sandbox", "injection", "os.system", "subprocess", "unsafe"),
+    EvidenceClass.MODEL_DEFINITIONS: ("pydantic", "basemodel", "schema", "structured"),
+    EvidenceClass.DOCUMENT_CLAIM: ("report", "document", "claim", "claims", "diagram", "diagrams"),
+}
+
+# Terms that carry no forensic signal in rubric instructions
+STOPWORDS = frozenset(
+    {
+        "about", "actual", "against", "all", "also", "analyze", "and", "any", "are", "based", "been",
+        "being", "both", "capture", "check", "clear", "code", "confirm", "could", "count", "determine",
+        "does", "each", "ensure", "equivalent", "every", "exist", "exists", "extract", "file", "files",
+        "find", "flag", "for", "from", "full", "has", "have", "identify", "into", "least", "like", "look",
+        "more", "most", "must", "not", "number", "one", "only", "other", "present", "repo", "repository",
+        "scan", "should", "such", "than", "that", "the", "their", "them", "then", "there", "these", "they",
+        "this", "those", "total", "two", "use", "using", "verify", "what", "when", "where", "whether",
+        "which", "will", "with", "would", "you",
+    },
+)  # fmt: skip
+
+_TERM_PATTERN = re.compile(r"[a-z0-9_][a-z0-9_./-]*[a-z0-9_]")
+_WORD_PATTERN = re.compile(r"[a-z0-9_]+")
+
+# Cross-source items need this many shared terms to be pulled into a slice
+CROSS_SOURCE_MIN_HITS = 2
+
+# Terms carried by more than this share of the evidence (e.g. "src") do not discriminate
+COMMON_TERM_RATIO = 0.25
+COMMON_TERM_MIN_ITEMS = 20
+
+
+def _field(item: Any, name: str, default: Any = None) -> Any:
+    if isinstance(item, dict):
+        return item.get(name, default)
+    return getattr(item, name, default)
+
+
+def term_counts(text: str | None) -> Counter:
+    """Occurrences of each lower-cased identifier, dotted name and word part (min. 3 chars)."""
+    if not text:
+        return Counter()
+    lowered = text.lower()
+    # Every word, plus the dotted/path-like names the words were split from
+    compound = [t for t in _TERM_PATTERN.findall(lowered) if not _WORD_PATTERN.fullmatch(t)]
+    terms = _WORD_PATTERN.findall(lowered) + compound
+    return Counter(t for t in terms if len(t) >= 3 and t not in STOPWORDS)
+
+
+def extract_terms(text: str | None) -> set[str]:
+    """Lower-cased identifiers, dotted names and their word parts (min. 3 chars)."""
+    if not text:
+        return set()
+    lowered = text.lower()
+    terms = set(_TERM_PATTERN.findall(lowered)) | set(_WORD_PATTERN.findall(lowered))
+    return {t for t in terms if len(t) >= 3 and t not in STOPWORDS}
+
+
+# Rubric fields that describe what a dimension's evidence looks like
+DIMENSION_FIELDS = ("id", "name", "description", "forensic_instruction", "success_pattern", "failure_pattern")
+
+
+def dimension_terms(dimension: dict) -> set[str]:
+    """Forensic keywords for a rubric dimension."""
+    text = " ".join(str(dimension.get(key) or "") for key in DIMENSION_FIELDS).replace("_", " ")
+    return extract_terms(text)
+
+
+def dimension_classes(dimension: dict) -> set[EvidenceClass]:
+    """Evidence classes implied by a dimension's id and name (not its free-form instruction)."""
+    terms = extract_terms(f"{dimension.get('id') or ''} {dimension.get('name') or ''}".replace("_", " "))
+    return {cls for cls, keywords in CLASS_KEYWORDS.items() if terms.intersection(keywords)}
+
+
+class EvidenceRouter:
+    """Per-run index answering "which evidence is relevant to this dimension?"."""
+
+    def __init__(self, evidences: dict[str, list[Any]], top_k: int = 0):
+        self.evidences = evidences or {}
+        # Term-matched items per dimension are capped at the top_k BM25 scores (0: no cap)
+        self.top_k = top_k
+        # Flat index in original order: (bucket, item, source, class)
+        self._index: list[tuple[str, Any, str, Any]] = []
+        documents: list[Counter] = []
+        for bucket, items in self.evidences.items():
+            for item in items:
+                self._index.append((bucket, item, _field(item, "source", bucket), _field(item, "evidence_class")))
+                documents.append(term_counts(f"{_field(item, 'content') or ''} {_field(item, 'location') or ''}"))
+        self._bm25 = BM25Index(documents)
+
+        # Positions by source; always-relevant ones (detective failures/hallucinations and
+        # security findings) and positions by (source, class) for class-implied evidence
+        self._by_source: dict[str, list[int]] = {}
+        self._always: dict[str, set[int]] = {}
+        self._by_class: dict[tuple[str, Any], set[int]] = {}
+        for pos, (_bucket, item, source, ev_class) in enumerate(self._index):
+            self._by_source.setdefault(source, []).append(pos)
+            self._by_class.setdefault((source, ev_class), set()).add(pos)
+            if not _field(item, "found", True) or ev_class == EvidenceClass.SECURITY_VIOLATION:
+                self._always.setdefault(source, set()).add(pos)
+
+        self._common_terms: set[str] = set()
+        if len(self._index) >= COMMON_TERM_MIN_ITEMS:
+            frequency = Counter(term for doc in documents for term in doc)
+            cutoff = COMMON_TERM_RATIO * len(self._index)
+            self._common_terms = {term for term, count in frequency.items() if count > cutoff}
+
+    def _select(self, dimension: dict) -> set[int] | None:
+        """Index positions relevant to a dimension, or None when it carries no routing information."""
+        sources = ARTIFACT_SOURCES.get(dimension.get("target_artifact") or "")
+        if not sources:
+            return None
+
+        terms = dimension_terms(dimension) - self._common_terms
+        classes = dimension_classes(dimension)
+        results = self._bm25.search(terms)
+
+        primary = [pos for source in sources for pos in self._by_source.get(source, [])]
+        matched = [pos for pos in primary if pos in results]
+        if self.top_k:
+            matched = BM25Index.top_k(results, self.top_k, matched)
+        selected = set(matched)
+        for source in sources:
+            selected |= self._always.get(source, set())
+            for ev_class in classes:
+                selected |= self._by_class.get((source, ev_class), set())
+        # Other artifacts' items need several shared terms to be pulled into a slice
+        selected.update(
+            pos
+            for pos, (_score, hits) in results.items()
+            if hits >= CROSS_SOURCE_MIN_HITS and self._index[pos][2] not in sources
+        )
+
+        if not selected.intersection(primary):
+            # Nothing matched the vocabulary: fall back to the whole target artifact
+            selected.update(primary)
+        return selected
+
+    def route(self, dimension: dict) -> dict[str, list[Any]]:
+        """Returns the evidence slice for a single dimension, in original order."""
+        selected = self._select(dimension)
+        if selected is None:
+            # No routing information: the dimension sees everything, as before
+            return self.evidences
+        return self._group(selected)
+
+    def route_many(self, dimensions: list[dict]) -> dict[str, list[Any]]:
+        """Union of the slices for several dimensions (used by batch tasks)."""
+        selected: set[int] = set()
+        for dim in dimensions:
+            positions = self._select(dim)
+            if positions is None:
+                return self.evidences
+            selected |= positions
+        return self._group(selected)
+
+    def _group(self, selected: set[int]) -> dict[str, list[Any]]:
+        grouped: dict[str, list[Any]] = {}
+        for pos in sorted(selected):
+            bucket, item, *_rest = self._index[pos]
+            grouped.setdefault(bucket, []).append(item)
+        return grouped
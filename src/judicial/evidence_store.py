@@ -0,0 +1,179 @@
+"""
+Per-run evidence store for the judicial fan-out.
+
+`execute_judicial_layer` publishes the run's evidence here once and each `Send`
+payload carries only the run id and an evidence reference (slice key). The slice is
+resolved inside the judge node, so LangGraph never copies or serializes the evidence
+dict per task and dispatch cost stays flat as the rubric grows.
+
+The rendered prompt block of each slice is memoized per (evidence digest, slice key,
+render variant, e.g. the model's evidence budget): the first task renders it, every
+later task (other judges, redundancy replicas and re-evaluation passes over unchanged
+evidence) reuses the cached text. Rendering happens outside the store lock, so tasks
+rendering other slices never wait on it. Blocks that had to omit evidence to fit their
+budget are recorded for the report.
+
+Slice keys:
+- `all`: every evidence item (routing disabled)
+- `dim:<criterion_id>`: the routed slice for one rubric dimension
+- `dims:<id>,<id>,...`: the union of several dimensions' slices (batch tasks)
+"""
+
+import hashlib
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from src.config import judicial_settings
+from src.judicial.evidence_router import EvidenceRouter
+
+ALL_EVIDENCE = "all"
+
+
+def dimension_ref(criterion_id: str) -> str:
+    return f"dim:{criterion_id}"
+
+
+def dimensions_ref(criterion_ids: list[str]) -> str:
+    return "dims:" + ",".join(criterion_ids)
+
+
+def _field(item: Any, name: str) -> Any:
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def evidence_digest(evidences: dict[str, list[Any]]) -> str:
+    """Content digest of an evidence dict (ids, classes, confidence, content; in order)."""
+    h = hashlib.sha256()
+    for bucket, items in (evidences or {}).items():
+        h.update(f"\x1e{bucket}".encode())
+        for item in items:
+            ev_class = _field(item, "evidence_class")
+            fields = (
+                _field(item, "evidence_id"),
+                getattr(ev_class, "value", ev_class),
+                _field(item, "found"),
+                _field(item, "confidence"),
+                _field(item, "location"),
+                _field(item, "content"),
+            )
+            h.update("\x1f".join(str(f) for f in fields).encode())
+            h.update(b"\x1d")
+    return h.hexdigest()
+
+
+class EvidenceStore:
+    """Evidence, routed slices and rendered prompt blocks for a single audit run."""
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self._evidences: dict[str, list[Any]] = {}
+        self._dimensions: dict[str, dict] = {}
+        self._router: EvidenceRouter | None = None
+        self._slices: dict[str, dict[str, list[Any]]] = {}
+        self._rendered: dict[tuple[str, str, str], str] = {}
+        self._rendering: dict[tuple[str, str, str], threading.Lock] = {}
+        self._omissions: dict[str, dict] = {}
+        self._lock = threading.RLock()
+        self.aliases: dict[str, str] = {}
+        self.digest = ""
+        self.published = False
+
+    def publish(
+        self, evidences: dict[str, list[Any]], dimensions: list[dict], aliases: dict[str, str] | None = None
+    ) -> None:
+        """
+        Makes the current evidence (and the compaction id mapping) available to judicial tasks.
+        Re-publishing changed evidence (re-evaluation loop) drops the cached slices and the
+        blocks rendered from the previous digest; changed dimensions alone keep the blocks.
+        """
+        digest = evidence_digest(evidences)
+        dims = {d["id"]: d for d in dimensions if d.get("id")}
+        with self._lock:
+            self.aliases = dict(aliases or {})
+            if self.published and digest == self.digest and dims == self._dimensions:
+                return
+            self._evidences = evidences or {}
+            self._dimensions = dims
+            self._router = None
+            self._slices.clear()
+            if digest != self.digest:
+                self._rendered.clear()
+            self.digest = digest
+            self.published = True
+
+    @property
+    def evidences(self) -> dict[str, list[Any]]:
+        return self._evidences
+
+    def resolve(self, ref: str) -> dict[str, list[Any]] | None:
+        """Returns the evidence for a slice key, or None if the key cannot be resolved."""
+        with self._lock:
+            if not self.published:
+                return None
+            if ref == ALL_EVIDENCE:
+                return self._evidences
+            if ref in self._slices:
+                return self._slices[ref]
+
+            kind, _, payload = ref.partition(":")
+            ids = payload.split(",") if kind == "dims" else [payload] if kind == "dim" else []
+            if not ids or any(i not in self._dimensions for i in ids):
+                return None
+
+            if self._router is None:
+                self._router = EvidenceRouter(self._evidences, top_k=judicial_settings.evidence_retrieval_top_k)
+            dims = [self._dimensions[i] for i in ids]
+            sliced = self._router.route(dims[0]) if len(dims) == 1 else self._router.route_many(dims)
+            self._slices[ref] = sliced
+            return sliced
+
+    def render(self, ref: str, renderer: Callable[[dict[str, list[Any]]], str], variant: str = "") -> str | None:
+        """Rendered prompt block for a slice, computed once per (digest, ref, variant); None if unresolvable."""
+        with self._lock:
+            key = (self.digest, ref, variant)
+            if key in self._rendered:
+                return self._rendered[key]
+            # Concurrent renders of the same block wait for the first one; other blocks proceed
+            key_lock = self._rendering.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._rendered:
+                    return self._rendered[key]
+            sliced = self.resolve(ref)
+            if sliced is None:
+                return None
+            text = renderer(sliced)
+            with self._lock:
+                if key[0] == self.digest:
+                    self._rendered[key] = text
+                self._rendering.pop(key, None)
+            return text
+
+    def record_omission(self, key: str, stats: dict) -> None:
+        """Records the evidence a rendered block left out (packing statistics)."""
+        with self._lock:
+            self._omissions[key] = stats
+
+    def omissions(self) -> dict[str, dict]:
+        """Packing statistics of every block that omitted evidence, by "<slice key>@<model>"."""
+        with self._lock:
+            return dict(sorted(self._omissions.items()))
+
+
+_registry: dict[str, EvidenceStore] = {}
+_registry_lock = threading.Lock()
+
+
+def get_evidence_store(run_id: str = "unknown") -> EvidenceStore:
+    """Returns the evidence store owned by the given run."""
+    with _registry_lock:
+        if run_id not in _registry:
+            _registry[run_id] = EvidenceStore(run_id)
+        return _registry[run_id]
+
+
+def release_evidence_store(run_id: str) -> None:
+    """Forgets the evidence held for a finished run."""
+    with _registry_lock:
+        _registry.pop(run_id, None)
@@ -0,0 +1,145 @@
+"""
+Provider-side prompt prefix caching for the judicial layer.
+
+Judge prompts start with the (large) evidence block, so every judge and redundancy
+replica evaluating the same slice shares an identical prefix:
+
+- Gemini: the prefix is stored once per (model, prefix) as an explicit cached content
+  entry and requests reference it by name instead of resending it.
+- Ollama: requests keep the model loaded (keep_alive) with a context window large
+  enough for the prefix, so the server reuses the already-evaluated KV prefix.
+
+Usage is recorded per run in RunMetrics under `prompt_cache.*`. Gemini reports reused
+tokens (`cache_read`); Ollama does not, so its savings are estimated from the prefix
+length whenever a prefix is sent again to a model kept warm in the same run.
+"""
+
+import asyncio
+import hashlib
+import threading
+from typing import Any
+
+from src.config import judicial_settings
+from src.utils.logger import StructuredLogger
+from src.utils.run_metrics import get_run_metrics
+from src.utils.tokens import estimate_tokens, usage_input_tokens
+
+logger = StructuredLogger("prompt_cache")
+
+
+def prefix_digest(prefix: str) -> str:
+    return hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:16]
+
+
+class PromptCache:
+    """Cached prefixes and cache accounting for a single audit run."""
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self._client = None
+        self._gemini_caches: dict[tuple[str, str], str | None] = {}
+        self._gemini_locks: dict[tuple[str, str], asyncio.Lock] = {}
+        self._warm_prefixes: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def _genai_client(self):
+        if self._client is None:
+            from google import genai
+
+            self._client = genai.Client(api_key=judicial_settings.api_key)
+        return self._client
+
+    async def gemini_cached_content(self, model: str, prefix: str) -> str | None:
+        """
+        Name of the cached content holding `prefix` as system instruction, created on first use.
+        Returns None when caching is disabled, the prefix is too short or creation failed.
+        """
+        if not judicial_settings.prompt_cache_enabled:
+            return None
+        if estimate_tokens(prefix) < judicial_settings.prompt_cache_min_tokens:
+            return None
+
+        key = (model, prefix_digest(prefix))
+        with self._lock:
+            lock = self._gemini_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if key in self._gemini_caches:
+                return self._gemini_caches[key]
+
+            from google.genai import types
+
+            name = None
+            try:
+                cache = await self._genai_client().aio.caches.create(
+                    model=model,
+                    config=types.CreateCachedContentConfig(
+                        display_name=f"courtroom-{self.run_id[:24]}-{key[1]}",
+                        system_instruction=prefix,
+                        ttl=f"{judicial_settings.prompt_cache_ttl}s",
+                    ),
+                )
+                name = cache.name
+                get_run_metrics(self.run_id).incr("prompt_cache.entries_created")
+            except Exception as e:
+                # Unsupported model / prefix below the provider minimum: send the prompt inline
+                logger.warning(f"Gemini context cache creation failed for {model}: {e}")
+            self._gemini_caches[key] = name
+            return name
+
+    def ollama_options(self) -> dict[str, Any]:
+        """ChatOllama kwargs that keep the model (and its prompt KV cache) warm between judges."""
+        if not judicial_settings.prompt_cache_enabled:
+            return {}
+        options: dict[str, Any] = {"keep_alive": judicial_settings.ollama_keep_alive}
+        if judicial_settings.ollama_num_ctx:
+            options["num_ctx"] = judicial_settings.ollama_num_ctx
+        return options
+
+    def record_usage(self, provider: str, model: str, prefix: str, usage: dict[str, Any]) -> None:
+        """Accounts one LLM call; `usage` is UsageMetadataCallbackHandler.usage_metadata."""
+        input_tokens = usage_input_tokens(usage)
+        cache_read = sum((u.get("input_token_details") or {}).get("cache_read", 0) or 0 for u in usage.values())
+
+        if provider == "ollama" and judicial_settings.prompt_cache_enabled:
+            key = (model, prefix_digest(prefix))
+            with self._lock:
+                warm = key in self._warm_prefixes
+                self._warm_prefixes.add(key)
+            cache_read = estimate_tokens(prefix) if warm else 0
+
+        metrics = get_run_metrics(self.run_id)
+        metrics.incr("prompt_cache.requests")
+        metrics.incr("prompt_cache.input_tokens", input_tokens)
+        if cache_read:
+            metrics.incr("prompt_cache.hits")
+            metrics.incr("prompt_cache.saved_input_tokens", cache_read)
+
+    def close(self) -> None:
+        """Deletes the Gemini cache entries created for this run (best effort; they also expire by TTL)."""
+        names = [n for n in self._gemini_caches.values() if n]
+        self._gemini_caches.clear()
+        for name in names:
+            try:
+                self._genai_client().caches.delete(name=name)
+            except Exception as e:
+                logger.warning(f"Could not delete Gemini context cache {name}: {e}")
+
+
+_registry: dict[str, PromptCache] = {}
+_registry_lock = threading.Lock()
+
+
+def get_prompt_cache(run_id: str = "unknown") -> PromptCache:
+    """Returns the prompt cache owned by the given run."""
+    with _registry_lock:
+        if run_id not in _registry:
+            _registry[run_id] = PromptCache(run_id)
+        return _registry[run_id]
+
+
+def release_prompt_cache(run_id: str) -> None:
+    """Drops the run's cached prefixes."""
+    with _registry_lock:
+        cache = _registry.pop(run_id, None)
+    if cache is not None:
+        cache.close()
@@ -15,6 +15,7 @@ load_dotenv()
 
 from src.config import hardened_config
 from src.graph import courtroom_swarm
+from src.nodes.report_generator import release_run_state
 from src.utils.logger import StructuredLogger
 from src.utils.observability import DashboardManager
 
@@ -40,6 +41,22 @@ async def amain():
         action="store_true",
         help="Enable real-time TUI dashboard",
     )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        dest="cache_mode",
+        action="store_const",
+        const="bypass",
+        default="use",
+        help="Bypass the judicial response cache for this run",
+    )
+    cache_group.add_argument(
+        "--refresh-cache",
+        dest="cache_mode",
+        action="store_const",
+        const="refresh",
+        help="Ignore cached judicial responses and store fresh ones",
+    )
 
     args = parser.parse_args()
 
@@ -85,6 +102,7 @@ async def amain():
         "metadata": {
             "correlation_id": correlation_id,
             "run_status": "STARTED",
+            "response_cache_mode": validated_request.cache_mode,
         },
         "re_eval_count": 0,
         "re_eval_needed": False,
@@ -124,6 +142,9 @@ async def amain():
         if dashboard:
             dashboard.stop()
         sys.exit(3)
+    finally:
+        # Normally done by the report generator; also covers runs that abort before it
+        release_run_state(correlation_id)
 
 
 def main():
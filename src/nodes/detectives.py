@@ -6,6 +6,7 @@ from typing import Any
 
 from src.config import detective_settings
 from src.state import AgentState, Evidence, EvidenceClass
+from src.tools.pdf_artifacts import PDFArtifacts, get_pdf_artifacts
 from src.tools.repo_tools import (
     analyze_ast_for_patterns,
     check_tool_safety,
@@ -150,6 +151,12 @@ def repo_investigator(state: AgentState) -> dict[str, Any]:
     return {"evidences": {"repo": evidences}, "errors": errors}
 
 
+def _shared_pdf(state: AgentState, pdf_path: str) -> PDFArtifacts | None:
+    """The run's shared PDF handle; without a correlation id each tool opens (and closes) its own."""
+    run_id = state.get("metadata", {}).get("correlation_id")
+    return get_pdf_artifacts(pdf_path, run_id) if run_id else None
+
+
 @node_traceable
 def doc_analyst(state: AgentState) -> dict[str, Any]:
     """DocAnalyst node conforming to Layer 1 specifications."""
@@ -177,9 +184,11 @@ def doc_analyst(state: AgentState) -> dict[str, Any]:
 
     try:
         # doc_tools might need sandbox update if they run shell commands (like docling or pandoc)
+        # Shared with VisionInspector: the PDF is read and parsed once per run
         markdown_text = extract_pdf_markdown(
             pdf_path,
             timeout=detective_settings.operation_timeout_seconds,
+            artifacts=_shared_pdf(state, pdf_path),
         )
         claims = find_architectural_claims(markdown_text)
         _paths = extract_file_paths(markdown_text)
@@ -254,6 +263,8 @@ def vision_inspector(state: AgentState) -> dict[str, Any]:
         classifications = run_vision_classification(
             pdf_path,
             timeout=detective_settings.operation_timeout_seconds,
+            artifacts=_shared_pdf(state, pdf_path),
+            run_id=state.get("metadata", {}).get("correlation_id"),
         )
         for c in classifications:
             evidences.append(
@@ -0,0 +1,131 @@
+"""
+Evidence Compaction Node (Layer 1.75).
+
+`repo_investigator` emits one Evidence per AST finding and per commit, so a large
+repository floods the state and every judicial prompt with hundreds of
+near-identical AST items (`FunctionDef foo`, `FunctionDef bar`, ...). Between the
+aggregator and the judges, repetitive found evidence is clustered by source,
+class, file and pattern (the finding's leading token, digits normalized) into one
+summary Evidence carrying the member count and a few representative samples.
+
+Compaction is lossless for citations: every member id maps to its cluster id
+(`evidence_aliases` in the state), and synthesis resolves a cited member through
+that mapping. Security findings and failed lookups (found=False) are never
+clustered, so the security override and fact-supremacy checks see them as before;
+nor are commits (GIT_FORENSIC), whose messages and order are the history itself.
+"""
+
+import hashlib
+import re
+from typing import Any
+
+from src.config import judicial_settings
+from src.state import REPLACE_EVIDENCES, AgentState, Evidence, EvidenceClass
+from src.utils.logger import StructuredLogger
+from src.utils.observability import node_traceable
+
+logger = StructuredLogger("evidence_compactor")
+
+CLUSTER_MARKER = "_cluster_"
+_DIGITS = re.compile(r"\d+")
+# Security findings feed the security override; commits are the history judges read
+_VERBATIM_CLASSES = frozenset({EvidenceClass.SECURITY_VIOLATION, EvidenceClass.GIT_FORENSIC})
+
+
+def cluster_key(e: Evidence) -> tuple[str, str, str, str] | None:
+    """(source, class, file, pattern) of a compactable item, None if it must stay verbatim."""
+    if not e.found or e.evidence_class in _VERBATIM_CLASSES or CLUSTER_MARKER in e.evidence_id:
+        return None
+    file = e.location.split(":")[0]
+    words = (e.content or "").split()
+    pattern = _DIGITS.sub("#", words[0]) if words else ""
+    return e.source, e.evidence_class.value, file, pattern
+
+
+def _summary(members: list[Evidence], file: str, pattern: str, samples: int) -> Evidence:
+    digest = hashlib.sha256("\x1f".join(e.evidence_id for e in members).encode()).hexdigest()[:12]
+    first = members[0]
+    shown = "; ".join(f"{e.evidence_id}: {e.content} @ {e.location}" for e in members[:samples])
+    more = len(members) - min(samples, len(members))
+    return Evidence(
+        evidence_id=f"{first.source}_{first.evidence_class.value}{CLUSTER_MARKER}{digest}",
+        source=first.source,
+        evidence_class=first.evidence_class,
+        goal=first.goal,
+        found=True,
+        content=f"{len(members)} x '{pattern}' findings in {file}. Samples: {shown}"
+        + (f" (+{more} more)" if more else ""),
+        location=file,
+        rationale=f"Compacted from {len(members)} similar findings; citing any member resolves to this cluster.",
+        confidence=min(e.confidence for e in members),
+        timestamp=max(e.timestamp for e in members),
+    )
+
+
+def compact_evidences(
+    evidences: dict[str, list[Evidence]], min_cluster: int, samples: int
+) -> tuple[dict[str, list[Evidence]], dict[str, str]]:
+    """
+    Returns the compacted evidence (each cluster in place of its first member, other
+    items untouched and in order) and the member id -> cluster id mapping.
+    """
+    compacted: dict[str, list[Evidence]] = {}
+    aliases: dict[str, str] = {}
+    for bucket, items in evidences.items():
+        groups: dict[tuple, list[Evidence]] = {}
+        for e in items:
+            key = cluster_key(e)
+            if key is not None:
+                groups.setdefault(key, []).append(e)
+        cluster_of: dict[str, Evidence] = {}
+        for (_source, _class, file, pattern), members in groups.items():
+            if len(members) >= min_cluster:
+                summary = _summary(members, file, pattern, samples)
+                cluster_of.update((e.evidence_id, summary) for e in members)
+
+        out: list[Evidence] = []
+        emitted: set[str] = set()
+        for e in items:
+            summary = cluster_of.get(e.evidence_id)
+            if summary is None:
+                out.append(e)
+                continue
+            if summary.evidence_id not in emitted:
+                emitted.add(summary.evidence_id)
+                out.append(summary)
+            aliases[e.evidence_id] = summary.evidence_id
+        compacted[bucket] = out
+    return compacted, aliases
+
+
+@node_traceable
+def compactor_node(state: AgentState) -> dict[str, Any]:
+    """Clusters repetitive evidence and replaces the run's evidence with the compacted set."""
+    correlation_id = state.get("metadata", {}).get("correlation_id", "unknown")
+    logger.log_node_entry("compactor_node", correlation_id=correlation_id)
+
+    evidences = state.get("evidences", {})
+    if not judicial_settings.evidence_compaction_enabled or not isinstance(evidences, dict):
+        return {}
+
+    compacted, aliases = compact_evidences(
+        evidences,
+        judicial_settings.compaction_min_cluster,
+        judicial_settings.compaction_samples,
+    )
+    if not aliases:
+        return {}
+
+    before = sum(len(v) for v in evidences.values())
+    after = sum(len(v) for v in compacted.values())
+    logger.info(
+        "Evidence compaction complete",
+        correlation_id=correlation_id,
+        items_before=before,
+        items_after=after,
+        clustered=len(aliases),
+    )
+    return {
+        "evidences": {REPLACE_EVIDENCES: True, **compacted},
+        "evidence_aliases": aliases,
+    }
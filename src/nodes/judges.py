@@ -1,19 +1,47 @@
+import asyncio
 import datetime
+import functools
 import re
-from typing import Any, TypedDict
+import time
+from collections import Counter
+from collections.abc import Callable
+from typing import Any, NotRequired, TypedDict
 
+from langchain_core.callbacks import UsageMetadataCallbackHandler
 from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.types import Send
 from pydantic import BaseModel, ValidationError
 
 from src.config import judicial_settings
-from src.nodes.judicial_nodes import bounded_llm_call, get_concurrency_controller
-from src.state import AgentState, JudicialOpinion, JudicialOutcome
+from src.exceptions import EvidenceUnavailableError
+from src.judicial.batch_packer import get_batch_sizer, pack_criteria, prompt_budget
+from src.judicial.criterion_tracker import get_criterion_tracker
+from src.judicial.evidence_packer import PackingStats, evidence_budget, pack_evidence
+from src.judicial.evidence_store import ALL_EVIDENCE, dimension_ref, dimensions_ref, get_evidence_store
+from src.judicial.prompt_cache import get_prompt_cache
+from src.nodes.judicial_nodes import bounded_llm_call, coalesced_llm_call, get_concurrency_controller
+from src.nodes.justice import (
+    escalation_reasons,
+    is_failed_opinion,
+    needs_re_evaluation,
+    synthesize_criterion,
+    uncertain_judges,
+)
+from src.state import AgentState, CriterionResult, JudicialOpinion, JudicialOutcome
+from src.utils.llm_clients import get_chat_model, get_structured_model
+from src.utils.llm_streaming import astream_structured
 from src.utils.logger import StructuredLogger
 from src.utils.observability import node_traceable
+from src.utils.response_cache import cache_lookup, cache_store, get_response_cache, request_digest
+from src.utils.run_metrics import get_run_metrics
+from src.utils.tokens import estimate_tokens, usage_input_tokens
 
 logger = StructuredLogger("judges")
 
+JUDGES = ["Prosecutor", "Defense", "TechLead"]
+# Estimated tokens of a batch prompt's fixed output-format instructions (micro-batch packing)
+BATCH_INSTRUCTION_TOKENS = 250
+
 
 class JudicialTask(TypedDict):
     """
@@ -24,8 +52,24 @@ class JudicialTask(TypedDict):
     judge_name: str
     criterion_id: str
     criterion_description: str
-    evidences: dict[str, Any]  # dict[str, list[Evidence]]
     correlation_id: str
+    # Evidence is passed by reference: resolved from the run's EvidenceStore
+    run_id: NotRequired[str]
+    evidence_ref: NotRequired[str]
+    # Response cache mode of the run: use | refresh | bypass
+    cache_mode: NotRequired[str]
+    # Inline evidence (legacy callers); takes precedence over the reference
+    evidences: NotRequired[dict[str, Any]]  # dict[str, list[Evidence]]
+    # Targeted re-evaluation: cycle number and the panel disagreement to reconsider
+    re_eval_cycle: NotRequired[int]
+    re_evaluation: NotRequired[str]
+    # Issued for a failed or incomplete batch call (scheduled ahead of first-pass work)
+    fallback: NotRequired[bool]
+    # Adaptive redundancy: replica number of an extra instance of the judge
+    replica: NotRequired[int]
+    # Model cascade: first pass on the small model, escalation on the judge's own model
+    model_override: NotRequired[str]
+    escalation: NotRequired[bool]
 
 
 class JudicialBatchTask(TypedDict):
@@ -36,8 +80,28 @@ class JudicialBatchTask(TypedDict):
 
     judge_name: str
     dimensions: list[dict]
-    evidences: dict[str, Any]
     correlation_id: str
+    run_id: NotRequired[str]
+    evidence_ref: NotRequired[str]
+    cache_mode: NotRequired[str]
+    evidences: NotRequired[dict[str, Any]]
+
+
+class JudicialPanelTask(TypedDict):
+    """
+    Task definition for ALL judges evaluating a single criterion in one call.
+    Used for criterion-axis batching (batching_axis="criterion").
+    """
+
+    judges: list[str]
+    criterion_id: str
+    criterion_description: str
+    correlation_id: str
+    run_id: NotRequired[str]
+    evidence_ref: NotRequired[str]
+    cache_mode: NotRequired[str]
+    evidences: NotRequired[dict[str, Any]]
+    model_override: NotRequired[str]
 
 
 PROSECUTOR_PHILOSOPHY = (
@@ -77,33 +141,252 @@ def get_philosophy(judge_name: str) -> str:
     return TECHLEAD_PHILOSOPHY  # Fallback
 
 
-def get_google_llm(model_name: str):
-    # Dynamic LLM fetching logic
-    from langchain_google_genai import ChatGoogleGenerativeAI
+def _judge_model(judge: str) -> str:
+    """The judge's configured model (the Tech Lead's for unknown judges)."""
+    return getattr(judicial_settings, f"{judge.lower()}_model", judicial_settings.techlead_model)
 
-    api_key = judicial_settings.api_key
-    return ChatGoogleGenerativeAI(
-        model=model_name,
-        temperature=judicial_settings.llm_temperature,
-        google_api_key=api_key,
+
+def _run_id(task: JudicialTask | JudicialBatchTask | JudicialPanelTask) -> str:
+    """Run the task belongs to: its run id, else its correlation id."""
+    return task.get("run_id", task.get("correlation_id", "unknown"))
+
+
+class BatchOutcomeResponse(BaseModel):
+    """Structured output of a batched (all criteria, or all judges) judicial call."""
+
+    opinions: list[JudicialOutcome]
+
+
+def get_google_llm(model_name: str, **kwargs):
+    # Pooled client: shared across judges, criteria and retries
+    return get_chat_model("google", model_name, judicial_settings.llm_temperature, **kwargs)
+
+
+def get_ollama_llm(model_name: str, **kwargs):
+    return get_chat_model(
+        "ollama",
+        model_name,
+        judicial_settings.llm_temperature,
+        base_url=judicial_settings.ollama_base_url,
+        **kwargs,
+    )
+
+
+def _evidence_prefix(evidence_text: str) -> str:
+    """
+    Shared prompt prefix: identical for every judge evaluating the same evidence slice,
+    so providers can reuse it (Gemini context cache, Ollama KV prefix).
+    """
+    return f"""You are a judge in a digital courtroom.
+Review the following synchronized evidence collected by the detectives:
+{evidence_text}
+"""
+
+
+async def _prompt_messages(
+    run_id: str,
+    model_name: str,
+    prefix: str,
+    instructions: str,
+    request: str,
+) -> tuple[dict[str, Any], list]:
+    """
+    Assembles [evidence prefix | judge instructions | request] for the configured provider.
+    Returns the LLM kwargs (Ollama keep-alive options, or the per-call Gemini cache name)
+    and the message list.
+    """
+    cache = get_prompt_cache(run_id)
+    if judicial_settings.judicial_provider == "google":
+        cached_content = await cache.gemini_cached_content(model_name, prefix)
+        if cached_content:
+            # The prefix lives server-side as the cached system instruction
+            return {"cached_content": cached_content}, [HumanMessage(content=f"{instructions}\n{request}")]
+        llm_kwargs: dict[str, Any] = {}
+    else:
+        llm_kwargs = cache.ollama_options()
+
+    return llm_kwargs, [
+        SystemMessage(content=f"{prefix}\n{instructions}"),
+        HumanMessage(content=request),
+    ]
+
+
+def _get_judicial_llm(model_name: str, schema: type, **kwargs):
+    """Pooled structured-output runnable for the configured judicial provider."""
+    provider = judicial_settings.judicial_provider
+    if provider == "ollama":
+        kwargs["base_url"] = judicial_settings.ollama_base_url
+    # Context cache names differ per run and prefix: passed per call, not pooled
+    call_options = {"cached_content": kwargs.pop("cached_content")} if "cached_content" in kwargs else None
+    return get_structured_model(
+        provider, model_name, judicial_settings.llm_temperature, schema, call_options=call_options, **kwargs
     )
 
 
-def get_ollama_llm(model_name: str):
-    from langchain_ollama import ChatOllama
+def _evidence_text(task: JudicialTask | JudicialBatchTask | JudicialPanelTask, model_name: str | None = None) -> str:
+    """
+    Rendered evidence block for the task's prompt, packed into `model_name`'s evidence budget.
+    By-reference tasks reuse the block memoized in the run's EvidenceStore; a reference the
+    store cannot resolve (unpublished run, unknown slice) raises EvidenceUnavailableError.
+    """
+    renderer, variant = _evidence_renderer(task, model_name)
+    if "evidences" in task:
+        return renderer(task["evidences"])
+
+    run_id = _run_id(task)
+    ref = task.get("evidence_ref", ALL_EVIDENCE)
+    text = get_evidence_store(run_id).render(ref, renderer, variant)
+    if text is None:
+        # Judging without evidence would score the criterion NO_EVIDENCE and publish that verdict
+        raise EvidenceUnavailableError(f"Unresolved evidence reference '{ref}' for run {run_id}")
+    return text
+
+
+def _evidence_renderer(
+    task: JudicialTask | JudicialBatchTask | JudicialPanelTask, model_name: str | None
+) -> tuple[Callable[[dict], str], str]:
+    """
+    Evidence renderer of a task and its memoization variant. With a budget, the block is
+    packed for the task's criteria (relevance ranking) and the model's evidence budget.
+    """
+    if model_name is None or not judicial_settings.evidence_budget_enabled:
+        return _format_evidence, ""
 
-    return ChatOllama(
+    budget = evidence_budget(judicial_settings.judicial_provider, model_name)
+    if "dimensions" in task:
+        dims = task["dimensions"]
+    else:
+        dims = [{"id": task["criterion_id"], "description": task.get("criterion_description", "")}]
+    run_id = _run_id(task)
+    ref = "inline" if "evidences" in task else task.get("evidence_ref", ALL_EVIDENCE)
+    render = functools.partial(
+        _format_evidence,
+        budget=budget,
+        dimensions=dims,
         model=model_name,
-        temperature=judicial_settings.llm_temperature,
-        base_url=judicial_settings.ollama_base_url,
+        on_omission=functools.partial(_record_omission, run_id, f"{ref}@{model_name}", keep="evidences" not in task),
+    )
+    return render, f"{model_name}:{budget}:{','.join(d['id'] for d in dims)}"
+
+
+def _record_omission(run_id: str, key: str, stats: PackingStats, *, keep: bool) -> None:
+    """Counts evidence left out of a prompt; by-reference blocks are also kept for the report."""
+    metrics = get_run_metrics(run_id)
+    metrics.incr("evidence_budget.packed_prompts")
+    metrics.incr("evidence_budget.dropped_items", stats.dropped)
+    if keep:
+        get_evidence_store(run_id).record_omission(key, stats.model_dump())
+    logger.warning(
+        f"Evidence for {key} exceeds the {stats.budget_tokens}-token budget; "
+        f"omitted {stats.dropped} of {stats.kept + stats.dropped} items.",
+        correlation_id=run_id,
     )
 
 
-async def _invoke_llm_with_validation(llm, messages, retries=0, schema=JudicialOutcome):
-    """Internal helper to invoke LLM with schema retry (separate from 429 retries)."""
-    structured_llm = llm.with_structured_output(schema)
+def _dimension_task(judge: str, dim: dict, parent: JudicialBatchTask) -> JudicialTask:
+    """Single-dimension task derived from a batch task (granular retries and fallback)."""
+    task = JudicialTask(
+        judge_name=judge,
+        criterion_id=dim["id"],
+        criterion_description=dim.get("description", ""),
+        correlation_id=parent.get("correlation_id", "unknown"),
+        fallback=True,
+    )
+    if "cache_mode" in parent:
+        task["cache_mode"] = parent["cache_mode"]
+    if "evidences" in parent:
+        task["evidences"] = parent["evidences"]
+    else:
+        task["run_id"] = _run_id(parent)
+        task["evidence_ref"] = dimension_ref(dim["id"]) if parent.get("evidence_ref") != ALL_EVIDENCE else ALL_EVIDENCE
+    return task
+
+
+def _request_key(model_name: str, schema: type, prefix: str, instructions: str, request: str) -> str:
+    """
+    Digest of the logical request (provider, model, temperature, schema, prompt); keys both
+    the single-flight layer and the persistent response cache.
+    """
+    return request_digest(
+        judicial_settings.judicial_provider,
+        model_name,
+        judicial_settings.llm_temperature,
+        schema,
+        [SystemMessage(content=f"{prefix}\n{instructions}"), HumanMessage(content=request)],
+    )
+
+
+def _is_replica(task: JudicialTask | JudicialBatchTask | JudicialPanelTask) -> bool:
+    """Extra instance of a judge task (adaptive or launched redundancy replica), not its first one."""
+    if task.get("replica"):
+        return True
+    index = task.get("correlation_id", "").removeprefix(f"{_run_id(task)}_r")
+    return index.isdigit() and int(index) > 0
+
+
+def _response_cache_key(task: JudicialTask | JudicialBatchTask | JudicialPanelTask, request_key: str) -> str | None:
+    """
+    `request_key`, or None when the response cache is disabled or bypassed for this run.
+    Sampled (temperature > 0) requests and replicas are never cached: a replica served the
+    first instance's answer would make every quorum and outlier check agree trivially.
+    """
+    if get_response_cache() is None or task.get("cache_mode", "use") == "bypass":
+        return None
+    if judicial_settings.llm_temperature != 0 or _is_replica(task):
+        return None
+    return request_key
+
+
+class BatchSettingsWrapper:
+    """Settings of a batch or panel call: the longer batch timeout replaces the per-call one."""
+
+    def __init__(self, original):
+        for k, v in original.__dict__.items():
+            setattr(self, k, v)
+        # Override timeout if batch specific timeout exists
+        self.llm_call_timeout = getattr(
+            original,
+            "batch_llm_call_timeout",
+            300.0,
+        )
+
+
+def _quota_kwargs(model_name: str, spent: list[int], *prompt: str) -> dict[str, Any]:
+    """bounded_llm_call arguments charging the call to its (provider, model) window and rate limits."""
+    return {
+        "provider": judicial_settings.judicial_provider,
+        "model": model_name,
+        "estimated_tokens": sum(estimate_tokens(part, model_name) for part in prompt),
+        "token_usage": lambda: sum(spent),
+    }
+
+
+def _scheduling_kwargs(task: JudicialTask | JudicialBatchTask, run_id: str) -> dict[str, Any]:
+    """bounded_llm_call arguments ranking the call while it waits for a concurrency slot."""
+    if task.get("re_eval_cycle"):
+        priority_class = "re_evaluation"
+    elif task.get("fallback"):
+        priority_class = "fallback"
+    else:
+        priority_class = "first_pass"
+    progress = None
+    if "criterion_id" in task and judicial_settings.streaming_synthesis_enabled:
+        progress = functools.partial(get_criterion_tracker(run_id).progress, task["criterion_id"])
+    return {"priority_class": priority_class, "progress": progress, "run_id": run_id}
+
+
+async def _invoke_llm_with_validation(
+    structured_llm, messages, retries=0, callbacks=None, *, schema=JudicialOutcome, run_id=None
+):
+    """Internal helper to invoke a structured-output LLM with schema retry (separate from 429 retries)."""
     try:
-        return await structured_llm.ainvoke(messages)
+        return await astream_structured(
+            structured_llm,
+            schema,
+            messages,
+            config={"callbacks": callbacks} if callbacks else None,
+            run_id=run_id,
+        )
     except ValidationError as e:
         if retries < 2:
             schema_reminder = HumanMessage(
@@ -111,10 +394,12 @@ async def _invoke_llm_with_validation(llm, messages, retries=0, schema=JudicialO
             )
             messages.append(schema_reminder)
             return await _invoke_llm_with_validation(
-                llm,
+                structured_llm,
                 messages,
                 retries=retries + 1,
+                callbacks=callbacks,
                 schema=schema,
+                run_id=run_id,
             )
         raise e
     except Exception as e:
@@ -125,40 +410,24 @@ async def _invoke_llm_with_validation(llm, messages, retries=0, schema=JudicialO
         raise e
 
 
-@node_traceable
-async def evaluate_criterion(task: JudicialTask) -> dict[str, list[JudicialOpinion]]:
+def _judge_prompt(task: JudicialTask, model_name: str) -> tuple[str, str, str]:
+    """
+    Prompt of a single judge on a single criterion, laid out as
+    [shared evidence prefix][judge persona + criterion][request].
+    """
+    return _evidence_prefix(_evidence_text(task, model_name)), *_judge_instructions(task)
+
+
+def _judge_instructions(task: JudicialTask) -> tuple[str, str]:
+    """Judge persona + criterion instructions and the request of a single-judge prompt."""
     judge = task["judge_name"]
     criterion_id = task["criterion_id"]
     criterion_description = task["criterion_description"]
-    evidences = task["evidences"]
-    correlation_id = task.get("correlation_id", "unknown")
-
-    logger.log_node_entry(
-        "evaluate_criterion",
-        judge=judge,
-        criterion_id=criterion_id,
-        correlation_id=correlation_id,
-    )
-
-    timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-    opinion_id = f"{judge}_{criterion_id}_{timestamp}"
-
-    evidence_text = _format_evidence(evidences)
-
-    model_name = getattr(
-        judicial_settings,
-        f"{judge.lower()}_model",
-        judicial_settings.techlead_model,
-    )
-
-    system_prompt = f"""You are the {judge} in a digital courtroom.
+    instructions = f"""You are the {judge}.
 {get_philosophy(judge)}
 
 You are evaluating the criterion '{criterion_id}': {criterion_description}
 
-Review the following synchronized evidence collected by the detectives:
-{evidence_text}
-
 Provide your evaluation in a STRICT JSON format. 
 The following fields are REQUIRED:
 - `criterion_id`: MUST be exactly '{criterion_id}'
@@ -175,24 +444,78 @@ Optional fields:
 Ensure you return ONLY the JSON object. Do not add markdown wrappers around the JSON.
 """
 
-    messages = [
-        SystemMessage(content=system_prompt),
-        HumanMessage(content="Evaluate the evidence and provide your opinion."),
-    ]
+    request = "Evaluate the evidence and provide your opinion."
+    if task.get("re_evaluation"):
+        request = f"{task['re_evaluation']}\n{request}"
+    return instructions, request
+
+
+def _avoided_prompt_tokens(task: JudicialTask, model_name: str) -> int:
+    """
+    Prompt-token estimate of a call the model cascade made unnecessary: the unbudgeted
+    evidence slice, capped at the model's evidence budget. Packing a prompt that is never
+    sent would record evidence omissions for it.
+    """
+    evidence = estimate_tokens(_evidence_prefix(_evidence_text(task)), model_name)
+    if judicial_settings.evidence_budget_enabled:
+        evidence = min(evidence, evidence_budget(judicial_settings.judicial_provider, model_name))
+    return evidence + sum(estimate_tokens(part, model_name) for part in _judge_instructions(task))
+
+
+async def _judge_criterion(task: JudicialTask) -> dict[str, list[JudicialOpinion]]:
+    judge = task["judge_name"]
+    criterion_id = task["criterion_id"]
+    correlation_id = task.get("correlation_id", "unknown")
+    run_id = _run_id(task)
+
+    logger.log_node_entry(
+        "evaluate_criterion",
+        judge=judge,
+        criterion_id=criterion_id,
+        correlation_id=correlation_id,
+    )
+
+    timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+    opinion_id = f"{judge}_{criterion_id}_{timestamp}"
+    if task.get("replica"):
+        opinion_id += f"_rep{task['replica']}"
+    if task.get("escalation"):
+        opinion_id += "_esc"
+    if task.get("re_eval_cycle"):
+        opinion_id += f"_re{task['re_eval_cycle']}"
+
+    model_name = task.get("model_override") or _judge_model(judge)
+    prefix, instructions, request = _judge_prompt(task, model_name)
+    cache_mode = task.get("cache_mode", "use")
+    request_key = _request_key(model_name, JudicialOutcome, prefix, instructions, request)
+    cache_key = _response_cache_key(task, request_key)
 
     controller = get_concurrency_controller()
+    spent: list[int] = []
+    # Duplicate of a slow call (hedging): same request, optionally against another model
+    hedge_model = judicial_settings.hedge_model or model_name
 
-    async def llm_call():
-        if judicial_settings.judicial_provider == "google":
-            llm = get_google_llm(model_name)
-        else:
-            llm = get_ollama_llm(model_name)
+    async def llm_call(model: str = model_name):
+        started = time.perf_counter()
+        llm_kwargs, messages = await _prompt_messages(run_id, model, prefix, instructions, request)
         # Use JudicialOutcome for structured output parsing
+        structured_llm = _get_judicial_llm(model, JudicialOutcome, **llm_kwargs)
+        usage = UsageMetadataCallbackHandler()
         outcome = await _invoke_llm_with_validation(
-            llm,
+            structured_llm,
             messages,
-            schema=JudicialOutcome,
+            callbacks=[usage],
+            run_id=run_id,
+        )
+        get_prompt_cache(run_id).record_usage(
+            judicial_settings.judicial_provider,
+            model,
+            prefix,
+            usage.usage_metadata,
         )
+        spent.append(usage_input_tokens(usage.usage_metadata))
+        if model == task.get("model_override"):
+            _record_cascade_call(run_id, spent[-1], time.perf_counter() - started)
 
         # Transform JudicialOutcome -> JudicialOpinion by injecting the ID
         return JudicialOpinion(
@@ -201,12 +524,34 @@ Ensure you return ONLY the JSON object. Do not add markdown wrappers around the
         )
 
     try:
-        result = await bounded_llm_call(
-            controller=controller,
-            agent=judge,
-            dimension=criterion_id,
-            llm_callable=llm_call,
+        # Persistent response cache sits in front of the bounded (rate-limited) call
+        cached = (
+            await asyncio.to_thread(cache_lookup, run_id, cache_mode, cache_key, JudicialOutcome) if cache_key else None
         )
+        if cached is not None:
+            result = JudicialOpinion(opinion_id=opinion_id, **cached.model_dump())
+        else:
+            # Identical in-flight requests (redundancy replicas, concurrent audits) share one call
+            result, shared = await coalesced_llm_call(
+                request_key,
+                judge,
+                criterion_id,
+                lambda: bounded_llm_call(
+                    controller=controller,
+                    agent=judge,
+                    dimension=criterion_id,
+                    llm_callable=llm_call,
+                    **_quota_kwargs(model_name, spent, prefix, instructions, request),
+                    **_scheduling_kwargs(task, run_id),
+                    hedge_callable=functools.partial(llm_call, hedge_model),
+                    hedge_model=hedge_model,
+                ),
+                run_id=run_id,
+            )
+            if shared:
+                result = result.model_copy(update={"opinion_id": opinion_id})
+            elif cache_key:
+                await asyncio.to_thread(cache_store, run_id, cache_mode, cache_key, JudicialOutcome, result)
         logger.log_opinion_rendered(
             f"{judge} on {criterion_id}",
             correlation_id=correlation_id,
@@ -255,6 +600,328 @@ Ensure you return ONLY the JSON object. Do not add markdown wrappers around the
         }
 
 
+@node_traceable
+async def evaluate_criterion(task: JudicialTask) -> dict[str, Any]:
+    """
+    Single judge on a single criterion. With streaming synthesis, the task that
+    completes its criterion also synthesizes it (and runs its re-evaluation).
+    """
+    update = await _judge_criterion(task)
+    streamed = await _stream_synthesis(task, update["opinions"])
+    if not streamed:
+        return update
+    return {
+        "opinions": update["opinions"] + streamed["opinions"],
+        "errors": update.get("errors", []) + streamed["errors"],
+        "criterion_results": streamed["criterion_results"],
+    }
+
+
+async def _stream_synthesis(task: JudicialTask, opinions: list[JudicialOpinion]) -> dict[str, Any] | None:
+    """
+    Reports the task's opinions to the run's CriterionTracker. If they complete the
+    criterion, synthesizes it right away; a high-variance verdict is re-evaluated
+    immediately by its outlier judges and re-synthesized. Returns the state update
+    (re-evaluation opinions and errors, criterion result) or None while pending.
+
+    The follow-up calls (cascade escalation, replicas, re-evaluation) have their own
+    time budget, below the node's: past it they are cancelled and the criterion keeps
+    the verdict of its complete opinions instead of losing the whole node result.
+    """
+    run_id = _run_id(task)
+    criterion_id = task["criterion_id"]
+    tracker = get_criterion_tracker(run_id)
+    complete = tracker.add(criterion_id, (task["judge_name"], task.get("correlation_id", "unknown")), opinions)
+    if complete is None:
+        return None
+
+    timeout = judicial_settings.streaming_follow_up_timeout
+    try:
+        return await asyncio.wait_for(_synthesize_with_follow_ups(task, complete), timeout)
+    except TimeoutError:
+        logger.error(
+            f"Follow-up calls for {criterion_id} exceeded {timeout:g}s; keeping the streamed verdict",
+            correlation_id=task.get("correlation_id", "unknown"),
+        )
+    store = get_evidence_store(run_id)
+    result = synthesize_criterion(
+        criterion_id, tracker.dimension_name(criterion_id), complete, store.evidences, store.aliases
+    )
+    result.execution_log["streamed"] = True
+    result.execution_log["follow_ups_timed_out"] = True
+    metrics = get_run_metrics(run_id)
+    metrics.incr("streaming_synthesis.criteria")
+    metrics.incr("streaming_synthesis.follow_up_timeouts")
+    return {
+        "opinions": [],
+        "errors": [f"TIMEOUT: follow-up calls for criterion {criterion_id} exceeded {timeout:g}s"],
+        "criterion_results": {criterion_id: result},
+    }
+
+
+async def _synthesize_with_follow_ups(task: JudicialTask, complete: list[JudicialOpinion]) -> dict[str, Any]:
+    """Cascade escalation, adaptive replicas and re-evaluation of a completed criterion, then its verdict."""
+    run_id = _run_id(task)
+    criterion_id = task["criterion_id"]
+    tracker = get_criterion_tracker(run_id)
+
+    # Model cascade: small-model verdicts that look unreliable are redone on the judges' models
+    first_pass = complete
+    complete, escalated, errors = await _cascade_escalation(task, first_pass)
+    dropped = [op.opinion_id for op in first_pass] if escalated else []
+
+    # Adaptive redundancy: uncertain judges get replicas before the verdict is final;
+    # opinions outvoted by a replica quorum do not take part in leader election
+    # Replicas run on the model that rendered the opinions they check
+    replicas, outvoted, replica_errors = await _adaptive_replicas(
+        _on_judge_models(task) if escalated else task, complete
+    )
+    errors += replica_errors
+    dropped += outvoted
+    complete = [op for op in complete + replicas if op.opinion_id not in outvoted]
+
+    name = tracker.dimension_name(criterion_id)
+    store = get_evidence_store(run_id)
+    evidences = store.evidences
+    result = synthesize_criterion(criterion_id, name, complete, evidences, store.aliases)
+    metrics = get_run_metrics(run_id)
+    metrics.incr("streaming_synthesis.criteria")
+
+    revised: list[JudicialOpinion] = []
+    if needs_re_evaluation(result):
+        dim = {"id": criterion_id, "description": task.get("criterion_description", "")}
+        re_tasks = _re_evaluation_tasks(result, dim, run_id, task.get("cache_mode", "use"), cycle=1)
+        logger.info(
+            f"Streaming re-evaluation of {criterion_id}: {len(re_tasks)} tasks",
+            correlation_id=task.get("correlation_id", "unknown"),
+        )
+        outcomes = await asyncio.gather(*(evaluate_criterion(t) for t in re_tasks))
+        for outcome in outcomes:
+            revised.extend(outcome["opinions"])
+            errors.extend(outcome.get("errors", []))
+        revised_judges = {op.judge for op in revised}
+        superseded = [op for op in complete if op.judge in revised_judges]
+        kept = [op for op in complete if op.judge not in revised_judges]
+        result = synthesize_criterion(criterion_id, name, kept + revised, evidences, store.aliases)
+        result.execution_log["re_evaluated"] = True
+        result.execution_log["superseded_opinions"] = [op.opinion_id for op in superseded]
+        metrics.incr("re_evaluation.criteria")
+        metrics.incr("re_evaluation.tasks", len(re_tasks))
+
+    if dropped:
+        result.execution_log["superseded_opinions"] = [
+            *dropped,
+            *result.execution_log.get("superseded_opinions", []),
+        ]
+    result.execution_log["streamed"] = True
+    return {
+        "opinions": escalated + replicas + revised,
+        "errors": errors,
+        "criterion_results": {criterion_id: result},
+    }
+
+
+def _launched_replicas() -> int:
+    """
+    Instances of every judge task launched up front: one with adaptive redundancy (which
+    needs streaming synthesis to add replicas later), else the full redundancy factor.
+    """
+    if judicial_settings.adaptive_redundancy_enabled and judicial_settings.streaming_synthesis_enabled:
+        return 1
+    return judicial_settings.judicial_redundancy_factor
+
+
+def _cascade_model() -> str | None:
+    """The small first-pass model when the model cascade is active."""
+    if judicial_settings.cascade_enabled and judicial_settings.streaming_synthesis_enabled:
+        return judicial_settings.cascade_model
+    return None
+
+
+def _panel_task(
+    task: JudicialTask | JudicialPanelTask, judge: str, index: int | None = None, **extra: Any
+) -> JudicialTask:
+    """
+    Task of `judge` on the criterion of `task` (same evidence, cache mode and model override),
+    plus `extra` fields. The correlation id names replica `index`, or is the one of `task` without it.
+    """
+    run_id = _run_id(task)
+    panel_task = JudicialTask(
+        judge_name=judge,
+        criterion_id=task["criterion_id"],
+        criterion_description=task.get("criterion_description", ""),
+        correlation_id=f"{run_id}_r{index}" if index is not None else task.get("correlation_id", run_id),
+        run_id=run_id,
+        **extra,
+    )
+    for key in ("evidence_ref", "evidences", "cache_mode", "model_override"):
+        if key in task:
+            panel_task[key] = task[key]
+    return panel_task
+
+
+def _on_judge_models(task: JudicialTask) -> JudicialTask:
+    """Copy of `task` without the cascade's model override: it runs on the judges' own models."""
+    return JudicialTask(**{k: v for k, v in task.items() if k != "model_override"})
+
+
+async def _cascade_escalation(
+    task: JudicialTask, opinions: list[JudicialOpinion]
+) -> tuple[list[JudicialOpinion], list[JudicialOpinion], list[str]]:
+    """
+    Model cascade for a criterion whose small-model opinions just completed. The small
+    panel's verdict stands unless `escalation_reasons` flags it; then every judge is
+    asked again on its configured model and those opinions replace the small-model ones.
+    Returns (opinions to synthesize, escalated opinions, errors).
+    """
+    if not task.get("model_override"):
+        return opinions, [], []
+    run_id = _run_id(task)
+    criterion_id = task["criterion_id"]
+    store = get_evidence_store(run_id)
+    evidences = store.evidences
+    provisional = synthesize_criterion(criterion_id, criterion_id, opinions, evidences, store.aliases)
+    reasons = escalation_reasons(provisional, judicial_settings.cascade_max_variance)
+
+    metrics = get_run_metrics(run_id)
+    metrics.incr("cascade.criteria")
+    judges = sorted({op.judge for op in opinions})
+    if not reasons:
+        controller = get_concurrency_controller()
+        metrics.incr("cascade.large_calls_avoided", len(judges))
+        for judge in judges:
+            large_model = _judge_model(judge)
+            # The call that did not happen: its prompt estimate and the model's typical latency
+            metrics.incr(
+                "cascade.large_prompt_tokens_avoided", _avoided_prompt_tokens(_panel_task(task, judge), large_model)
+            )
+            typical = controller.latency(judicial_settings.judicial_provider, large_model).percentile(0.5)
+            metrics.incr(
+                "cascade.large_seconds_avoided",
+                round(typical if typical is not None else judicial_settings.cascade_large_latency_estimate, 3),
+            )
+        _update_cascade_totals(metrics)
+        return opinions, [], []
+
+    metrics.incr("cascade.escalations")
+    for reason in reasons:
+        metrics.incr(f"cascade.escalations.{reason}")
+    _update_cascade_totals(metrics)
+    logger.info(
+        f"Cascade escalation of {criterion_id} ({', '.join(reasons)})",
+        correlation_id=task.get("correlation_id", "unknown"),
+    )
+    large = _on_judge_models(task)
+    outcomes = await asyncio.gather(*(_judge_criterion(_panel_task(large, j, escalation=True)) for j in judges))
+    escalated = [op for outcome in outcomes for op in outcome["opinions"]]
+    errors = [err for outcome in outcomes for err in outcome.get("errors", [])]
+    return escalated, escalated, errors
+
+
+def _record_cascade_call(run_id: str, prompt_tokens: int, seconds: float) -> None:
+    """Charges a first-pass call on the cascade model to the cascade's savings."""
+    metrics = get_run_metrics(run_id)
+    metrics.incr("cascade.small_calls")
+    metrics.incr("cascade.small_prompt_tokens", prompt_tokens)
+    metrics.incr("cascade.small_seconds", round(seconds, 3))
+    _update_cascade_totals(metrics)
+
+
+def _update_cascade_totals(metrics: Any) -> None:
+    """Escalation rate and net savings: avoided large-model spend minus all small-model spend."""
+    criteria = metrics.get("cascade.criteria")
+    metrics.set("cascade.escalation_rate", round(metrics.get("cascade.escalations") / criteria, 4) if criteria else 0.0)
+    metrics.set(
+        "cascade.net_prompt_tokens_saved",
+        metrics.get("cascade.large_prompt_tokens_avoided") - metrics.get("cascade.small_prompt_tokens"),
+    )
+    metrics.set(
+        "cascade.net_seconds_saved",
+        round(metrics.get("cascade.large_seconds_avoided") - metrics.get("cascade.small_seconds"), 3),
+    )
+
+
+def _agreeing(opinions: list[JudicialOpinion]) -> int:
+    """Size of the largest group of valid opinions sharing a score."""
+    counts = Counter(op.score for op in opinions if not is_failed_opinion(op))
+    return max(counts.values(), default=0)
+
+
+async def _replicate_until_quorum(
+    task: JudicialTask, judge: str, first: list[JudicialOpinion], factor: int
+) -> tuple[list[JudicialOpinion], list[str], int, list[str]]:
+    """
+    Adds replicas of `judge` until a quorum (majority of `factor`) of its valid opinions
+    agree on a score or `factor` instances have run. Only as many replicas run at once
+    as the quorum still needs, so none is left over once it exists; replicas in flight
+    are cancelled if the caller is. Returns (replica opinions, errors, replicas launched,
+    ids of the opinions outvoted by the quorum).
+    """
+    quorum = factor // 2 + 1
+    opinions = list(first)
+    errors: list[str] = []
+    launched = 1
+    pending: set[asyncio.Future] = set()
+    try:
+        while _agreeing(opinions) < quorum:
+            while len(pending) < quorum - _agreeing(opinions) and launched < factor:
+                pending.add(
+                    asyncio.ensure_future(_judge_criterion(_panel_task(task, judge, launched, replica=launched)))
+                )
+                launched += 1
+            if not pending:
+                break
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for fut in done:
+                outcome = fut.result()
+                opinions.extend(outcome["opinions"])
+                errors.extend(outcome.get("errors", []))
+    finally:
+        for fut in pending:
+            fut.cancel()
+
+    outvoted: list[str] = []
+    if _agreeing(opinions) >= quorum:
+        majority = Counter(op.score for op in opinions if not is_failed_opinion(op)).most_common(1)[0][0]
+        outvoted = [op.opinion_id for op in opinions if is_failed_opinion(op) or op.score != majority]
+    return opinions[len(first) :], errors, launched - 1, outvoted
+
+
+async def _adaptive_replicas(
+    task: JudicialTask, opinions: list[JudicialOpinion]
+) -> tuple[list[JudicialOpinion], list[str], list[str]]:
+    """
+    Adaptive redundancy for a criterion whose first-pass opinions just completed: the
+    judges whose opinion is inconclusive (see `uncertain_judges`) get replicas until a
+    quorum agrees. Leader election in synthesis then picks among the agreeing opinions
+    (among all of them if no quorum formed). Returns the replica opinions, the ids of
+    the outvoted opinions and the errors.
+    """
+    factor = judicial_settings.judicial_redundancy_factor
+    if factor < 2 or _launched_replicas() != 1:
+        return [], [], []
+    run_id = _run_id(task)
+    judges = uncertain_judges(opinions)
+    outcomes = await asyncio.gather(
+        *(_replicate_until_quorum(task, j, [op for op in opinions if op.judge == j], factor) for j in judges)
+    )
+    replicas = [op for ops, _, _, _ in outcomes for op in ops]
+    errors = [err for _, errs, _, _ in outcomes for err in errs]
+    launched = sum(n for _, _, n, _ in outcomes)
+    outvoted = [op_id for _, _, _, ids in outcomes for op_id in ids]
+
+    metrics = get_run_metrics(run_id)
+    metrics.incr("redundancy.replicas", launched)
+    metrics.incr("redundancy.replicas_avoided", (factor - 1) * len({op.judge for op in opinions}) - launched)
+    if judges:
+        metrics.incr("redundancy.criteria")
+        logger.info(
+            f"Adaptive redundancy on {task['criterion_id']}: {launched} replicas for {', '.join(judges)}",
+            correlation_id=task.get("correlation_id", "unknown"),
+        )
+    return replicas, outvoted, errors
+
+
 @node_traceable
 async def evaluate_batch_criterion(
     task: JudicialBatchTask,
@@ -266,8 +933,8 @@ async def evaluate_batch_criterion(
     """
     judge = task["judge_name"]
     dimensions = task["dimensions"]
-    evidences = task["evidences"]
     correlation_id = task.get("correlation_id", "unknown")
+    run_id = _run_id(task)
 
     logger.log_node_entry(
         "evaluate_batch_criterion",
@@ -276,16 +943,15 @@ async def evaluate_batch_criterion(
         correlation_id=correlation_id,
     )
 
-    evidence_text = _format_evidence(evidences)
+    model_name = _judge_model(judge)
+    evidence_text = _evidence_text(task, model_name)
     criteria_list = "\n".join([f"- {d['id']}: {d['description']}" for d in dimensions])
 
-    system_prompt = f"""You are the {judge} in a digital courtroom.
+    prefix = _evidence_prefix(evidence_text)
+    instructions = f"""You are the {judge}.
 {get_philosophy(judge)}
 
 You are evaluating MULTIPLE criteria in a single batch.
-Review the following synchronized evidence collected by the detectives:
-{evidence_text}
-
 Evaluate the following criteria:
 {criteria_list}
 
@@ -301,55 +967,59 @@ Example: {{"opinions": [{{"criterion_id": "DIM1", "judge": "{judge}",
 "score": 4, "argument": "...", "cited_evidence": ["..."]}}]}}
 """
 
-    messages = [
-        SystemMessage(content=system_prompt),
-        HumanMessage(
-            content="Evaluate all provided criteria and return a structured JSON list of opinions.",
-        ),
-    ]
-
     controller = get_concurrency_controller()
 
-    model_name = getattr(
-        judicial_settings,
-        f"{judge.lower()}_model",
-        judicial_settings.techlead_model,
-    )
+    request = "Evaluate all provided criteria and return a structured JSON list of opinions."
+    cache_mode = task.get("cache_mode", "use")
+    request_key = _request_key(model_name, BatchOutcomeResponse, prefix, instructions, request)
+    cache_key = _response_cache_key(task, request_key)
+    spent: list[int] = []
 
     async def llm_call():
-        if judicial_settings.judicial_provider == "google":
-            llm = get_google_llm(model_name)
-        else:
-            llm = get_ollama_llm(model_name)
-
-        class BatchOutcomeResponse(BaseModel):
-            opinions: list[JudicialOutcome]
-
-        structured_llm = llm.with_structured_output(BatchOutcomeResponse)
-        return await structured_llm.ainvoke(messages)
+        llm_kwargs, messages = await _prompt_messages(run_id, model_name, prefix, instructions, request)
+        structured_llm = _get_judicial_llm(model_name, BatchOutcomeResponse, **llm_kwargs)
+        usage = UsageMetadataCallbackHandler()
+        result = await astream_structured(
+            structured_llm,
+            BatchOutcomeResponse,
+            messages,
+            config={"callbacks": [usage]},
+            run_id=run_id,
+            call_timeout=judicial_settings.batch_llm_call_timeout,
+        )
+        get_prompt_cache(run_id).record_usage(
+            judicial_settings.judicial_provider,
+            model_name,
+            prefix,
+            usage.usage_metadata,
+        )
+        spent.append(usage_input_tokens(usage.usage_metadata))
+        return result
 
     try:
-        # Create a custom settings object with longer timeout for the batch call
-        class BatchSettingsWrapper:
-            def __init__(self, original):
-                for k, v in original.__dict__.items():
-                    setattr(self, k, v)
-                # Override timeout if batch specific timeout exists
-                self.llm_call_timeout = getattr(
-                    original,
-                    "batch_llm_call_timeout",
-                    300.0,
-                )
-
-        batch_settings = BatchSettingsWrapper(judicial_settings)
-
-        batch_result = await bounded_llm_call(
-            controller=controller,
-            agent=judge,
-            dimension="BATCH",
-            llm_callable=llm_call,
-            settings=batch_settings,
+        batch_result = (
+            await asyncio.to_thread(cache_lookup, run_id, cache_mode, cache_key, BatchOutcomeResponse)
+            if cache_key
+            else None
         )
+        if batch_result is None:
+            batch_result, shared = await coalesced_llm_call(
+                request_key,
+                judge,
+                "BATCH",
+                lambda: bounded_llm_call(
+                    controller=controller,
+                    agent=judge,
+                    dimension="BATCH",
+                    llm_callable=llm_call,
+                    **_quota_kwargs(model_name, spent, prefix, instructions, request),
+                    **_scheduling_kwargs(task, run_id),
+                    settings=BatchSettingsWrapper(judicial_settings),
+                ),
+                run_id=run_id,
+            )
+            if cache_key and not shared:
+                await asyncio.to_thread(cache_store, run_id, cache_mode, cache_key, BatchOutcomeResponse, batch_result)
 
         received_outcomes = batch_result.opinions
 
@@ -367,83 +1037,246 @@ Example: {{"opinions": [{{"criterion_id": "DIM1", "judge": "{judge}",
         # FR-005: Handle Missing or Corrupt items (partial success logic)
         final_opinions = list(received_opinions)
         missing_dims = [d for d in dimensions if d["id"] not in received_ids]
+        errors: list[str] = []
+        if judicial_settings.micro_batching_enabled:
+            get_batch_sizer(model_name).record(len(dimensions), len(missing_dims))
 
         if missing_dims:
             logger.warning(
                 f"Batch incomplete for {judge}. Missing {len(missing_dims)} IDs. Starting granular retries.",
+                correlation_id=correlation_id,
             )
-            for dim in missing_dims:
-                # Trigger individual call for missing item
-                retry_task = JudicialTask(
-                    judge_name=judge,
-                    criterion_id=dim["id"],
-                    criterion_description=dim["description"],
-                    evidences=evidences,
-                )
-                res = await evaluate_criterion(retry_task)
-                final_opinions.extend(res["opinions"])
+            retried, errors = await _evaluate_dimensions(judge, missing_dims, task)
+            final_opinions.extend(retried)
 
         logger.log_opinion_rendered(
             f"{judge} BATCH",
             correlation_id=correlation_id,
             count=len(final_opinions),
         )
-        return {"opinions": final_opinions}
+        return {"opinions": final_opinions, "errors": errors} if errors else {"opinions": final_opinions}
 
     except Exception as e:
         # FR-004 Fallback: If the whole batch fails, fall back to individual calls for the whole set
         logger.error(
             f"Whole batch evaluation failed for {judge} due to {e}. Falling back to individual dimension calls.",
+            correlation_id=correlation_id,
         )
-        all_opinions = []
-        for dim in dimensions:
-            task = JudicialTask(
-                judge_name=judge,
-                criterion_id=dim["id"],
-                criterion_description=dim["description"],
-                evidences=evidences,
-            )
-            res = await evaluate_criterion(task)
-            all_opinions.extend(res["opinions"])
+        if judicial_settings.micro_batching_enabled:
+            get_batch_sizer(model_name).record(len(dimensions), len(dimensions))
+        all_opinions, errors = await _evaluate_dimensions(judge, dimensions, task)
 
         logger.log_opinion_rendered(
             f"{judge} BATCH FALLBACK",
             correlation_id=correlation_id,
             count=len(all_opinions),
         )
-        return {"opinions": all_opinions}
+        return {"opinions": all_opinions, "errors": errors} if errors else {"opinions": all_opinions}
 
 
-def _format_evidence(evidences: dict) -> str:
-    """Helper to format evidence for prompts."""
-    if not evidences:
-        return "- NO_EVIDENCE: No evidence was found by detectives."
+async def _evaluate_dimensions(
+    judge: str, dims: list[dict], parent: JudicialBatchTask
+) -> tuple[list[JudicialOpinion], list[str]]:
+    """
+    Individual calls for the given dimensions of a batch task, issued concurrently;
+    the shared ConcurrencyController still bounds how many reach the provider at once.
+    """
+    results = await asyncio.gather(*(evaluate_criterion(_dimension_task(judge, dim, parent)) for dim in dims))
+    opinions = [op for res in results for op in res["opinions"]]
+    errors = [err for res in results for err in res.get("errors", [])]
+    return opinions, errors
 
-    text = ""
-    for _cat, ev_list in evidences.items():
-        for e in ev_list:
-            e_id = getattr(
-                e,
-                "evidence_id",
-                e.get("evidence_id") if isinstance(e, dict) else "unknown",
-            )
-            e_class = getattr(
-                e,
-                "evidence_class",
-                e.get("evidence_class") if isinstance(e, dict) else "unknown",
-            )
-            e_conf = getattr(
-                e,
-                "confidence",
-                e.get("confidence") if isinstance(e, dict) else 0.0,
-            )
-            e_content = getattr(
-                e,
-                "content",
-                e.get("content") if isinstance(e, dict) else "",
+
+@node_traceable
+async def evaluate_panel_criterion(task: JudicialPanelTask) -> dict[str, Any]:
+    """
+    Criterion-axis batching: one call renders the opinions of every judge persona on a
+    single criterion, sharing its evidence slice. Judges missing from the response are
+    evaluated individually, as are all of them if the whole call fails (the same
+    fallback semantics as judge-axis batches).
+    """
+    judges = task["judges"]
+    criterion_id = task["criterion_id"]
+    correlation_id = task.get("correlation_id", "unknown")
+    run_id = _run_id(task)
+
+    logger.log_node_entry(
+        "evaluate_panel_criterion",
+        criterion_id=criterion_id,
+        judge_count=len(judges),
+        correlation_id=correlation_id,
+    )
+
+    # One model renders every persona: the cascade model, else the Tech Lead's
+    model_name = task.get("model_override") or judicial_settings.techlead_model
+    prefix = _evidence_prefix(_evidence_text(task, model_name))
+    personas = "\n\n".join(f"{judge}: {get_philosophy(judge)}" for judge in judges)
+    judge_names = ", ".join(f"'{judge}'" for judge in judges)
+    instructions = f"""You are a panel of {len(judges)} judges, each applying their own lens:
+
+{personas}
+
+You are evaluating the criterion '{criterion_id}': {task["criterion_description"]}
+
+Render one INDEPENDENT opinion per judge, each strictly from that judge's lens.
+Provide your response as a JSON object containing a key 'opinions' which is a LIST with exactly one object per judge.
+Each object in the 'opinions' list MUST have:
+- `criterion_id`: MUST be exactly '{criterion_id}'
+- `judge`: one of {judge_names}
+- `score`: INTEGER (1-5)
+- `argument`: Detailed rationale string
+- `cited_evidence`: List of `evidence_id` strings or `['NO_EVIDENCE']`
+
+Optional fields:
+- `mitigations`: (For Defense) List of strings
+- `charges`: (For Prosecutor) List of strings
+- `remediation`: (For TechLead) Strategy string
+"""
+
+    request = "Evaluate the evidence and return one opinion per judge."
+    cache_mode = task.get("cache_mode", "use")
+    request_key = _request_key(model_name, BatchOutcomeResponse, prefix, instructions, request)
+    cache_key = _response_cache_key(task, request_key)
+    controller = get_concurrency_controller()
+    spent: list[int] = []
+
+    async def llm_call():
+        started = time.perf_counter()
+        llm_kwargs, messages = await _prompt_messages(run_id, model_name, prefix, instructions, request)
+        structured_llm = _get_judicial_llm(model_name, BatchOutcomeResponse, **llm_kwargs)
+        usage = UsageMetadataCallbackHandler()
+        result = await astream_structured(
+            structured_llm,
+            BatchOutcomeResponse,
+            messages,
+            config={"callbacks": [usage]},
+            run_id=run_id,
+            call_timeout=judicial_settings.batch_llm_call_timeout,
+        )
+        get_prompt_cache(run_id).record_usage(
+            judicial_settings.judicial_provider,
+            model_name,
+            prefix,
+            usage.usage_metadata,
+        )
+        spent.append(usage_input_tokens(usage.usage_metadata))
+        if "model_override" in task:
+            _record_cascade_call(run_id, spent[-1], time.perf_counter() - started)
+        return result
+
+    received: dict[str, JudicialOpinion] = {}
+    try:
+        panel_result = (
+            await asyncio.to_thread(cache_lookup, run_id, cache_mode, cache_key, BatchOutcomeResponse)
+            if cache_key
+            else None
+        )
+        if panel_result is None:
+            panel_result, shared = await coalesced_llm_call(
+                request_key,
+                "PANEL",
+                criterion_id,
+                lambda: bounded_llm_call(
+                    controller=controller,
+                    agent="PANEL",
+                    dimension=criterion_id,
+                    llm_callable=llm_call,
+                    **_quota_kwargs(model_name, spent, prefix, instructions, request),
+                    **_scheduling_kwargs(task, run_id),
+                    settings=BatchSettingsWrapper(judicial_settings),
+                ),
+                run_id=run_id,
             )
-            e_class_val = getattr(e_class, "value", e_class)
-            text += f"- ID: {e_id} | Class: {e_class_val} | Confidence: {e_conf}\n  Content: {e_content}\n"
+            if cache_key and not shared:
+                await asyncio.to_thread(cache_store, run_id, cache_mode, cache_key, BatchOutcomeResponse, panel_result)
+
+        ts = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+        # Replica panels of a criterion differ by their correlation id suffix (`_r<i>`)
+        replica = correlation_id.removeprefix(run_id)
+        for outcome in panel_result.opinions:
+            if outcome.criterion_id == criterion_id and outcome.judge in judges and outcome.judge not in received:
+                received[outcome.judge] = JudicialOpinion(
+                    opinion_id=f"{outcome.judge}_{criterion_id}_{ts}{replica}",
+                    **outcome.model_dump(),
+                )
+    except Exception as e:
+        logger.error(
+            f"Panel evaluation failed for {criterion_id} due to {e}. Falling back to individual judge calls.",
+            correlation_id=correlation_id,
+        )
+
+    missing = [judge for judge in judges if judge not in received]
+    if received and missing:
+        logger.warning(
+            f"Panel incomplete for {criterion_id}. Missing {len(missing)} judges. Starting granular retries.",
+            correlation_id=correlation_id,
+        )
+    logger.log_opinion_rendered(f"PANEL on {criterion_id}", correlation_id=correlation_id, count=len(received))
+    return await _complete_panel(task, received, missing)
+
+
+async def _complete_panel(
+    task: JudicialPanelTask, received: dict[str, JudicialOpinion], missing: list[str]
+) -> dict[str, Any]:
+    """
+    Reports the panel's opinions to streaming synthesis judge by judge, then evaluates
+    the missing judges individually (concurrently); merges everything into one update.
+    """
+    opinions = list(received.values())
+    errors: list[str] = []
+    results: dict[str, CriterionResult] = {}
+    updates = [await _stream_synthesis(_panel_task(task, j), [op]) for j, op in received.items()]
+    updates += await asyncio.gather(
+        *(evaluate_criterion(_panel_task(task, j, fallback=True)) for j in missing),
+    )
+    for update in updates:
+        if update:
+            opinions.extend(op for op in update["opinions"] if op not in opinions)
+            errors.extend(update.get("errors", []))
+            results.update(update.get("criterion_results", {}))
+
+    merged: dict[str, Any] = {"opinions": opinions}
+    if errors:
+        merged["errors"] = errors
+    if results:
+        merged["criterion_results"] = results
+    return merged
+
+
+def _evidence_line(e: Any) -> str:
+    """One prompt line per evidence item (Evidence models or plain dicts)."""
+    if isinstance(e, dict):
+        e_id, e_class = e.get("evidence_id"), e.get("evidence_class")
+        e_conf, e_content = e.get("confidence"), e.get("content")
+    else:
+        e_id = getattr(e, "evidence_id", "unknown")
+        e_class = getattr(e, "evidence_class", "unknown")
+        e_conf = getattr(e, "confidence", 0.0)
+        e_content = getattr(e, "content", "")
+    e_class_val = getattr(e_class, "value", e_class)
+    return f"- ID: {e_id} | Class: {e_class_val} | Confidence: {e_conf}\n  Content: {e_content}\n"
+
+
+def _format_evidence(
+    evidences: dict,
+    *,
+    budget: int | None = None,
+    dimensions: list[dict] | None = None,
+    model: str | None = None,
+    on_omission: Callable[[PackingStats], None] | None = None,
+) -> str:
+    """
+    Helper to format evidence for prompts. With a token budget, the block is packed by
+    priority (relevance to `dimensions`) and `on_omission` receives the stats of any drop.
+    """
+    if not evidences:
+        return "- NO_EVIDENCE: No evidence was found by detectives."
+    if budget is None:
+        # Buckets in a fixed order: detectives finish in any order, the prompt prefix must not change
+        return "".join(_evidence_line(e) for bucket in sorted(evidences) for e in evidences[bucket])
+    text, stats = pack_evidence(evidences, budget, _evidence_line, dimensions, model)
+    if stats.dropped and on_omission:
+        on_omission(stats)
     return text
 
 
@@ -456,38 +1289,176 @@ def execute_judicial_layer(state: AgentState) -> list[Send]:
     dimensions = state.get("rubric_dimensions", [])
     evidences = state.get("evidences", {})
     correlation_id = state.get("metadata", {}).get("correlation_id", "unknown")
-    judges = ["Prosecutor", "Defense", "TechLead"]
+    judges = JUDGES
 
     sends = []
     redundancy = judicial_settings.judicial_redundancy_factor
 
-    # FR-005: Optional Batching Toggle
-    if judicial_settings.batching_enabled:
+    # Evidence is published once per run; tasks carry only the run id and a slice key
+    # (relevance-routed per dimension unless routing is disabled).
+    get_evidence_store(correlation_id).publish(evidences, dimensions, state.get("evidence_aliases"))
+    routing = judicial_settings.evidence_routing_enabled
+    cache_mode = state.get("metadata", {}).get("response_cache_mode", "use")
+    # Streaming synthesis: each criterion is synthesized as soon as its opinions are in
+    tracker = get_criterion_tracker(correlation_id)
+
+    if state.get("re_eval_needed"):
+        return _re_evaluation_sends(state, cache_mode)
+
+    # FR-005: Optional Batching Toggle (one call per judge across criteria, or per
+    # criterion across judges)
+    panels = judicial_settings.batching_enabled and judicial_settings.batching_axis == "criterion"
+    if judicial_settings.batching_enabled and not panels:
         for judge in judges:
-            for i in range(redundancy):
-                task = JudicialBatchTask(
-                    judge_name=judge,
-                    dimensions=dimensions,
-                    evidences=evidences,
-                    correlation_id=f"{correlation_id}_r{i}",
-                )
-                sends.append(Send("evaluate_batch_criterion", task))
+            for batch in _micro_batches(judge, dimensions, correlation_id, routing):
+                batch_ref = dimensions_ref([d["id"] for d in batch if d.get("id")]) if routing else ALL_EVIDENCE
+                for i in range(redundancy):
+                    task = JudicialBatchTask(
+                        judge_name=judge,
+                        dimensions=batch,
+                        correlation_id=f"{correlation_id}_r{i}",
+                        run_id=correlation_id,
+                        evidence_ref=batch_ref,
+                        cache_mode=cache_mode,
+                    )
+                    sends.append(Send("evaluate_batch_criterion", task))
     else:
         # Sequential-like fan-out for individual criterions
+        replicas = _launched_replicas()
+        cascade_model = _cascade_model()
         for dim in dimensions:
             crit_id = dim.get("id")
             crit_desc = dim.get("description", "")
             if not crit_id:
                 continue
+            dim_ref = dimension_ref(crit_id) if routing else ALL_EVIDENCE
+            if judicial_settings.streaming_synthesis_enabled:
+                slots = [(judge, f"{correlation_id}_r{i}") for judge in judges for i in range(replicas)]
+                tracker.expect(crit_id, dim.get("name", crit_id), slots)
+            if panels:
+                for i in range(replicas):
+                    panel = JudicialPanelTask(
+                        judges=list(judges),
+                        criterion_id=crit_id,
+                        criterion_description=crit_desc,
+                        correlation_id=f"{correlation_id}_r{i}",
+                        run_id=correlation_id,
+                        evidence_ref=dim_ref,
+                        cache_mode=cache_mode,
+                    )
+                    if cascade_model:
+                        panel["model_override"] = cascade_model
+                    sends.append(Send("evaluate_panel_criterion", panel))
+                continue
             for judge in judges:
-                for i in range(redundancy):
+                for i in range(replicas):
                     task = JudicialTask(
                         judge_name=judge,
                         criterion_id=crit_id,
                         criterion_description=crit_desc,
-                        evidences=evidences,
                         correlation_id=f"{correlation_id}_r{i}",
+                        run_id=correlation_id,
+                        evidence_ref=dim_ref,
+                        cache_mode=cache_mode,
                     )
+                    if cascade_model:
+                        task["model_override"] = cascade_model
                     sends.append(Send("evaluate_criterion", task))
 
     return sends
+
+
+def _micro_batches(judge: str, dimensions: list[dict], run_id: str, routing: bool) -> list[list[dict]]:
+    """
+    Criteria of a judge-axis batch, packed into micro-batches by token budget (a single
+    batch of the whole rubric when micro-batching is disabled). A criterion costs its
+    description plus its routed evidence slice; overlapping slices are counted once per
+    criterion, which only errs towards smaller batches.
+    """
+    if not judicial_settings.micro_batching_enabled:
+        return [dimensions]
+
+    model_name = _judge_model(judge)
+    store = get_evidence_store(run_id)
+    dims = [d for d in dimensions if d.get("id")]
+    # Persona and output-format instructions; without routing every batch carries all evidence
+    base = estimate_tokens(get_philosophy(judge)) + BATCH_INSTRUCTION_TOKENS
+    if not routing:
+        base += estimate_tokens(store.render(ALL_EVIDENCE, _format_evidence))
+    costs = {
+        d["id"]: estimate_tokens(f"- {d['id']}: {d.get('description', '')}")
+        + (estimate_tokens(store.render(dimension_ref(d["id"]), _format_evidence)) if routing else 0)
+        for d in dims
+    }
+    batches = pack_criteria(
+        dims,
+        costs,
+        base_tokens=base,
+        prompt_tokens=prompt_budget(judicial_settings.judicial_provider, model_name),
+        response_tokens=judicial_settings.micro_batch_response_tokens,
+        response_tokens_per_criterion=judicial_settings.micro_batch_response_tokens_per_criterion,
+        max_criteria=get_batch_sizer(model_name).limit,
+    )
+    get_run_metrics(run_id).incr("micro_batch.batches", len(batches))
+    return batches
+
+
+def _re_evaluation_note(judge: str, result: CriterionResult) -> str:
+    """Prompt addendum asking an outlier judge to reconsider its score against the panel."""
+    scores = result.execution_log.get("raw_scores", {})
+    panel = ", ".join(f"{j}={score}" for j, score in sorted(scores.items()))
+    return (
+        f"RE-EVALUATION: the panel disagreed sharply on this criterion ({panel}). "
+        f"Your previous score was {scores.get(judge, 'unknown')}. Re-examine the evidence, "
+        "then confirm or revise your score with a rationale grounded in cited evidence."
+    )
+
+
+def _re_evaluation_tasks(
+    result: CriterionResult, dim: dict, run_id: str, cache_mode: str, cycle: int
+) -> list[JudicialTask]:
+    """Re-evaluation tasks of a flagged criterion: its outlier judges (all judges if none recorded)."""
+    ref = dimension_ref(dim["id"]) if judicial_settings.evidence_routing_enabled else ALL_EVIDENCE
+    return [
+        JudicialTask(
+            judge_name=judge,
+            criterion_id=dim["id"],
+            criterion_description=dim.get("description", ""),
+            correlation_id=f"{run_id}_r{i}",
+            run_id=run_id,
+            evidence_ref=ref,
+            cache_mode=cache_mode,
+            re_eval_cycle=cycle,
+            re_evaluation=_re_evaluation_note(judge, result),
+        )
+        for judge in result.execution_log.get("re_evaluation_judges") or JUDGES
+        for i in range(_launched_replicas())
+    ]
+
+
+def _re_evaluation_sends(state: AgentState, cache_mode: str) -> list[Send]:
+    """
+    Second-cycle fan-out: only criteria flagged for re-evaluation (and not already
+    re-evaluated by streaming synthesis), and within those only the outlier judges.
+    """
+    dimensions = {d["id"]: d for d in state.get("rubric_dimensions", []) if d.get("id")}
+    correlation_id = state.get("metadata", {}).get("correlation_id", "unknown")
+    cycle = state.get("re_eval_count", 1)
+
+    sends = []
+    flagged = [r for r in state.get("criterion_results", {}).values() if needs_re_evaluation(r)]
+    for result in flagged:
+        dim = dimensions.get(result.criterion_id)
+        if dim is None:
+            continue
+        tasks = _re_evaluation_tasks(result, dim, correlation_id, cache_mode, cycle)
+        sends.extend(Send("evaluate_criterion", task) for task in tasks)
+
+    metrics = get_run_metrics(correlation_id)
+    metrics.incr("re_evaluation.criteria", len(flagged))
+    metrics.incr("re_evaluation.tasks", len(sends))
+    logger.info(
+        f"Targeted re-evaluation (cycle {cycle}): {len(sends)} tasks across {len(flagged)} criteria",
+        correlation_id=correlation_id,
+    )
+    return sends
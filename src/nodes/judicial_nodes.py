@@ -3,11 +3,18 @@ Bounded-Concurrency Controller for Judicial LLM Calls.
 
 Implements FR-001, FR-002, FR-007, FR-008, FR-009 from spec 012-bounded-agent-eval.
 Added Circuit Breaker integration (013-ironclad-hardening).
+Identical concurrent requests are coalesced by a single-flight layer.
+Per-endpoint AIMD windows adapt the effective concurrency below the global cap.
+Waiting calls are shared round-robin between audits and served by priority
+(call type, criterion progress, age) within an audit.
+Calls slower than a tracked latency percentile of their model can be hedged.
 """
 
 import asyncio
 import logging
 import time
+from collections import deque
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from tenacity import (
@@ -21,21 +28,356 @@ from tenacity import (
 from src.config import judicial_settings
 from src.utils.logging import (
     log_acquired,
+    log_coalesced,
+    log_concurrency_adjusted,
     log_concurrency_limit,
+    log_hedged,
     log_permanent_failure,
     log_queueing,
     log_released,
     log_retry,
     log_timeout,
 )
-from src.utils.orchestration import get_circuit_breaker, get_global_rate_limiter
+from src.utils.orchestration import get_circuit_breaker, get_global_rate_limiter, get_model_rate_limiter
+from src.utils.run_metrics import get_run_metrics
 
 logger = logging.getLogger(__name__)
 
 
+# Status codes signalling provider congestion (rate limited / overloaded)
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+# EWMA weight of the latest call in the error rate
+ERROR_RATE_ALPHA = 0.1
+# Upward drift of the latency baseline per slower call (keeps it tracking slow trends)
+BASELINE_DRIFT = 0.01
+# Base priority per call type, lower is served first: re-evaluations and batch
+# fallbacks finish work that is already late, first-pass calls start new work.
+CALL_PRIORITIES = {"re_evaluation": 0.0, "fallback": 1.0, "first_pass": 2.0}
+
+
+def llm_endpoint(provider: str, model: str) -> str:
+    """Concurrency window key: Gemini quotas are per model, an Ollama server is shared by its models."""
+    if provider == "ollama":
+        return f"ollama:{judicial_settings.ollama_base_url}"
+    return f"{provider}:{model}"
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """True for 429/503-style errors (HTTP status attributes or RESOURCE_EXHAUSTED messages)."""
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    return status in THROTTLE_STATUS_CODES or "RESOURCE_EXHAUSTED" in str(error)
+
+
+def effective_priority(
+    priority_class: str,
+    progress: Callable[[], float] | None,
+    since: float,
+    now: float,
+) -> float:
+    """
+    Base priority of the call type, minus the progress (0..1) of the call's criterion,
+    minus one level per `priority_aging_interval` seconds waited. Lower is served first;
+    with priority scheduling disabled every waiter ranks equal (FIFO).
+    """
+    if not judicial_settings.priority_scheduling_enabled:
+        return 0.0
+    base = CALL_PRIORITIES.get(priority_class, CALL_PRIORITIES["first_pass"])
+    boost = min(max(progress(), 0.0), 1.0) if progress else 0.0
+    return base - boost - (now - since) / judicial_settings.priority_aging_interval
+
+
+class PriorityWaitQueue:
+    """
+    Callers waiting for a slot, served by `effective_priority` (ties in arrival order).
+
+    Aging keeps low-priority calls from starving. A queue holds at most one waiter per
+    judicial task, so the next waiter is picked by a scan at dispatch time, which lets a
+    criterion's progress change while its calls wait. Cancelled waiters are dropped lazily.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: list[tuple[float, str, Callable[[], float] | None, asyncio.Future]] = []
+
+    def __len__(self) -> int:
+        return sum(1 for w in self._waiters if not w[3].done())
+
+    def push(self, priority_class: str, progress: Callable[[], float] | None = None) -> asyncio.Future:
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append((time.monotonic(), priority_class, progress, fut))
+        return fut
+
+    def pop(self) -> asyncio.Future | None:
+        """Removes and returns the future of the best live waiter, None if nobody waits."""
+        self._waiters = [w for w in self._waiters if not w[3].done()]
+        if not self._waiters:
+            return None
+        now = time.monotonic()
+        best = min(self._waiters, key=lambda w: (effective_priority(w[1], w[2], w[0], now), w[0]))
+        self._waiters.remove(best)
+        return best[3]
+
+
+class FairShareQueue:
+    """
+    Deficit round-robin across tenants (one per audit) over per-tenant PriorityWaitQueues.
+
+    Every dispatch costs one slot. The tenant at the head of the ring is served while
+    it has deficit; otherwise it earns one quantum and the ring moves on, so concurrent
+    audits alternate slot by slot however many calls each has queued. Within a tenant,
+    waiters are served by priority. Tenants rejected by `eligible` (in-flight cap
+    reached) are passed over without earning deficit.
+    """
+
+    QUANTUM = 1.0
+
+    def __init__(self) -> None:
+        self._queues: dict[str, PriorityWaitQueue] = {}
+        self._deficit: dict[str, float] = {}
+        self._ring: deque[str] = deque()
+
+    def __len__(self) -> int:
+        return sum(len(q) for q in self._queues.values())
+
+    def queued(self) -> dict[str, int]:
+        """Live waiters per tenant."""
+        return {tenant: n for tenant, q in self._queues.items() if (n := len(q))}
+
+    def push(self, tenant: str, priority_class: str, progress: Callable[[], float] | None = None) -> asyncio.Future:
+        if tenant not in self._queues:
+            self._queues[tenant] = PriorityWaitQueue()
+            self._deficit[tenant] = 0.0
+            self._ring.append(tenant)
+        return self._queues[tenant].push(priority_class, progress)
+
+    def has_eligible(self, eligible: Callable[[str], bool]) -> bool:
+        return any(len(q) and eligible(tenant) for tenant, q in self._queues.items())
+
+    def pop(self, eligible: Callable[[str], bool] | None = None) -> tuple[str, asyncio.Future] | None:
+        """Removes and returns (tenant, future) of the next waiter to serve, None if no eligible waiter."""
+        passed = 0
+        while self._ring and passed < len(self._ring):
+            tenant = self._ring[0]
+            queue = self._queues[tenant]
+            if not len(queue):
+                # Idle tenants leave the ring and forfeit their deficit
+                self._ring.popleft()
+                del self._queues[tenant], self._deficit[tenant]
+                continue
+            if eligible and not eligible(tenant):
+                self._ring.rotate(-1)
+                passed += 1
+                continue
+            if self._deficit[tenant] >= 1.0:
+                self._deficit[tenant] -= 1.0
+                return tenant, queue.pop()
+            self._deficit[tenant] += self.QUANTUM
+            self._ring.rotate(-1)
+            passed = 0
+        return None
+
+
+async def _wait_for_slot(fut: asyncio.Future, on_abandon: Callable[[], None]) -> None:
+    """Waits until a releaser hands this caller a slot; a slot handed to a cancelled caller is passed on."""
+    try:
+        await fut
+    except asyncio.CancelledError:
+        if fut.done() and not fut.cancelled():
+            on_abandon()
+        raise
+
+
+class AdaptiveLimit:
+    """
+    AIMD concurrency window for one provider endpoint.
+
+    The limit grows by one slot per window of healthy calls while the window is
+    saturated (latency within `latency_tolerance` x baseline, error rate under the
+    threshold) and is multiplied by `decrease_factor` on throttling or timeouts,
+    at most once per baseline round trip so one burst of 429s counts as one signal.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        settings: Any | None = None,
+    ) -> None:
+        conf = settings or judicial_settings
+        self.endpoint = endpoint
+        self.minimum = minimum
+        self.maximum = maximum
+        self._limit = float(max(minimum, min(initial, maximum)))
+        self._in_flight = 0
+        self._queue = FairShareQueue()
+        self._decrease_factor = conf.adaptive_decrease_factor
+        self._latency_tolerance = conf.adaptive_latency_tolerance
+        self._error_threshold = conf.adaptive_error_rate_threshold
+        self._baseline: float | None = None
+        self._error_rate = 0.0
+        self._last_decrease = 0.0
+        self._started = time.monotonic()
+        self.history: deque[dict[str, Any]] = deque(maxlen=100)
+        self._record_history("initial")
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(
+        self,
+        priority_class: str = "first_pass",
+        progress: Callable[[], float] | None = None,
+        tenant: str = "default",
+    ) -> None:
+        if self._in_flight < self.limit and not len(self._queue):
+            self._in_flight += 1
+            return
+        await _wait_for_slot(self._queue.push(tenant, priority_class, progress), self._release_slot)
+
+    async def release(self) -> None:
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Hands free slots (the limit may have grown) to the best waiters."""
+        while self._in_flight < self.limit and (picked := self._queue.pop()) is not None:
+            self._in_flight += 1
+            picked[1].set_result(None)
+
+    def record(self, outcome: str, latency: float) -> None:
+        """Feeds one call attempt back into the window: ok | throttled | timeout | error."""
+        failed = outcome != "ok"
+        self._error_rate += ERROR_RATE_ALPHA * (float(failed) - self._error_rate)
+
+        if outcome in ("throttled", "timeout"):
+            now = time.monotonic()
+            if now - self._last_decrease >= max(1.0, self._baseline or 0.0):
+                self._last_decrease = now
+                self._set(self._limit * self._decrease_factor, outcome)
+            return
+        if failed:
+            return
+
+        if self._baseline is None or latency < self._baseline:
+            self._baseline = latency
+        else:
+            self._baseline += BASELINE_DRIFT * (latency - self._baseline)
+
+        healthy = latency <= self._baseline * self._latency_tolerance and self._error_rate <= self._error_threshold
+        if healthy and self._in_flight >= self.limit:
+            self._set(self._limit + 1.0 / self._limit, "increase")
+
+    def _set(self, value: float, reason: str) -> None:
+        previous = self.limit
+        self._limit = max(float(self.minimum), min(value, float(self.maximum)))
+        if self.limit != previous:
+            self._record_history(reason)
+            log_concurrency_adjusted(self.endpoint, previous, self.limit, reason)
+            self._dispatch()
+
+    def _record_history(self, reason: str) -> None:
+        self.history.append(
+            {"t": round(time.monotonic() - self._started, 3), "limit": self.limit, "reason": reason},
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queued": len(self._queue),
+            "min": self.minimum,
+            "max": self.maximum,
+            "latency_baseline_s": round(self._baseline, 3) if self._baseline is not None else None,
+            "error_rate": round(self._error_rate, 3),
+            "history": list(self.history),
+        }
+
+
+class LatencyTracker:
+    """Latencies of the most recent successful calls to one (provider, model)."""
+
+    def __init__(self, size: int = 200) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, latency: float) -> None:
+        self._samples.append(latency)
+
+    def percentile(self, q: float, min_samples: int = 1) -> float | None:
+        """The q-quantile (0..1) of the recorded latencies, None with fewer than `min_samples`."""
+        if len(self._samples) < max(min_samples, 1):
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def first_valid(tasks: list[asyncio.Task]) -> tuple[Any, asyncio.Task]:
+    """
+    (result, task) of the first task to succeed; the remaining tasks are cancelled.
+    If every task fails, the first failure is re-raised.
+    """
+    pending = set(tasks)
+    failure: BaseException | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.cancelled():
+                    continue
+                if task.exception() is None:
+                    return task.result(), task
+                failure = failure or task.exception()
+        raise failure or asyncio.CancelledError()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def hedged_call(
+    call: Callable[[], Awaitable[Any]],
+    hedge: Callable[[], Awaitable[Any]],
+    threshold: float,
+    allow_hedge: Callable[[], bool],
+) -> tuple[Any, bool]:
+    """
+    Runs `call`; if it is still running after `threshold` seconds and `allow_hedge()`
+    grants it, fires `hedge` as a duplicate and keeps the first valid response.
+    Returns (result, hedge_won).
+    """
+    primary = asyncio.ensure_future(call())
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=threshold)
+        if done or not allow_hedge():
+            return await primary, False
+        duplicate = asyncio.ensure_future(hedge())
+        result, winner = await first_valid([primary, duplicate])
+        return result, winner is duplicate
+    finally:
+        primary.cancel()
+
+
 class ConcurrencyController:
     """
     Global concurrency controller using asyncio.Semaphore (FR-001).
+    The semaphore is the hard cap; with adaptive concurrency enabled each provider
+    endpoint additionally gets an AIMD window that moves between the configured
+    minimum and that cap.
+
+    When the cap is reached, callers queue in a FairShareQueue (round-robin across
+    audits, priority within an audit) and a releasing caller hands its slot directly
+    to the next waiter. `max_in_flight_per_audit` caps the slots a single audit may
+    hold. Queue-wait time is aggregated per priority class for the run manifest.
     """
 
     def __init__(self, max_concurrent: int | None = None) -> None:
@@ -44,6 +386,52 @@ class ConcurrencyController:
         self._active_count = 0
         self._lock = asyncio.Lock()
         self._job_active = False
+        self._windows: dict[str, AdaptiveLimit] = {}
+        self._latencies: dict[str, LatencyTracker] = {}
+        self._queue = FairShareQueue()
+        self._tenant_in_flight: dict[str, int] = {}
+        self._queue_waits: dict[str, dict[str, float]] = {}
+
+    def window(self, endpoint: str | None) -> AdaptiveLimit | None:
+        """The endpoint's AIMD window, or None without an endpoint or with adaptive concurrency disabled."""
+        if endpoint is None or not judicial_settings.adaptive_concurrency_enabled:
+            return None
+        if endpoint not in self._windows:
+            # Start below the cap: growth is earned by healthy saturated windows
+            initial = judicial_settings.adaptive_concurrency_initial or -(-self._limit // 2)
+            self._windows[endpoint] = AdaptiveLimit(
+                endpoint,
+                initial=initial,
+                minimum=min(judicial_settings.adaptive_concurrency_min, self._limit),
+                maximum=self._limit,
+            )
+        return self._windows[endpoint]
+
+    def latency(self, provider: str, model: str) -> LatencyTracker:
+        """Recent call latencies of a model (hedging thresholds)."""
+        return self._latencies.setdefault(f"{provider}:{model}", LatencyTracker())
+
+    def snapshot(self) -> dict[str, Any]:
+        """Global cap, per-audit and per-class queueing, and the live limit and history of every endpoint window."""
+        queued = self._queue.queued()
+        return {
+            "global_limit": self._limit,
+            "active": self._active_count,
+            "queued": len(self._queue),
+            "queue_wait": {
+                cls: {
+                    "calls": int(w["calls"]),
+                    "mean_s": round(w["total_s"] / w["calls"], 3),
+                    "max_s": round(w["max_s"], 3),
+                }
+                for cls, w in sorted(self._queue_waits.items())
+            },
+            "tenants": {
+                tenant: {"in_flight": self._tenant_in_flight.get(tenant, 0), "queued": queued.get(tenant, 0)}
+                for tenant in sorted(self._tenant_in_flight.keys() | queued.keys())
+            },
+            "endpoints": {name: w.snapshot() for name, w in sorted(self._windows.items())},
+        }
 
     @property
     def limit(self) -> int:
@@ -60,18 +448,53 @@ class ConcurrencyController:
     def end_job(self) -> None:
         self._job_active = False
 
-    async def acquire(self, agent: str, dimension: str) -> None:
-        async with self._lock:
-            queue_depth = self._limit - self._semaphore._value
-        log_queueing(agent, dimension, queue_depth)
-        await self._semaphore.acquire()
+    def record_queue_wait(self, priority_class: str, seconds: float) -> None:
+        stats = self._queue_waits.setdefault(priority_class, {"calls": 0, "total_s": 0.0, "max_s": 0.0})
+        stats["calls"] += 1
+        stats["total_s"] += seconds
+        stats["max_s"] = max(stats["max_s"], seconds)
+
+    async def acquire(
+        self,
+        agent: str,
+        dimension: str,
+        priority_class: str = "first_pass",
+        progress: Callable[[], float] | None = None,
+        tenant: str = "default",
+    ) -> None:
+        log_queueing(agent, dimension, len(self._queue))
+        if self._under_cap(tenant) and not self._semaphore.locked() and not self._queue.has_eligible(self._under_cap):
+            await self._semaphore.acquire()
+            self._tenant_in_flight[tenant] = self._tenant_in_flight.get(tenant, 0) + 1
+        else:
+            fut = self._queue.push(tenant, priority_class, progress)
+            await _wait_for_slot(fut, lambda: self._free_slot(tenant))
         async with self._lock:
             self._active_count += 1
             active = self._active_count
         log_acquired(agent, dimension, active)
 
-    async def release(self, agent: str, dimension: str) -> None:
-        self._semaphore.release()
+    def _under_cap(self, tenant: str) -> bool:
+        cap = judicial_settings.max_in_flight_per_audit
+        return cap is None or self._tenant_in_flight.get(tenant, 0) < cap
+
+    def _free_slot(self, tenant: str) -> None:
+        """Returns a tenant's slot: handed to the next eligible waiter, or back to the semaphore."""
+        remaining = self._tenant_in_flight.get(tenant, 0) - 1
+        if remaining > 0:
+            self._tenant_in_flight[tenant] = remaining
+        else:
+            self._tenant_in_flight.pop(tenant, None)
+        picked = self._queue.pop(self._under_cap)
+        if picked is None:
+            self._semaphore.release()
+            return
+        next_tenant, fut = picked
+        self._tenant_in_flight[next_tenant] = self._tenant_in_flight.get(next_tenant, 0) + 1
+        fut.set_result(None)
+
+    async def release(self, agent: str, dimension: str, tenant: str = "default") -> None:
+        self._free_slot(tenant)
         async with self._lock:
             self._active_count -= 1
             active = self._active_count
@@ -85,12 +508,77 @@ async def bounded_llm_call(
     llm_callable: Any,
     settings: Any | None = None,
     retryable_exceptions: tuple[type[Exception], ...] = (Exception,),
+    *,
+    provider: str | None = None,
+    model: str | None = None,
+    estimated_tokens: int = 0,
+    token_usage: Callable[[], int] | None = None,
+    priority_class: str = "first_pass",
+    progress: Callable[[], float] | None = None,
+    run_id: str | None = None,
+    hedge_callable: Callable[[], Awaitable[Any]] | None = None,
+    hedge_model: str | None = None,
 ) -> Any:
     """
     Executes an LLM call with bounded concurrency, retries, timeouts, and circuit breaker.
+
+    With a `provider` and `model`:
+    - the call holds a slot of the endpoint's adaptive window (see `llm_endpoint`) and
+      every attempt feeds its latency and outcome back into it;
+    - every attempt is charged to the (provider, model) rate limiter: one request plus
+      `estimated_tokens`, reconciled with the growth of `token_usage()` (cumulative
+      input tokens reported by the caller) once the attempt succeeds.
+    Without them, attempts go through the global request-rate limiter only.
+
+    While waiting for slots the call ranks by `priority_class` (see CALL_PRIORITIES)
+    and `progress()` of its criterion; its total queue wait is recorded per class on
+    the controller and, with a `run_id`, in the run metrics. The `run_id` is also the
+    call's tenant: slots are shared round-robin between concurrent audits.
+
+    With hedging enabled, a `hedge_callable` (the same request, possibly against
+    `hedge_model`) and a `run_id`, an attempt still running past the model's tracked
+    `hedge_latency_percentile` fires one duplicate, charged to the hedge model's rate
+    limiter but holding no extra slot. The first valid response wins and the other is
+    cancelled; at most `hedge_max_per_run` duplicates are fired per run.
     """
     conf = settings or judicial_settings
     cb = get_circuit_breaker(agent)
+    window = controller.window(llm_endpoint(provider, model)) if provider and model else None
+    limiter = get_model_rate_limiter(provider, model) if provider and model else None
+    latencies = controller.latency(provider, model) if provider and model else None
+    hedging = bool(judicial_settings.hedging_enabled and hedge_callable and latencies and run_id)
+
+    def _allow_hedge() -> bool:
+        metrics = get_run_metrics(run_id)
+        if metrics.get("hedge.requests") >= judicial_settings.hedge_max_per_run:
+            return False
+        metrics.incr("hedge.requests")
+        return True
+
+    hedge_charged = 0
+
+    async def _hedge() -> Any:
+        nonlocal hedge_charged
+        log_hedged(agent, dimension, hedge_model or model)
+        hedge_limiter = get_model_rate_limiter(provider, hedge_model or model)
+        charged = await hedge_limiter.acquire(estimated_tokens)
+        if hedge_limiter is limiter:
+            # Reconciled together with the primary request (token_usage() covers both)
+            hedge_charged += charged
+        return await hedge_callable()
+
+    async def _call() -> Any:
+        threshold = (
+            latencies.percentile(judicial_settings.hedge_latency_percentile, judicial_settings.hedge_min_samples)
+            if hedging
+            else None
+        )
+        if threshold is None:
+            return await llm_callable()
+        result, hedge_won = await hedged_call(llm_callable, _hedge, threshold, _allow_hedge)
+        if hedge_won:
+            get_run_metrics(run_id).incr("hedge.wins")
+        return result
 
     retryer = retry(
         stop=stop_after_attempt(conf.retry_max_attempts),
@@ -113,14 +601,40 @@ async def bounded_llm_call(
 
     async def _execute_inner():
         """Internal call wrapped in timeout (FR-008)."""
+        nonlocal hedge_charged
+        hedge_charged = 0
+        # SC-004: Apply traffic shaping (token buckets)
+        if limiter:
+            charged = await limiter.acquire(estimated_tokens)
+        else:
+            await get_global_rate_limiter().consume()
+        used_before = token_usage() if token_usage else 0
+        attempt_start = time.perf_counter()
         try:
-            return await asyncio.wait_for(
-                llm_callable(),
+            result = await asyncio.wait_for(
+                _call(),
                 timeout=conf.llm_call_timeout,
             )
-        except TimeoutError:
-            log_timeout(agent, dimension, conf.llm_call_timeout)
+        except TimeoutError as e:
+            # Streaming calls fail early on a stall (StreamStalledError carries its window)
+            log_timeout(agent, dimension, getattr(e, "timeout_s", conf.llm_call_timeout))
+            if window:
+                # A slow prefill reflects the prompt's size, not endpoint pressure: no decrease
+                prefill = getattr(e, "phase", None) == "first_token"
+                window.record("error" if prefill else "timeout", time.perf_counter() - attempt_start)
             raise
+        except Exception as e:
+            if window:
+                window.record("throttled" if is_throttle_error(e) else "error", time.perf_counter() - attempt_start)
+            raise
+        latency = time.perf_counter() - attempt_start
+        if window:
+            window.record("ok", latency)
+        if latencies is not None:
+            latencies.record(latency)
+        if limiter and token_usage:
+            limiter.reconcile(charged + hedge_charged, token_usage() - used_before)
+        return result
 
     # SC-003: Verify circuit breaker and cascading failure detection
     async def _execute_safe():
@@ -128,15 +642,27 @@ async def bounded_llm_call(
 
     retrying_call = retryer(_execute_safe)
 
+    tenant = run_id or "default"
     start_time = time.perf_counter()
     try:
-        await controller.acquire(agent, dimension)
+        # Endpoint window first: callers throttled by their endpoint do not hold global slots
+        if window:
+            await window.acquire(priority_class, progress, tenant)
         try:
-            # SC-004: Apply traffic shaping (token bucket)
-            await get_global_rate_limiter().consume()
-            return await retrying_call()
+            await controller.acquire(agent, dimension, priority_class, progress, tenant)
+            waited = time.perf_counter() - start_time
+            controller.record_queue_wait(priority_class, waited)
+            if run_id:
+                metrics = get_run_metrics(run_id)
+                metrics.incr(f"queue_wait.{priority_class}.calls")
+                metrics.incr(f"queue_wait.{priority_class}.seconds", round(waited, 4))
+            try:
+                return await retrying_call()
+            finally:
+                await controller.release(agent, dimension, tenant)
         finally:
-            await controller.release(agent, dimension)
+            if window:
+                await window.release()
     except Exception as e:
         elapsed = time.perf_counter() - start_time
         status_code = getattr(e, "status_code", None)
@@ -144,7 +670,75 @@ async def bounded_llm_call(
         raise
 
 
+class SingleFlight:
+    """
+    Coalesces concurrent calls sharing a key: the first caller (leader) runs the call,
+    later callers await its future instead of taking their own semaphore slot and
+    rate-limiter token. Failures are shared too; if the leader is cancelled, a
+    waiting caller takes over.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """Returns (result, shared); `shared` is True when another caller's result was reused."""
+        while (fut := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(fut), True
+            except asyncio.CancelledError:
+                if not fut.cancelled():
+                    raise
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            # Mark retrieved: followers (if any) re-raise it, none is also fine
+            fut.exception()
+            raise
+        else:
+            fut.set_result(result)
+            return result, False
+        finally:
+            self._inflight.pop(key, None)
+
+
+async def coalesced_llm_call(
+    key: str | None,
+    agent: str,
+    dimension: str,
+    llm_callable: Callable[[], Awaitable[Any]],
+    run_id: str = "unknown",
+) -> tuple[Any, bool]:
+    """
+    Runs `llm_callable` (typically a `bounded_llm_call`) through the single-flight layer.
+    Coalescing is skipped without a key, when disabled, or at non-zero temperature where
+    identical requests are meant to be independent samples.
+    """
+    if key is None or not judicial_settings.singleflight_enabled or judicial_settings.llm_temperature != 0:
+        return await llm_callable(), False
+
+    metrics = get_run_metrics(run_id)
+    metrics.incr("singleflight.requests")
+    result, shared = await get_single_flight().do(key, llm_callable)
+    if shared:
+        metrics.incr("singleflight.hits")
+        log_coalesced(agent, dimension, key)
+    return result, shared
+
+
 _controller: ConcurrencyController | None = None
+_single_flight: SingleFlight | None = None
 
 
 def get_concurrency_controller() -> ConcurrencyController:
@@ -154,6 +748,14 @@ def get_concurrency_controller() -> ConcurrencyController:
     return _controller
 
 
+def get_single_flight() -> SingleFlight:
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
+
+
 def reset_concurrency_controller() -> None:
-    global _controller
+    global _controller, _single_flight
     _controller = None
+    _single_flight = None
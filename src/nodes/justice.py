@@ -1,3 +1,5 @@
+import statistics
+
 from src.state import AgentState, CriterionResult, Evidence, JudicialOpinion
 from src.utils.logger import StructuredLogger
 from src.utils.observability import node_traceable
@@ -8,6 +10,9 @@ from src.utils.orchestration import (
 
 logger = StructuredLogger("justice_node")
 
+# Score spread (max - min) above which a panel counts as in major conflict
+RE_EVALUATION_VARIANCE = 2
+
 
 @node_traceable
 def chief_justice_node(state: AgentState) -> AgentState:
@@ -32,20 +37,32 @@ def chief_justice_node(state: AgentState) -> AgentState:
             grouped_opinions[op.criterion_id] = []
         grouped_opinions[op.criterion_id].append(op)
 
+    # Re-evaluation cycle: opinions a judge rendered again supersede its earlier ones
+    previous_results = state.get("criterion_results") or {}
+    for criterion_id, ops in grouped_opinions.items():
+        if criterion_id in previous_results:
+            grouped_opinions[criterion_id] = supersede_opinions(ops, previous_results[criterion_id])
+
     criterion_results: dict[str, CriterionResult] = {}
 
     # 2. Process each criterion
     for criterion_id, ops in grouped_opinions.items():
+        previous = previous_results.get(criterion_id)
+        if previous is not None and is_streamed_final(previous, ops):
+            # Already synthesized as its opinions arrived (streaming synthesis)
+            criterion_results[criterion_id] = previous
+            continue
         name = dimension_map.get(criterion_id, criterion_id)
         criterion_results[criterion_id] = synthesize_criterion(
             criterion_id,
             name,
             ops,
             evidences,
+            state.get("evidence_aliases"),
         )
 
     # 3. Calculate Re-evaluation Needed (FR-005)
-    re_eval_needed = any(res.re_evaluation_required for res in criterion_results.values())
+    re_eval_needed = any(needs_re_evaluation(res) for res in criterion_results.values())
 
     # 4. Limit cycles (max 1)
     current_re_eval_count = state.get("re_eval_count", 0)
@@ -75,11 +92,82 @@ def route_after_justice(state: AgentState) -> str:
     return "report"
 
 
+def supersede_opinions(opinions: list[JudicialOpinion], previous: CriterionResult) -> list[JudicialOpinion]:
+    """
+    Drops the previously synthesized opinions of every judge that has rendered new ones
+    for the criterion since (targeted re-evaluation); other judges keep their opinions.
+    """
+    superseded = set(previous.execution_log.get("superseded_opinions", []))
+    opinions = [op for op in opinions if op.opinion_id not in superseded]
+    previous_ids = {op.opinion_id for op in previous.judge_opinions}
+    revised_judges = {op.judge for op in opinions if op.opinion_id not in previous_ids}
+    return [op for op in opinions if op.judge not in revised_judges or op.opinion_id not in previous_ids]
+
+
+def is_streamed_final(result: CriterionResult, opinions: list[JudicialOpinion]) -> bool:
+    """True if `result` was synthesized by streaming from exactly these opinions."""
+    if not result.execution_log.get("streamed"):
+        return False
+    return {op.opinion_id for op in opinions} == {op.opinion_id for op in result.judge_opinions}
+
+
+def needs_re_evaluation(result: CriterionResult) -> bool:
+    """High-variance criterion that has not already been re-evaluated by streaming synthesis."""
+    return result.re_evaluation_required and not result.execution_log.get("re_evaluated")
+
+
+def outlier_judges(opinions: list[JudicialOpinion]) -> list[str]:
+    """Judges whose score deviates from the panel median by more than one point."""
+    median = statistics.median(op.score for op in opinions)
+    return sorted({op.judge for op in opinions if abs(op.score - median) > 1})
+
+
+def is_failed_opinion(opinion: JudicialOpinion) -> bool:
+    """Fallback opinion of a judge call that failed (or only partially passed) validation."""
+    return "[PARTIAL_VALIDATION]" in opinion.argument or opinion.argument.startswith("System Error:")
+
+
+def uncertain_judges(opinions: list[JudicialOpinion]) -> list[str]:
+    """
+    Judges whose single opinion on a criterion is not conclusive on its own: failed
+    validation, or the outliers of a panel in major conflict (every judge if no single
+    judge stands out).
+    """
+    judges = {op.judge for op in opinions if is_failed_opinion(op)}
+    scores = [op.score for op in opinions]
+    if scores and max(scores) - min(scores) > RE_EVALUATION_VARIANCE:
+        judges.update(outlier_judges(opinions) or {op.judge for op in opinions})
+    return sorted(judges)
+
+
+def cites_no_evidence(opinion: JudicialOpinion) -> bool:
+    return not opinion.cited_evidence or opinion.cited_evidence == ["NO_EVIDENCE"]
+
+
+def escalation_reasons(result: CriterionResult, max_variance: int) -> list[str]:
+    """
+    Why a verdict synthesized from small-model opinions (model cascade) should be redone
+    with the configured judge models: panel disagreement above `max_variance`, low
+    confidence (an opinion citing no evidence), failed validation, or invalid citations.
+    """
+    reasons = []
+    if result.execution_log.get("raw_variance", 0) > max_variance:
+        reasons.append("disagreement")
+    if any(cites_no_evidence(op) for op in result.judge_opinions):
+        reasons.append("low_confidence")
+    if any(is_failed_opinion(op) for op in result.judge_opinions):
+        reasons.append("validation_failure")
+    if "FACT_SUPREMACY_PENALTY" in result.applied_rules:
+        reasons.append("invalid_evidence")
+    return reasons
+
+
 def synthesize_criterion(
     criterion_id: str,
     dimension_name: str,
     opinions: list[JudicialOpinion],
     evidences: dict[str, list[Evidence]],
+    aliases: dict[str, str] | None = None,
 ) -> CriterionResult:
     """
     Performs deterministic synthesis for a single rubric dimension.
@@ -99,6 +187,10 @@ def synthesize_criterion(
     for source_list in evidences.values():
         for e in source_list:
             evidence_pool[e.evidence_id] = e
+    # Compacted evidence: a cited cluster member resolves to its cluster
+    for member_id, cluster_id in (aliases or {}).items():
+        if member_id not in evidence_pool and cluster_id in evidence_pool:
+            evidence_pool[member_id] = evidence_pool[cluster_id]
 
     # --- FR-009: Missing Judge Fallback ---
     num_judges = len(opinions)
@@ -230,14 +322,17 @@ def synthesize_criterion(
     execution_log["final_int"] = final_int
 
     # --- FR-007, FR-010, FR-015: Results Generation ---
-    re_evaluation = variance > 2
+    re_evaluation = variance > RE_EVALUATION_VARIANCE
+    if re_evaluation:
+        # Targeted re-evaluation: only the judges pulling the panel apart are asked again
+        execution_log["re_evaluation_judges"] = outlier_judges(synthesis_opinions)
     dissent = None
     if variance > 0:
         p_op = next((op for op in synthesis_opinions if op.judge == "Prosecutor"), None)
         d_op = next((op for op in synthesis_opinions if op.judge == "Defense"), None)
         t_op = next((op for op in synthesis_opinions if op.judge == "TechLead"), None)
 
-        prefix = "Major conflict detected" if variance > 2 else "Nuanced consensus"
+        prefix = "Major conflict detected" if variance > RE_EVALUATION_VARIANCE else "Nuanced consensus"
         dissent = f"{prefix} (variance={variance}). "
         if t_op:
             dissent += f"Tech Lead assessed {t_op.score}. "
@@ -10,11 +10,17 @@ from typing import Any
 
 from jinja2 import Environment, FileSystemLoader
 
+from src.judicial.criterion_tracker import release_criterion_tracker
+from src.judicial.evidence_store import get_evidence_store, release_evidence_store
+from src.judicial.prompt_cache import release_prompt_cache
+from src.nodes.judicial_nodes import get_concurrency_controller
 from src.state import AgentState, AuditReport
+from src.tools.pdf_artifacts import release_pdf_artifacts
 from src.utils.logger import StructuredLogger
 from src.utils.manifest import ManifestManager
 from src.utils.observability import node_traceable
 from src.utils.orchestration import get_report_workspace, round_half_up
+from src.utils.run_metrics import get_run_metrics, release_run_metrics
 
 logger = StructuredLogger("report_generator")
 
@@ -89,6 +95,9 @@ def report_generator_node(state: AgentState) -> dict[str, Any]:
         # Prepare context for template
         context = report.model_dump()
         context["evidences"] = display_evidences
+        # Evidence left out of judicial prompts by the evidence budget
+        omissions = get_evidence_store(correlation_id).omissions()
+        context["evidence_omissions"] = omissions
 
         # Serialize evidence for the manifest and the checksum log
         checksum_log = [e.model_dump(mode="json") for e in full_evidence_list]
@@ -101,10 +110,17 @@ def report_generator_node(state: AgentState) -> dict[str, Any]:
         with open(report_path, "w", encoding="utf-8") as f:
             f.write(rendered)
 
-        # 7. Save Manifest (T014)
+        # 7. Save Manifest (T014), including the run's performance counters
+        run_metrics = get_run_metrics(correlation_id).snapshot()
         ManifestManager.save_manifest(
             str(workspace),
-            state.get("metadata", {}),
+            {
+                **state.get("metadata", {}),
+                "run_metrics": run_metrics,
+                "evidence_omissions": omissions,
+                "evidence_aliases": state.get("evidence_aliases", {}),
+                "concurrency": get_concurrency_controller().snapshot(),
+            },
             state.get("errors", []),
         )
 
@@ -112,6 +128,7 @@ def report_generator_node(state: AgentState) -> dict[str, Any]:
             f"Audit completed: {repo_name}",
             correlation_id=correlation_id,
             workspace=str(workspace),
+            run_metrics=run_metrics,
         )
 
         return {
@@ -123,6 +140,21 @@ def report_generator_node(state: AgentState) -> dict[str, Any]:
         logger.error(f"Report generation failed: {e}", correlation_id=correlation_id)
         # In case of failure, we still want to save what we can
         return fallback_save(state, e)
+    finally:
+        release_run_state(state.get("metadata", {}).get("correlation_id", "unknown"))
+
+
+def release_run_state(run_id: str) -> None:
+    """
+    End of an audit: drops per-run cached artifacts (parsed PDF, evidence store, trackers,
+    prompt cache, metrics). Idempotent, so the entry point can also call it when the graph
+    aborts before reaching the report.
+    """
+    release_pdf_artifacts(run_id)
+    release_evidence_store(run_id)
+    release_criterion_tracker(run_id)
+    release_prompt_cache(run_id)
+    release_run_metrics(run_id)
 
 
 def fallback_save(state: AgentState, error: Exception) -> dict[str, Any]:
@@ -34,6 +34,10 @@ class AuditRequest(StrictModel):
     )
     output: str = Field(default="audit/reports/", description="Output directory.")
     dashboard: bool = Field(default=False, description="Enable real-time TUI dashboard.")
+    cache_mode: Literal["use", "refresh", "bypass"] = Field(
+        default="use",
+        description="Judicial response cache mode for this run.",
+    )
 
 
 class EvidenceClass(str, Enum):
@@ -242,7 +246,14 @@ class AuditReport(StrictModel):
     global_score: float = Field(ge=0.0, le=5.0)
 
 
+# An evidences update carrying this key replaces the evidence instead of merging into it
+# (evidence compaction removes the items it clusters)
+REPLACE_EVIDENCES = "__replace__"
+
+
 def merge_evidences(left, right):
+    if isinstance(right, dict) and right.get(REPLACE_EVIDENCES):
+        return {key: val for key, val in right.items() if key != REPLACE_EVIDENCES}
     if not isinstance(left, dict):
         return right
     if not isinstance(right, dict):
@@ -264,7 +275,8 @@ def merge_criterion_results(left, right):
         return left
     merged = left.copy()
     for k, v in right.items():
-        if k not in merged or v.relevance_confidence > merged[k].relevance_confidence:
+        # Ties go to the newer result (re-evaluation cycles re-synthesize at equal confidence)
+        if k not in merged or v.relevance_confidence >= merged[k].relevance_confidence:
             merged[k] = v
     return merged
 
@@ -276,6 +288,8 @@ class AgentState(TypedDict):
     rubric_dimensions: list[dict]
     synthesis_rules: dict[str, str]
     evidences: Annotated[dict[str, list[Evidence]], merge_evidences]
+    # Evidence compaction: member evidence id -> id of the cluster that replaced it
+    evidence_aliases: Annotated[dict[str, str], operator.ior]
     opinions: Annotated[list[JudicialOpinion], operator.add]
     criterion_results: Annotated[dict[str, CriterionResult], merge_criterion_results]
     errors: Annotated[list[str], operator.add]
@@ -1,14 +1,19 @@
 import concurrent.futures
 import re
 
+from src.tools.pdf_artifacts import PDFArtifacts
+
 try:
     from docling.document_converter import DocumentConverter
 except ImportError:
     DocumentConverter = None
 
 
-def _convert_pdf(pdf_path: str) -> str:
+def _convert_pdf(pdf_path: str, artifacts: PDFArtifacts | None = None) -> str:
     """Internal function to convert PDF; runs in isolated thread/process if possible."""
+    if artifacts is not None:
+        # Shared per-run handle: converted once, cached for the whole audit
+        return artifacts.markdown()
     if not DocumentConverter:
         return ""
     converter = DocumentConverter()
@@ -16,10 +21,14 @@ def _convert_pdf(pdf_path: str) -> str:
     return result.document.export_to_markdown()
 
 
-def extract_pdf_markdown(pdf_path: str, timeout: int = 60) -> str:
+def extract_pdf_markdown(
+    pdf_path: str,
+    timeout: int = 60,
+    artifacts: PDFArtifacts | None = None,
+) -> str:
     """Extracts text content from a PDF using Docling, wrapped in a timeout."""
     with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(_convert_pdf, pdf_path)
+        future = executor.submit(_convert_pdf, pdf_path, artifacts)
         try:
             return future.result(timeout=timeout)
         except concurrent.futures.TimeoutError:
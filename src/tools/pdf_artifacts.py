@@ -0,0 +1,169 @@
+"""
+Per-run PDF artifact service shared by the DocAnalyst and VisionInspector.
+
+The specification PDF is read from disk once and parsed once with PyMuPDF; extracted
+images and the markdown export (Docling, else PyMuPDF page text) are cached on the
+handle for the lifetime of the audit run. Both detectives run in parallel threads, so
+every artifact is built under a lock and computed at most once.
+
+Only the artifacts the detectives consume are exposed. Docling cannot reuse the
+PyMuPDF document: it runs its own layout parse, fed from the shared in-memory bytes.
+"""
+
+import base64
+import io
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:
+    from docling.datamodel.base_models import DocumentStream
+    from docling.document_converter import DocumentConverter
+except ImportError:
+    DocumentConverter = None
+    DocumentStream = None
+
+# Formats accepted natively by the multimodal providers; anything else is re-encoded as PNG.
+NATIVE_IMAGE_FORMATS = {"png": "image/png", "jpeg": "image/jpeg", "jpg": "image/jpeg"}
+
+
+class PDFArtifacts:
+    """Lazily parsed, thread-safe view over a single PDF document."""
+
+    def __init__(self, pdf_path: str):
+        self.pdf_path = pdf_path
+        self._data: bytes | None = None
+        self._doc = None
+        self._cache: dict[str, Any] = {}
+        # One lock for the shared fitz handle, one per expensive derived artifact
+        self._doc_lock = threading.RLock()
+        self._markdown_lock = threading.Lock()
+        self._images_lock = threading.Lock()
+
+    # --- Raw document ---
+
+    def read_bytes(self) -> bytes:
+        """Reads the PDF from disk exactly once."""
+        with self._doc_lock:
+            if self._data is None:
+                with open(self.pdf_path, "rb") as f:
+                    self._data = f.read()
+            return self._data
+
+    def _document(self):
+        """Returns the shared PyMuPDF document (caller must hold _doc_lock)."""
+        if self._doc is None:
+            self._doc = fitz.open(stream=self.read_bytes(), filetype="pdf")
+        return self._doc
+
+    @property
+    def available(self) -> bool:
+        return fitz is not None and os.path.exists(self.pdf_path)
+
+    # --- Derived artifacts ---
+
+    def images(self) -> list[dict[str, Any]]:
+        """
+        Embedded images as base64 with a provider-compatible MIME type.
+        Extraction errors yield the images collected so far, matching the legacy extractor.
+        """
+        with self._images_lock:
+            if "images" in self._cache:
+                return self._cache["images"]
+            if not self.available:
+                return []
+
+            images = []
+            try:
+                with self._doc_lock:
+                    doc = self._document()
+                    for page_index in range(len(doc)):
+                        for img_index, img in enumerate(doc[page_index].get_images(full=True)):
+                            xref = img[0]
+                            image_bytes, mime_type = self._normalize_image(doc, xref)
+                            images.append(
+                                {
+                                    "base64": base64.b64encode(image_bytes).decode("utf-8"),
+                                    "mime_type": mime_type,
+                                    "page": page_index + 1,
+                                    "index": img_index,
+                                },
+                            )
+            except Exception:
+                return images
+
+            self._cache["images"] = images
+            return images
+
+    @staticmethod
+    def _normalize_image(doc, xref: int) -> tuple[bytes, str]:
+        """Returns (bytes, mime_type), re-encoding non-native formats (JPX, JBIG2, CMYK...) as PNG."""
+        base_image = doc.extract_image(xref)
+        ext = str(base_image.get("ext", "")).lower()
+        if ext in NATIVE_IMAGE_FORMATS:
+            return base_image["image"], NATIVE_IMAGE_FORMATS[ext]
+
+        pix = fitz.Pixmap(doc, xref)
+        if pix.n - pix.alpha >= 4:
+            pix = fitz.Pixmap(fitz.csRGB, pix)
+        return pix.tobytes("png"), "image/png"
+
+    def markdown(self) -> str:
+        """
+        Markdown export of the document, converted once from the in-memory bytes
+        (a second, Docling-owned parse). Falls back to PyMuPDF page text when Docling is not installed.
+        """
+        with self._markdown_lock:
+            if "markdown" not in self._cache:
+                if DocumentConverter is not None:
+                    source = DocumentStream(
+                        name=Path(self.pdf_path).name,
+                        stream=io.BytesIO(self.read_bytes()),
+                    )
+                    result = DocumentConverter().convert(source)
+                    self._cache["markdown"] = result.document.export_to_markdown()
+                elif self.available:
+                    with self._doc_lock:
+                        texts = [page.get_text().strip() for page in self._document()]
+                    self._cache["markdown"] = "\n\n".join(t for t in texts if t)
+                else:
+                    self._cache["markdown"] = ""
+            return self._cache["markdown"]
+
+    def close(self) -> None:
+        with self._doc_lock:
+            if self._doc is not None:
+                self._doc.close()
+                self._doc = None
+            self._data = None
+            self._cache.clear()
+
+
+_registry: dict[tuple[str, str], PDFArtifacts] = {}
+_registry_lock = threading.Lock()
+
+
+def get_pdf_artifacts(pdf_path: str, run_id: str) -> PDFArtifacts:
+    """Returns the shared artifact handle for this run and document (released with the run)."""
+    if not run_id:
+        raise ValueError("A run id is required to share PDF artifacts")
+    key = (run_id, str(Path(pdf_path).resolve()))
+    with _registry_lock:
+        if key not in _registry:
+            _registry[key] = PDFArtifacts(pdf_path)
+        return _registry[key]
+
+
+def release_pdf_artifacts(run_id: str) -> None:
+    """Closes and forgets every document opened for the given run."""
+    with _registry_lock:
+        keys = [k for k in _registry if k[0] == run_id]
+        handles = [_registry.pop(k) for k in keys]
+    for handle in handles:
+        handle.close()
@@ -1,114 +1,179 @@
-import base64
 import concurrent.futures
-import os
+import logging
 from typing import Any
 
-try:
-    import fitz  # PyMuPDF
-except ImportError:
-    fitz = None
-
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_ollama import ChatOllama
+from pydantic import BaseModel, Field
 
 from src.config import detective_settings, judicial_settings
+from src.tools.pdf_artifacts import PDFArtifacts
+from src.utils.llm_clients import get_chat_model, get_structured_model
+from src.utils.llm_streaming import stream_structured, stream_text
+
+logger = logging.getLogger(__name__)
+
+DIAGRAM_INSTRUCTION = (
+    "Analyze this architectural diagram from a software engineering perspective. "
+    "Identify if it shows a LangGraph StateMachine with parallel branches "
+    "(fan-out/fan-in) for Detectives and Judges. Describe the flow accurately."
+)
+
+
+class DiagramClassification(BaseModel):
+    """Classification of a single image inside a batched vision request."""
 
+    image_index: int = Field(..., description="Zero-based position of the image in the request.")
+    classification: str = Field(..., description="Description of the diagram and its flow.")
 
-def extract_images_from_pdf(pdf_path: str) -> list[dict[str, Any]]:
+
+class DiagramBatchClassification(BaseModel):
+    """Structured response for a multi-image vision request."""
+
+    classifications: list[DiagramClassification] = Field(default_factory=list)
+
+
+def extract_images_from_pdf(pdf_path: str, artifacts: PDFArtifacts | None = None) -> list[dict[str, Any]]:
     """
     Extracts images from a PDF using PyMuPDF.
+    Reuses the run's shared PDF handle when provided instead of re-opening the file.
     """
-    if not fitz:
-        return []
-
-    if not os.path.exists(pdf_path):
-        return []
+    if artifacts is not None:
+        return artifacts.images()
 
-    images = []
+    handle = PDFArtifacts(pdf_path)
     try:
-        doc = fitz.open(pdf_path)
-        for page_index in range(len(doc)):
-            page = doc[page_index]
-            image_list = page.get_images(full=True)
-
-            for img_index, img in enumerate(image_list):
-                xref = img[0]
-                base_image = doc.extract_image(xref)
-                image_bytes = base_image["image"]
-
-                # Convert to base64
-                encoded = base64.b64encode(image_bytes).decode("utf-8")
-
-                images.append(
-                    {
-                        "base64": encoded,
-                        "page": page_index + 1,
-                        "index": img_index,
-                    },
-                )
-        doc.close()
-    except Exception:
-        # Log error or raise
-        pass
-
-    return images
-
-
-def classify_diagram(image_base64: str) -> str:
+        return handle.images()
+    finally:
+        handle.close()
+
+
+def _vision_client_args() -> tuple[str, str, float] | None:
+    """(provider, model, temperature) of the vision model, or None if the provider cannot be used."""
+    if detective_settings.vision_provider != "ollama" and not judicial_settings.api_key:
+        return None
+    return detective_settings.vision_provider, detective_settings.vision_model, detective_settings.llm_temperature
+
+
+def _vision_options() -> dict[str, Any]:
+    return {"base_url": detective_settings.ollama_base_url} if detective_settings.vision_provider == "ollama" else {}
+
+
+def _get_vision_llm():
+    """Pooled vision model (shared with other callers of the same model), or None if unavailable."""
+    args = _vision_client_args()
+    return get_chat_model(*args, **_vision_options()) if args else None
+
+
+def _image_part(image_base64: str, mime_type: str = "image/jpeg") -> dict[str, Any]:
+    return {
+        "type": "image_url",
+        "image_url": {"url": f"data:{mime_type};base64,{image_base64}"},
+    }
+
+
+def classify_diagram(image_base64: str, mime_type: str = "image/jpeg", *, run_id: str | None = None) -> str:
     """
     Sends an image to Gemini Pro Vision for classification.
     """
-    if detective_settings.vision_provider == "ollama":
-        llm = ChatOllama(
-            model=detective_settings.vision_model,
-            temperature=detective_settings.llm_temperature,
-            base_url=detective_settings.ollama_base_url,
-        )
-    else:
-        api_key = judicial_settings.api_key
-        if not api_key:
-            return "Image analysis skipped: Missing Google API Key."
-
-        llm = ChatGoogleGenerativeAI(
-            model=detective_settings.vision_model,
-            temperature=detective_settings.llm_temperature,
-            google_api_key=api_key,
-        )
+    llm = _get_vision_llm()
+    if llm is None:
+        return "Image analysis skipped: Missing Google API Key."
 
     # Construct multimodal message
     from langchain_core.messages import HumanMessage
 
     message = HumanMessage(
         content=[
-            {
-                "type": "text",
-                "text": (
-                    "Analyze this architectural diagram from a software engineering perspective. "
-                    "Identify if it shows a LangGraph StateMachine with parallel branches "
-                    "(fan-out/fan-in) for Detectives and Judges. Describe the flow accurately."
-                ),
-            },
-            {
-                "type": "image_url",
-                "image_url": {"url": f"data:image/jpeg;base64,{image_base64}"},
-            },
+            {"type": "text", "text": DIAGRAM_INSTRUCTION},
+            _image_part(image_base64, mime_type),
         ],
     )
 
     try:
-        response = llm.invoke([message])
-        return str(response.content)
+        return stream_text(llm, [message], run_id=run_id)
     except Exception as e:
         return f"Image classification failed: {e!s}"
 
 
-def _run_vision_classification(pdf_path: str) -> list[dict[str, Any]]:
-    images = extract_images_from_pdf(pdf_path)
-    results = []
+def classify_diagram_batch(images: list[dict[str, Any]], *, run_id: str | None = None) -> dict[int, str]:
+    """
+    Classifies several images in a single multimodal request.
+
+    The instruction text is sent once and each image is labelled with its position.
+    Returns a mapping of position -> classification for the items the model answered;
+    positions absent from the mapping must be retried individually by the caller.
+    """
+    if not images:
+        return {}
+
+    args = _vision_client_args()
+    if args is None:
+        return {}
+
+    from langchain_core.messages import HumanMessage
+
+    content: list[dict[str, Any]] = [
+        {
+            "type": "text",
+            "text": (
+                f"You will receive {len(images)} images, each preceded by its label 'Image <index>'. "
+                f"For EACH image: {DIAGRAM_INSTRUCTION} "
+                "Return one entry per image in `classifications`, with `image_index` set to its label."
+            ),
+        },
+    ]
+    for position, img in enumerate(images):
+        content.append({"type": "text", "text": f"Image {position}:"})
+        content.append(_image_part(img["base64"], img.get("mime_type", "image/jpeg")))
+
+    structured_llm = get_structured_model(*args, DiagramBatchClassification, **_vision_options())
+    response = stream_structured(
+        structured_llm,
+        DiagramBatchClassification,
+        [HumanMessage(content=content)],
+        run_id=run_id,
+    )
+
+    received: dict[int, str] = {}
+    for item in response.classifications:
+        # Discard out-of-range, duplicate, or empty entries (treated as missing)
+        if 0 <= item.image_index < len(images) and item.image_index not in received and item.classification.strip():
+            received[item.image_index] = item.classification
+    return received
+
+
+def _run_vision_classification(
+    pdf_path: str,
+    artifacts: PDFArtifacts | None = None,
+    run_id: str | None = None,
+) -> list[dict[str, Any]]:
+    images = extract_images_from_pdf(pdf_path, artifacts)
 
     # Limit number of images to avoid token limits / 429
-    for idx, img in enumerate(images[:5]):
-        cls = classify_diagram(img["base64"])
+    selected = images[:5]
+    batch_size = detective_settings.vision_batch_size
+
+    # Batched mode: one request per K images, partial success is kept
+    classifications: dict[int, str] = {}
+    if batch_size > 1:
+        for start in range(0, len(selected), batch_size):
+            chunk = selected[start : start + batch_size]
+            try:
+                received = classify_diagram_batch(chunk, run_id=run_id)
+            except Exception as e:
+                logger.warning(f"Batched vision call failed for images {start}-{start + len(chunk) - 1}: {e}")
+                received = {}
+            for offset, text in received.items():
+                classifications[start + offset] = text
+
+        missing = len(selected) - len(classifications)
+        if missing:
+            logger.warning(f"Vision batch incomplete. Missing {missing} images. Starting single-image retries.")
+
+    results = []
+    for idx, img in enumerate(selected):
+        cls = classifications.get(idx)
+        if cls is None:
+            cls = classify_diagram(img["base64"], img.get("mime_type", "image/jpeg"), run_id=run_id)
         results.append(
             {
                 "image_index": idx,
@@ -120,10 +185,15 @@ def _run_vision_classification(pdf_path: str) -> list[dict[str, Any]]:
     return results
 
 
-def run_vision_classification(pdf_path: str, timeout: int = 60) -> list[dict[str, Any]]:
-    """Runs vision classification with a timeout."""
+def run_vision_classification(
+    pdf_path: str,
+    timeout: int = 60,
+    artifacts: PDFArtifacts | None = None,
+    run_id: str | None = None,
+) -> list[dict[str, Any]]:
+    """Runs vision classification with a timeout; `run_id` attributes its stream metrics."""
     with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(_run_vision_classification, pdf_path)
+        future = executor.submit(_run_vision_classification, pdf_path, artifacts, run_id)
         try:
             return future.result(timeout=timeout)
         except concurrent.futures.TimeoutError:
@@ -0,0 +1,113 @@
+"""
+Offline concurrency tuning against a live LLM endpoint.
+
+Issues a fixed number of small requests at increasing concurrency levels and
+measures throughput, latency and throttling at each level. The recommended limit
+is the lowest level within 5% of the best throughput whose failure rate stays
+within the error budget: beyond that knee extra parallelism only adds queueing
+at the provider (or 429s).
+"""
+
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from pydantic import BaseModel
+
+from src.nodes.judicial_nodes import is_throttle_error
+
+# Levels within this fraction of the best throughput count as equally good
+THROUGHPUT_TOLERANCE = 0.05
+
+
+class TuningLevel(BaseModel):
+    """Measurements at one concurrency level."""
+
+    concurrency: int
+    requests: int
+    throughput_rps: float
+    p50_latency_s: float
+    p95_latency_s: float
+    throttled: int
+    errors: int
+
+    @property
+    def failure_rate(self) -> float:
+        return (self.throttled + self.errors) / self.requests if self.requests else 0.0
+
+
+class TuningReport(BaseModel):
+    levels: list[TuningLevel]
+    recommended_limit: int
+
+
+def default_levels(maximum: int) -> list[int]:
+    """1, 2, 4, ... up to and including `maximum`."""
+    levels, level = [], 1
+    while level < maximum:
+        levels.append(level)
+        level *= 2
+    levels.append(maximum)
+    return levels
+
+
+async def measure_level(call: Callable[[], Awaitable[object]], concurrency: int, requests: int) -> TuningLevel:
+    """Runs `requests` calls with at most `concurrency` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    throttled = errors = 0
+
+    async def one() -> None:
+        nonlocal throttled, errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await call()
+                latencies.append(time.perf_counter() - start)
+            except Exception as e:
+                if is_throttle_error(e):
+                    throttled += 1
+                else:
+                    errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies) or [0.0]
+    return TuningLevel(
+        concurrency=concurrency,
+        requests=requests,
+        throughput_rps=round(len(latencies) / elapsed, 3) if elapsed else 0.0,
+        p50_latency_s=round(statistics.median(ordered), 3),
+        p95_latency_s=round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        throttled=throttled,
+        errors=errors,
+    )
+
+
+def recommend(levels: list[TuningLevel], error_budget: float) -> int:
+    """Lowest level within THROUGHPUT_TOLERANCE of the best throughput among levels within budget."""
+    healthy = [lvl for lvl in levels if lvl.failure_rate <= error_budget] or levels[:1]
+    best = max(lvl.throughput_rps for lvl in healthy)
+    return min(lvl.concurrency for lvl in healthy if lvl.throughput_rps >= best * (1 - THROUGHPUT_TOLERANCE))
+
+
+async def tune_concurrency(
+    call: Callable[[], Awaitable[object]],
+    levels: list[int],
+    requests_per_level: int,
+    error_budget: float = 0.05,
+) -> TuningReport:
+    """
+    Measures every level in order and stops early once a level exceeds the error
+    budget (the endpoint is already throttling; higher levels only make it worse).
+    """
+    measured: list[TuningLevel] = []
+    for concurrency in levels:
+        level = await measure_level(call, concurrency, max(requests_per_level, concurrency))
+        measured.append(level)
+        if level.failure_rate > error_budget:
+            break
+    return TuningReport(levels=measured, recommended_limit=recommend(measured, error_budget))
@@ -0,0 +1,126 @@
+"""
+Shared chat-model clients.
+
+Chat models are built once per (provider, model, temperature, options) and their
+`with_structured_output` wrappers once per schema, then reused by every judge,
+criterion, retry and the VisionInspector. Per-request values (a Gemini context cache
+name) are bound on the pooled runnable per call, never part of the pool key. Each instance owns its provider HTTP
+client, so reuse keeps keep-alive connection pools (and TLS sessions) warm instead
+of opening new ones per call.
+
+Async HTTP clients are bound to the event loop that first uses them, so instances
+are pooled per running loop; callers without a running loop (vision worker threads)
+share a loop-independent pool, whose streaming calls all run on the single
+background loop of `llm_streaming`.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any
+
+import httpx
+from langchain_core.runnables import RunnableSequence
+
+from src.config import judicial_settings
+
+# Keep-alive window for idle provider connections (seconds)
+KEEPALIVE_EXPIRY = 300.0
+
+_Key = tuple[str, str, float, tuple[tuple[str, Any], ...]]
+
+_loop_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+_shared_pool: dict = {}
+_lock = threading.Lock()
+
+
+def _pool() -> dict:
+    """Client pool of the running event loop, or the shared pool outside of one (caller holds _lock)."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _shared_pool
+    if loop not in _loop_pools:
+        _loop_pools[loop] = {}
+    return _loop_pools[loop]
+
+
+def _connection_limits() -> httpx.Limits:
+    slots = judicial_settings.max_concurrent_llm_calls
+    return httpx.Limits(
+        max_connections=slots * 2,
+        max_keepalive_connections=slots,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+def _build(provider: str, model: str, temperature: float, options: dict[str, Any]):
+    if provider == "google":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(
+            model=model,
+            temperature=temperature,
+            google_api_key=judicial_settings.api_key,
+            **options,
+        )
+    if provider == "ollama":
+        from langchain_ollama import ChatOllama
+
+        return ChatOllama(
+            model=model,
+            temperature=temperature,
+            client_kwargs={"limits": _connection_limits()},
+            **options,
+        )
+    raise ValueError(f"Unsupported LLM provider: {provider}")
+
+
+def _key(provider: str, model: str, temperature: float, options: dict[str, Any]) -> _Key:
+    return (provider, model, float(temperature), tuple(sorted(options.items())))
+
+
+def get_chat_model(provider: str, model: str, temperature: float, **options):
+    """
+    Shared chat model for the given provider/model/temperature.
+    `options` are extra constructor kwargs (base_url, keep_alive, ...).
+    """
+    key = _key(provider, model, temperature, options)
+    with _lock:
+        pool = _pool()
+        if key not in pool:
+            pool[key] = _build(provider, model, temperature, options)
+        return pool[key]
+
+
+def get_structured_model(
+    provider: str,
+    model: str,
+    temperature: float,
+    schema: type,
+    *,
+    call_options: dict[str, Any] | None = None,
+    **options,
+):
+    """
+    Shared `with_structured_output(schema)` runnable on top of the pooled chat model.
+    `call_options` (e.g. `cached_content`) are bound to the model step of the returned
+    runnable, so they reuse the pooled client instead of building one per value.
+    """
+    key = (*_key(provider, model, temperature, options), schema)
+    llm = get_chat_model(provider, model, temperature, **options)
+    with _lock:
+        pool = _pool()
+        if key not in pool:
+            pool[key] = llm.with_structured_output(schema)
+        structured = pool[key]
+    if not call_options:
+        return structured
+    return RunnableSequence(structured.first.bind(**call_options), *structured.steps[1:])
+
+
+def clear_llm_clients() -> None:
+    """Drops every pooled client (tests, configuration reloads)."""
+    with _lock:
+        _loop_pools.clear()
+        _shared_pool.clear()
@@ -0,0 +1,228 @@
+"""
+Streaming invocation of structured-output chat models.
+
+A whole-completion call only fails on its call timeout (120 s for a judge, 300 s
+for a batch), even when the model stopped producing tokens long before, and it
+keeps waiting while a model that already closed its JSON object rambles on.
+Streaming calls pull the completion chunk by chunk instead:
+
+- the text is scanned incrementally and the call returns as soon as a top-level
+  JSON object closes and validates against the schema (the rest of the stream is
+  closed, which cancels the provider request);
+- no chunk within the first-token window (prompt prefill) or within
+  `llm_stall_timeout` of the previous one raises StreamStalledError, a
+  TimeoutError the bounded call retries like any other timeout.
+
+Prefill time grows with the prompt, so the first-token window is a share
+(`llm_first_token_share`) of the call's own timeout: a batch or panel call gets
+a share of the batch budget. `llm_first_token_timeout` pins it instead.
+
+Worker threads (vision) stream through `stream_structured`/`stream_text`, which
+run the async call on one background event loop: a stalled read is cancelled there,
+closing the provider stream, where a blocking read could not be interrupted.
+
+Only `model | parser` runnables (as built by `with_structured_output`) can be
+streamed; other runnables, or streaming disabled, fall back to a whole call.
+A call stopped early reports no provider usage, so its rate-limit charge keeps
+the prompt estimate.
+"""
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import aclosing
+from typing import Any
+
+from langchain_core.runnables import RunnableSequence
+from pydantic import BaseModel, ValidationError
+
+from src.config import judicial_settings
+from src.utils.run_metrics import get_run_metrics
+
+# Background event loop running the synchronous (worker-thread) streaming calls
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+class StreamStalledError(TimeoutError):
+    """
+    No tokens arrived from a streaming call within the stall window. `phase` is
+    "first_token" while the prompt was still being prefilled, "stall" mid-completion.
+    """
+
+    def __init__(self, timeout_s: float, phase: str = "stall"):
+        super().__init__(f"LLM stream stalled: no tokens for {timeout_s:g}s ({phase})")
+        self.timeout_s = timeout_s
+        self.phase = phase
+
+
+def first_token_timeout(call_timeout: float | None = None) -> float:
+    """First-token window of a call whose whole-call timeout is `call_timeout` (default: a judge call's)."""
+    if judicial_settings.llm_first_token_timeout is not None:
+        return judicial_settings.llm_first_token_timeout
+    return (call_timeout or judicial_settings.llm_call_timeout) * judicial_settings.llm_first_token_share
+
+
+class IncrementalJSONParser:
+    """
+    Finds top-level JSON objects in text fed chunk by chunk and returns the first
+    one valid for `schema`. Text around the objects (prose, markdown fences) is ignored.
+    """
+
+    def __init__(self, schema: type[BaseModel]):
+        self.schema = schema
+        self.text = ""
+        self._pos = 0
+        self._start = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._rejected: ValidationError | None = None
+
+    def feed(self, chunk: str) -> BaseModel | None:
+        """Consumes a chunk; returns the parsed object once a schema-valid one has closed."""
+        self.text += chunk
+        for i in range(self._pos, len(self.text)):
+            ch = self.text[i]
+            if self._depth == 0:
+                if ch == "{":
+                    self._start, self._depth = i, 1
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        result = self.schema.model_validate_json(self.text[self._start : i + 1])
+                    except ValidationError as e:
+                        self._rejected = e
+                        continue
+                    self._pos = i + 1
+                    return result
+        self._pos = len(self.text)
+        return None
+
+    def finish(self) -> BaseModel:
+        """End of stream without a valid object: raises the last rejection (or the text's own error)."""
+        if self._rejected is not None:
+            raise self._rejected
+        return self.schema.model_validate_json(self.text)
+
+
+def _model_step(structured_llm: Any) -> Any | None:
+    """The chat-model step of a `model | parser` runnable, None if the runnable cannot be streamed."""
+    if judicial_settings.llm_streaming_enabled and isinstance(structured_llm, RunnableSequence):
+        return structured_llm.first
+    return None
+
+
+def _stalled(run_id: str | None, timeout: float, first: bool) -> StreamStalledError:
+    if run_id:
+        get_run_metrics(run_id).incr("llm_stream.first_token_stalls" if first else "llm_stream.stalls")
+    return StreamStalledError(timeout, "first_token" if first else "stall")
+
+
+async def _achunks(
+    model: Any,
+    messages: list,
+    *,
+    config: dict | None = None,
+    run_id: str | None = None,
+    call_timeout: float | None = None,
+) -> AsyncIterator[Any]:
+    """
+    Chunks of `model`'s stream with stall detection. On a stall the pending read is
+    cancelled, which closes the provider stream, and StreamStalledError is raised.
+    """
+    chunks = aiter(model.astream(messages, config=config))
+    timeout = first_token_timeout(call_timeout)
+    first = True
+    try:
+        while True:
+            try:
+                chunk = await asyncio.wait_for(anext(chunks), timeout)
+            except StopAsyncIteration:
+                return
+            except TimeoutError:
+                raise _stalled(run_id, timeout, first) from None
+            yield chunk
+            timeout, first = judicial_settings.llm_stall_timeout, False
+    finally:
+        await chunks.aclose()
+
+
+async def astream_structured(
+    structured_llm: Any,
+    schema: type[BaseModel],
+    messages: list,
+    *,
+    config: dict | None = None,
+    run_id: str | None = None,
+    call_timeout: float | None = None,
+) -> BaseModel:
+    """
+    Streams `structured_llm` and returns the first schema-valid object of its output.
+    `call_timeout` is the whole-call timeout the first-token window is scaled from.
+    """
+    model = _model_step(structured_llm)
+    if model is None:
+        return await structured_llm.ainvoke(messages, config=config)
+
+    parser = IncrementalJSONParser(schema)
+    stream = _achunks(model, messages, config=config, run_id=run_id, call_timeout=call_timeout)
+    async with aclosing(stream) as chunks:
+        async for chunk in chunks:
+            result = parser.feed(chunk.text)
+            if result is not None:
+                return result
+    return parser.finish()
+
+
+async def astream_text(llm: Any, messages: list, *, run_id: str | None = None) -> str:
+    """Free-text call with stall detection (the full completion is returned)."""
+    if not judicial_settings.llm_streaming_enabled:
+        return str((await llm.ainvoke(messages)).content)
+    async with aclosing(_achunks(llm, messages, run_id=run_id)) as chunks:
+        return "".join([chunk.text async for chunk in chunks])
+
+
+def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Runs `coro` on the module's background event loop and waits for its result. A sync
+    stream read cannot be interrupted from another thread; an async one is cancelled.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, daemon=True, name="llm-stream").start()
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+def stream_structured(
+    structured_llm: Any,
+    schema: type[BaseModel],
+    messages: list,
+    *,
+    run_id: str | None = None,
+) -> BaseModel:
+    """Synchronous `astream_structured` for callers running in worker threads (vision)."""
+    if _model_step(structured_llm) is None:
+        return structured_llm.invoke(messages)
+    return _run(astream_structured(structured_llm, schema, messages, run_id=run_id))
+
+
+def stream_text(llm: Any, messages: list, *, run_id: str | None = None) -> str:
+    """Synchronous `astream_text` for callers running in worker threads (vision)."""
+    if not judicial_settings.llm_streaming_enabled:
+        return str(llm.invoke(messages).content)
+    return _run(astream_text(llm, messages, run_id=run_id))
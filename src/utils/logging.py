@@ -1,7 +1,7 @@
 """
 Centralized structured logging helpers for concurrency events.
 Emits structured JSON events per SC-003 spec for:
-  queueing, acquired, released, retry, timeout
+  queueing, acquired, released, retry, timeout, coalesced, concurrency_adjusted
 
 Each event includes agent name, dimension ID, and slot/queue counters.
 """
@@ -106,6 +106,44 @@ def log_permanent_failure(
     )
 
 
+def log_coalesced(agent: str, dimension: str, request_key: str) -> None:
+    """Log a duplicate request served by an identical in-flight call."""
+    _emit_event(
+        {
+            "event": "coalesced",
+            "agent": agent,
+            "dimension": dimension,
+            "request_key": request_key[:16],
+        },
+    )
+
+
+def log_hedged(agent: str, dimension: str, model: str | None) -> None:
+    """Log a duplicate request fired for a call slower than its model's latency percentile."""
+    _emit_event(
+        {
+            "event": "hedged",
+            "agent": agent,
+            "dimension": dimension,
+            "model": model,
+        },
+    )
+
+
+def log_concurrency_adjusted(endpoint: str, previous: int, limit: int, reason: str) -> None:
+    """Log an adaptive (AIMD) concurrency window change for a provider endpoint."""
+    _emit_event(
+        {
+            "event": "concurrency_adjusted",
+            "endpoint": endpoint,
+            "previous_limit": previous,
+            "limit": limit,
+            "reason": reason,
+        },
+        level=logging.INFO if reason == "increase" else logging.WARNING,
+    )
+
+
 def log_concurrency_limit(limit: int) -> None:
     """FR-009: Log the active concurrency limit at job start."""
     _emit_event(
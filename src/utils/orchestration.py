@@ -12,6 +12,7 @@ from datetime import datetime
 from functools import wraps
 from typing import Any
 
+from src.config import judicial_settings
 from src.state import CircuitBreakerState, CircuitBreakerStatus
 
 
@@ -164,31 +165,89 @@ class TokenBucketRateLimiter:
     """
     FR-011: Traffic shaping for outbound API bursts.
     Ensures we don't exceed model tier quotas.
+
+    Callers reserve capacity up front: the bucket may go negative and each caller
+    sleeps for its own share of the deficit outside of any lock, so waiters are
+    served in arrival order (FIFO) and none of them serializes the others.
     """
 
     def __init__(self, rate: float, capacity: float):
         self.rate = rate
         self.capacity = capacity
         self.tokens = capacity
-        self.last_refill = time.time()
-        self._lock = asyncio.Lock()
+        self.last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Charges `amount` now and returns how long the caller must wait before using it."""
+        self._refill()
+        self.tokens -= amount
+        return max(0.0, -self.tokens / self.rate)
+
+    def adjust(self, amount: float) -> None:
+        """Charges (positive) or refunds (negative) capacity after the fact."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
 
     async def consume(self, amount: float = 1.0):
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_refill
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-            self.last_refill = now
-
-            if self.tokens < amount:
-                wait_time = (amount - self.tokens) / self.rate
-                await asyncio.sleep(wait_time)
-                self.tokens = 0
-            else:
-                self.tokens -= amount
+        delay = self.reserve(amount)
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.adjust(-amount)
+                raise
+
+
+class ModelRateLimiter:
+    """
+    Request and token buckets for one (provider, model) quota.
+
+    Token cost is charged from the estimated prompt size before the call and
+    reconciled with the reported usage afterwards; a caller waits for the later of
+    its request and token reservations.
+    """
+
+    def __init__(self, provider: str, model: str, rpm: float, tpm: float | None, burst: float):
+        self.provider = provider
+        self.model = model
+        self.requests = TokenBucketRateLimiter(rate=rpm / 60.0, capacity=burst)
+        self.tokens = TokenBucketRateLimiter(rate=tpm / 60.0, capacity=tpm) if tpm else None
+
+    async def acquire(self, estimated_tokens: int = 0) -> int:
+        """Waits for a request slot and `estimated_tokens` of token budget; returns the tokens charged."""
+        delay = self.requests.reserve(1.0)
+        charged = estimated_tokens if self.tokens else 0
+        if charged:
+            delay = max(delay, self.tokens.reserve(charged))
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.requests.adjust(-1.0)
+                if charged:
+                    self.tokens.adjust(-charged)
+                raise
+        return charged
+
+    def reconcile(self, charged: int, actual_tokens: int) -> None:
+        """Replaces the estimated charge with the actual usage (refund or extra charge)."""
+        if self.tokens and actual_tokens:
+            self.tokens.adjust(actual_tokens - charged)
+
+    def snapshot(self) -> dict[str, float | None]:
+        return {
+            "requests_available": round(self.requests.tokens, 2),
+            "tokens_available": round(self.tokens.tokens) if self.tokens else None,
+        }
 
 
 _limiter: TokenBucketRateLimiter | None = None
+_model_limiters: dict[tuple[str, str], ModelRateLimiter] = {}
 
 
 def get_global_rate_limiter() -> TokenBucketRateLimiter:
@@ -199,6 +258,27 @@ def get_global_rate_limiter() -> TokenBucketRateLimiter:
     return _limiter
 
 
+def get_model_rate_limiter(provider: str, model: str) -> ModelRateLimiter:
+    """Rate limiter of a (provider, model) quota; limits come from settings, with per-model overrides."""
+    key = (provider, model)
+    if key not in _model_limiters:
+        limits = {
+            "rpm": judicial_settings.rate_limit_rpm,
+            "tpm": judicial_settings.rate_limit_tpm,
+            "burst": judicial_settings.rate_limit_burst,
+            **judicial_settings.rate_limit_overrides.get(f"{provider}:{model}", {}),
+        }
+        _model_limiters[key] = ModelRateLimiter(provider, model, limits["rpm"], limits["tpm"], limits["burst"])
+    return _model_limiters[key]
+
+
+def reset_rate_limiters() -> None:
+    """Drops every rate limiter (tests, configuration reloads)."""
+    global _limiter
+    _limiter = None
+    _model_limiters.clear()
+
+
 # --- Restored Orchestration Helpers ---
 
 
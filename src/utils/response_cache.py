@@ -0,0 +1,187 @@
+"""
+Persistent cache of validated judicial LLM responses.
+
+Judges run at temperature 0.0, so a request is fully described by its provider,
+model, temperature, output schema and prompt messages. The canonical digest of
+those inputs keys an on-disk SQLite store (WAL mode, safe for concurrent readers)
+holding the validated structured output. Re-runs and re-audits of unchanged
+evidence are then served from disk and reproduce the previous verdicts. Sampled
+(temperature > 0) requests and redundancy replicas bypass the cache: their point is
+an independent answer. Reads and writes block on SQLite, so async callers run them
+in a worker thread.
+
+Entries expire after a TTL; beyond the configured size the least recently used
+entries are evicted. Per run, the cache mode is one of:
+- `use`: read and write (default)
+- `refresh`: skip reads, overwrite with fresh responses
+- `bypass`: neither read nor write
+"""
+
+import hashlib
+import json
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Any, Literal
+
+from pydantic import BaseModel, ValidationError
+
+from src.config import judicial_settings
+from src.utils.logger import StructuredLogger
+from src.utils.run_metrics import get_run_metrics
+
+logger = StructuredLogger("response_cache")
+
+CacheMode = Literal["use", "refresh", "bypass"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    schema TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+"""
+
+
+def request_digest(
+    provider: str,
+    model: str,
+    temperature: float,
+    schema: type[BaseModel],
+    messages: list[Any],
+) -> str:
+    """Canonical digest of a structured LLM request."""
+    canonical = {
+        "provider": provider,
+        "model": model,
+        "temperature": float(temperature),
+        "schema": schema.model_json_schema(),
+        "messages": [[getattr(m, "type", type(m).__name__), getattr(m, "content", m)] for m in messages],
+    }
+    blob = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed store of validated structured outputs keyed by request digest."""
+
+    def __init__(self, path: str, ttl_seconds: int, max_entries: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def get(self, key: str, schema: type[BaseModel]) -> BaseModel | None:
+        """Validated cached response, or None if absent, expired or no longer matching the schema."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ? AND schema = ?",
+                (key, schema.__name__),
+            ).fetchone()
+            if row is None:
+                return None
+            payload, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        try:
+            return schema.model_validate_json(payload)
+        except ValidationError:
+            return None
+
+    def put(self, key: str, schema: type[BaseModel], value: BaseModel) -> None:
+        """Stores `value` (a `schema` instance or a superset of its fields) under `key`."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, schema, payload, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, schema.__name__, value.model_dump_json(), now, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """TTL expiry, then LRU down to max_entries (caller holds the lock)."""
+        self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        self._conn.execute(
+            "DELETE FROM responses WHERE key IN "
+            "(SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: ResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def _default_path() -> str:
+    path = pathlib.Path(judicial_settings.response_cache_path)
+    if not path.is_absolute():
+        path = pathlib.Path(__file__).resolve().parent.parent.parent / path
+    return str(path)
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Process-wide response cache, or None when disabled in settings."""
+    global _cache
+    if not judicial_settings.response_cache_enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(
+                _default_path(),
+                ttl_seconds=judicial_settings.response_cache_ttl,
+                max_entries=judicial_settings.response_cache_max_entries,
+            )
+        return _cache
+
+
+def cache_lookup(run_id: str, mode: CacheMode, key: str, schema: type[BaseModel]) -> BaseModel | None:
+    """Returns a cached response if the run's cache mode allows reading; records hit-rate metrics."""
+    cache = get_response_cache()
+    if cache is None or mode == "bypass":
+        return None
+    metrics = get_run_metrics(run_id)
+    metrics.incr("response_cache.requests")
+    if mode == "refresh":
+        return None
+    try:
+        value = cache.get(key, schema)
+    except sqlite3.Error as e:
+        logger.warning(f"Response cache read failed: {e}")
+        return None
+    if value is not None:
+        metrics.incr("response_cache.hits")
+    return value
+
+
+def cache_store(run_id: str, mode: CacheMode, key: str, schema: type[BaseModel], value: BaseModel) -> None:
+    """Persists a validated response unless the run bypasses the cache."""
+    cache = get_response_cache()
+    if cache is None or mode == "bypass":
+        return
+    try:
+        cache.put(key, schema, value)
+        get_run_metrics(run_id).incr("response_cache.writes")
+    except sqlite3.Error as e:
+        # The cache is an optimization: never fail a judicial call because of it
+        logger.warning(f"Response cache write failed: {e}")
@@ -0,0 +1,63 @@
+"""
+Per-run performance counters.
+
+Components increment named counters against the run's correlation id; the report
+generator snapshots them into the run manifest. Counter names are dotted
+(`<component>.<metric>`); for every component that records both `requests` and
+`hits`, the snapshot also carries a derived `<component>.hit_ratio`.
+"""
+
+import threading
+
+_RATIO_SUFFIXES = (".hits", ".requests")
+
+
+class RunMetrics:
+    """Thread-safe counters for a single audit run."""
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self._values: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + value
+
+    def set(self, name: str, value: float) -> None:
+        with self._lock:
+            self._values[name] = value
+
+    def get(self, name: str, default: float = 0) -> float:
+        with self._lock:
+            return self._values.get(name, default)
+
+    def snapshot(self) -> dict[str, float]:
+        """Sorted copy of all counters plus derived hit ratios."""
+        with self._lock:
+            values = dict(self._values)
+        for name in list(values):
+            if name.endswith(_RATIO_SUFFIXES[1]):
+                component = name.removesuffix(_RATIO_SUFFIXES[1])
+                requests = values[name]
+                hits = values.get(component + _RATIO_SUFFIXES[0], 0)
+                values[f"{component}.hit_ratio"] = round(hits / requests, 4) if requests else 0.0
+        return dict(sorted(values.items()))
+
+
+_registry: dict[str, RunMetrics] = {}
+_registry_lock = threading.Lock()
+
+
+def get_run_metrics(run_id: str = "unknown") -> RunMetrics:
+    """Returns the metrics collector of the given run."""
+    with _registry_lock:
+        if run_id not in _registry:
+            _registry[run_id] = RunMetrics(run_id)
+        return _registry[run_id]
+
+
+def release_run_metrics(run_id: str) -> None:
+    """Forgets the counters of a finished run."""
+    with _registry_lock:
+        _registry.pop(run_id, None)
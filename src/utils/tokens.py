@@ -0,0 +1,39 @@
+"""
+Lightweight prompt-size estimation.
+Provider tokenizers are not available offline, so sizes are approximated from
+character counts (≈4 characters per token for English text and source code).
+Model families whose tokenizers split text more finely get a lower ratio, so
+their estimates stay on the safe side of the context window.
+"""
+
+CHARS_PER_TOKEN = 4.0
+
+# Characters per token by model family (matched as a substring of the model name)
+MODEL_CHARS_PER_TOKEN: dict[str, float] = {
+    "gemini": 4.0,
+    "gemma": 4.0,
+    "gpt": 4.0,
+    "llama": 3.6,
+    "mistral": 3.5,
+    "phi": 3.5,
+    "deepseek": 3.4,
+    "qwen": 3.3,
+}
+
+
+def chars_per_token(model: str | None) -> float:
+    """Characters-per-token ratio for a model (the generic ratio for unknown models)."""
+    name = (model or "").lower()
+    return next((ratio for family, ratio in MODEL_CHARS_PER_TOKEN.items() if family in name), CHARS_PER_TOKEN)
+
+
+def estimate_tokens(text: str | None, model: str | None = None) -> int:
+    """Approximate token count for a prompt fragment (for `model`'s tokenizer, if given)."""
+    if not text:
+        return 0
+    return int(len(text) / chars_per_token(model)) + 1
+
+
+def usage_input_tokens(usage_metadata: dict) -> int:
+    """Input tokens reported by a UsageMetadataCallbackHandler (summed over models)."""
+    return sum(u.get("input_tokens", 0) or 0 for u in usage_metadata.values())
@@ -0,0 +1,73 @@
+import json
+import pathlib
+import time
+from datetime import datetime
+
+from src.judicial.evidence_router import EvidenceRouter
+from src.state import Evidence, EvidenceClass
+
+RUBRIC_PATH = pathlib.Path(__file__).resolve().parent.parent.parent / "rubric" / "week2_rubric.json"
+
+CLASSES = [
+    EvidenceClass.ORCHESTRATION_PATTERN,
+    EvidenceClass.STATE_MANAGEMENT,
+    EvidenceClass.MODEL_DEFINITIONS,
+    EvidenceClass.GIT_FORENSIC,
+]
+
+
+def _synthetic_evidence(n: int) -> dict[str, list[Evidence]]:
+    """A very large audit: `n` repository findings over a few hundred files, 200 doc chunks."""
+    repo = [
+        Evidence(
+            evidence_id=f"repo_{i}",
+            source="repo",
+            evidence_class=CLASSES[i % len(CLASSES)],
+            goal="benchmark",
+            found=True,
+            content=f"Call to helper_{i % 500}() in compute_{i % 97} with StateGraph node_{i % 13}",
+            location=f"src/pkg{i % 40}/module_{i % 300}.py",
+            rationale="synthetic",
+            confidence=0.9,
+            timestamp=datetime(2024, 1, 1),
+        )
+        for i in range(n)
+    ]
+    docs = [
+        Evidence(
+            evidence_id=f"docs_{i}",
+            source="docs",
+            evidence_class=EvidenceClass.DOCUMENT_CLAIM,
+            goal="benchmark",
+            found=True,
+            content=f"Section {i}: the report discusses dialectical synthesis and agent {i} responsibilities.",
+            location=f"page {i // 4 + 1}",
+            rationale="synthetic",
+            confidence=0.9,
+            timestamp=datetime(2024, 1, 1),
+        )
+        for i in range(200)
+    ]
+    return {"repo": repo, "docs": docs}
+
+
+def test_selection_for_hundreds_of_dimensions_is_fast():
+    """Indexing is done once; each dimension's BM25 selection stays in the millisecond range."""
+    rubric = json.loads(RUBRIC_PATH.read_text(encoding="utf-8"))["dimensions"]
+    dimensions = [{**dim, "id": f"{dim['id']}_{i}"} for i in range(30) for dim in rubric]
+    evidences = _synthetic_evidence(5000)
+
+    start = time.perf_counter()
+    router = EvidenceRouter(evidences, top_k=25)
+    indexed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    slices = [router.route(dim) for dim in dimensions]
+    per_dimension = (time.perf_counter() - start) / len(dimensions)
+
+    print(
+        f"\nBM25 retrieval: {len(dimensions)} dimensions over 5200 items; "
+        f"index {indexed * 1000:.1f} ms, {per_dimension * 1000:.2f} ms/dimension"
+    )
+    assert all(slices)
+    assert per_dimension < 0.05
@@ -0,0 +1,84 @@
+import json
+import pathlib
+from datetime import datetime
+
+from src.judicial.evidence_router import EvidenceRouter
+from src.nodes.judges import _format_evidence
+from src.state import Evidence, EvidenceClass
+from src.utils.tokens import estimate_tokens
+
+RUBRIC_PATH = pathlib.Path(__file__).resolve().parent.parent.parent / "rubric" / "week2_rubric.json"
+
+# (share of findings, class, content template, location template)
+AST_PATTERNS = [
+    (30, EvidenceClass.ORCHESTRATION_PATTERN, "builder.add_edge('{n}', 'aggregator') fan-out", "src/graph.py"),
+    (20, EvidenceClass.STATE_MANAGEMENT, "class Run{n}State(TypedDict) with operator.add reducer", "src/state.py"),
+    (30, EvidenceClass.MODEL_DEFINITIONS, "class Payload{n}(BaseModel) Pydantic fields", "src/schemas/m{n}.py"),
+    (
+        10,
+        EvidenceClass.ORCHESTRATION_PATTERN,
+        "def chief_justice_node{n}() applies synthesis rules",
+        "src/nodes/justice.py",
+    ),
+    (910, EvidenceClass.ORCHESTRATION_PATTERN, "Call to helper_{n}() in compute_{n}", "src/pkg{m}/module_{n}.py"),
+]
+
+
+def _ev(eid, source, ev_class, content, location):
+    return Evidence(
+        evidence_id=eid,
+        source=source,
+        evidence_class=ev_class,
+        goal="benchmark",
+        found=True,
+        content=content,
+        location=location,
+        rationale="synthetic",
+        confidence=0.9,
+        timestamp=datetime(2024, 1, 1),
+    )
+
+
+def _synthetic_evidence() -> dict[str, list[Evidence]]:
+    """A large-repository audit: 200 commits, 1000 AST findings, 60 doc chunks, 5 diagrams."""
+    repo = [
+        _ev(f"repo_git_{i}", "repo", EvidenceClass.GIT_FORENSIC, f"commit {i:07x}: update module {i}", "git log")
+        for i in range(200)
+    ]
+    i = 0
+    for count, ev_class, template, location in AST_PATTERNS:
+        for _ in range(count):
+            content, loc = template.format(n=i), location.format(n=i, m=i % 40)
+            repo.append(_ev(f"repo_ast_{i}", "repo", ev_class, content, loc))
+            i += 1
+    docs = [
+        _ev(
+            f"docs_chunk_{i}",
+            "docs",
+            EvidenceClass.DOCUMENT_CLAIM,
+            f"Section {i}: the architecture report discusses agent {i} responsibilities.",
+            f"page {i // 4 + 1}",
+        )
+        for i in range(60)
+    ]
+    vision = [
+        _ev(f"vision_{i}", "vision", EvidenceClass.DOCUMENT_CLAIM, "Diagram shows parallel detectives", f"page {i}")
+        for i in range(5)
+    ]
+    return {"repo": repo, "docs": docs, "vision": vision}
+
+
+def test_evidence_routing_token_reduction():
+    """Prompt evidence tokens per judicial call drop several-fold with relevance slicing."""
+    dimensions = json.loads(RUBRIC_PATH.read_text(encoding="utf-8"))["dimensions"]
+    evidences = _synthetic_evidence()
+    router = EvidenceRouter(evidences)
+
+    before = estimate_tokens(_format_evidence(evidences)) * len(dimensions)
+    after = sum(estimate_tokens(_format_evidence(router.route(dim))) for dim in dimensions)
+
+    print(
+        f"\nEvidence tokens per audit pass ({len(dimensions)} dims): before={before} after={after} "
+        f"(avg/call {before // len(dimensions)} -> {after // len(dimensions)}, {before / after:.1f}x)",
+    )
+    assert before / after >= 3.0
@@ -0,0 +1,65 @@
+import pytest
+
+from src.config import judicial_settings
+from src.judicial.criterion_tracker import release_criterion_tracker
+from src.judicial.evidence_store import release_evidence_store
+from src.state import JudicialOpinion
+from src.utils.run_metrics import release_run_metrics
+
+RUN_ID = "run-unit"
+
+
+def _opinion(
+    judge: str,
+    criterion: str,
+    score: int,
+    suffix: str = "",
+    *,
+    argument: str = "rationale",
+    cited: tuple[str, ...] | list[str] = (),
+) -> JudicialOpinion:
+    return JudicialOpinion(
+        opinion_id=f"{judge}_{criterion}{suffix}",
+        judge=judge,
+        criterion_id=criterion,
+        score=score,
+        argument=argument,
+        cited_evidence=list(cited),
+    )
+
+
+@pytest.fixture
+def make_opinion():
+    """JudicialOpinion factory with deterministic ids: `<judge>_<criterion><suffix>`."""
+    return _opinion
+
+
+@pytest.fixture
+def run_settings() -> dict:
+    """judicial_settings overrides applied by `state`; override (or parametrize) per module."""
+    return {}
+
+
+@pytest.fixture
+def run_evidences() -> dict:
+    """Evidence of the `state` run; override per module."""
+    return {}
+
+
+@pytest.fixture
+def state(monkeypatch, run_settings, run_evidences):
+    """Two-criterion judicial run; its per-run registries are released on teardown."""
+    for name, value in run_settings.items():
+        monkeypatch.setattr(judicial_settings, name, value)
+    yield {
+        "rubric_dimensions": [{"id": "crit1", "name": "One"}, {"id": "crit2", "name": "Two"}],
+        "evidences": run_evidences,
+        "opinions": [],
+        "criterion_results": {},
+        "errors": [],
+        "metadata": {"correlation_id": RUN_ID},
+        "re_eval_count": 0,
+    }
+    release_criterion_tracker(RUN_ID)
+    release_evidence_store(RUN_ID)
+    release_run_metrics(RUN_ID)
@@ -0,0 +1,163 @@
+import asyncio
+
+import pytest
+
+from src.config import JudicialSettings, judicial_settings
+from src.nodes.judicial_nodes import (
+    AdaptiveLimit,
+    ConcurrencyController,
+    bounded_llm_call,
+    is_throttle_error,
+    reset_concurrency_controller,
+)
+from src.utils.concurrency_tuner import default_levels, tune_concurrency
+from src.utils.llm_streaming import StreamStalledError
+from src.utils.orchestration import reset_circuit_breakers, reset_rate_limiters
+
+
+class FakeHTTPError(Exception):
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        super().__init__(f"HTTP {status_code}")
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    reset_concurrency_controller()
+    reset_rate_limiters()
+    reset_circuit_breakers()
+    yield
+    reset_concurrency_controller()
+    reset_rate_limiters()
+    reset_circuit_breakers()
+
+
+def _saturate(window: AdaptiveLimit) -> None:
+    window._in_flight = window.limit
+
+
+def test_additive_increase_only_when_saturated_and_healthy():
+    window = AdaptiveLimit("ollama:local", initial=2, minimum=1, maximum=8)
+    for _ in range(10):
+        window.record("ok", 1.0)  # window idle: no growth
+    assert window.limit == 2
+
+    for _ in range(20):
+        _saturate(window)
+        window.record("ok", 1.0)
+    assert 4 <= window.limit <= 8
+
+    before = window.limit
+    _saturate(window)
+    window.record("ok", 5.0)  # far above the latency baseline: hold
+    assert window.limit == before
+
+
+def test_multiplicative_decrease_once_per_round_trip():
+    window = AdaptiveLimit("google:gemini", initial=8, minimum=1, maximum=8)
+    window.record("throttled", 0.2)
+    window.record("throttled", 0.2)  # same burst: ignored
+    assert window.limit == 4
+    window._last_decrease -= 5
+    window.record("timeout", 0.2)
+    assert window.limit == 2
+    assert [h["reason"] for h in window.history] == ["initial", "throttled", "timeout"]
+    assert window.snapshot()["history"][-1]["limit"] == 2
+
+
+def test_throttle_detection():
+    assert is_throttle_error(FakeHTTPError(429))
+    assert is_throttle_error(RuntimeError("429 RESOURCE_EXHAUSTED: quota"))
+    assert not is_throttle_error(ValueError("bad schema"))
+
+
+async def test_bounded_call_feeds_endpoint_window(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "adaptive_concurrency_enabled", True)
+    controller = ConcurrencyController(max_concurrent=8)
+    settings = JudicialSettings(retry_max_attempts=2, retry_initial_delay=0.01, retry_max_delay=0.02)
+    calls = 0
+
+    async def throttled_once():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise FakeHTTPError(429)
+        return "ok"
+
+    result = await bounded_llm_call(
+        controller,
+        "Defense",
+        "DIM1",
+        throttled_once,
+        settings=settings,
+        retryable_exceptions=(FakeHTTPError,),
+        provider="google",
+        model="gemini",
+    )
+    assert result == "ok"
+    snapshot = controller.snapshot()["endpoints"]["google:gemini"]
+    # Starts at half the cap (4), halved by the 429
+    assert snapshot["limit"] == 2
+    assert snapshot["in_flight"] == 0
+
+
+@pytest.mark.parametrize(("phase", "limit"), [("first_token", 4), ("stall", 2)])
+async def test_only_mid_stream_stalls_shrink_the_window(monkeypatch, phase, limit):
+    monkeypatch.setattr(judicial_settings, "adaptive_concurrency_enabled", True)
+    controller = ConcurrencyController(max_concurrent=8)
+    settings = JudicialSettings(retry_max_attempts=2, retry_initial_delay=0.01, retry_max_delay=0.02)
+    calls = 0
+
+    async def stalled_once():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise StreamStalledError(1.0, phase)
+        return "ok"
+
+    result = await bounded_llm_call(
+        controller,
+        "Defense",
+        "DIM1",
+        stalled_once,
+        settings=settings,
+        retryable_exceptions=(TimeoutError,),
+        provider="google",
+        model="gemini",
+    )
+    assert result == "ok"
+    # A slow prefill is not endpoint pressure; a stall mid-completion is
+    assert controller.snapshot()["endpoints"]["google:gemini"]["limit"] == limit
+
+
+def test_default_window_starts_below_cap_and_can_grow(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "adaptive_concurrency_enabled", True)
+    monkeypatch.setattr(judicial_settings, "adaptive_concurrency_initial", None)
+    window = ConcurrencyController(max_concurrent=8).window("ollama:local")
+    assert window.limit == 4
+
+    # An under-utilized fast endpoint earns slots up to the cap
+    for _ in range(100):
+        _saturate(window)
+        window.record("ok", 1.0)
+    assert window.limit == 8
+
+
+async def test_tuner_finds_the_throughput_knee():
+    capacity = 4
+    in_flight = 0
+
+    async def endpoint():
+        nonlocal in_flight
+        in_flight += 1
+        try:
+            if in_flight > capacity:
+                raise FakeHTTPError(429)
+            await asyncio.sleep(0.01)
+        finally:
+            in_flight -= 1
+
+    report = await tune_concurrency(endpoint, default_levels(16), requests_per_level=16)
+    assert default_levels(16) == [1, 2, 4, 8, 16]
+    assert report.recommended_limit == 4
+    assert report.levels[-1].throttled > 0  # the sweep stopped at the first throttling level
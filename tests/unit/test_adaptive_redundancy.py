@@ -0,0 +1,130 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.config import judicial_settings
+from src.graph import chief_justice_update
+from src.nodes.judges import evaluate_criterion, execute_judicial_layer
+from src.nodes.justice import uncertain_judges
+from src.state import Evidence, EvidenceClass
+from src.utils.run_metrics import get_run_metrics
+
+FIRST_PASS = {
+    "crit1": {"Prosecutor": 2, "Defense": 5, "TechLead": 3},
+    "crit2": {"Prosecutor": 4, "Defense": 4, "TechLead": 4},
+}
+REPLICA_SCORES = {1: 3, 2: 3, 3: 3, 4: 3}
+CITED = ("repo_orch_0",)
+
+
+@pytest.fixture
+def run_settings():
+    return {
+        "streaming_synthesis_enabled": True,
+        "adaptive_redundancy_enabled": True,
+        "batching_enabled": False,
+        "judicial_redundancy_factor": 3,
+    }
+
+
+@pytest.fixture
+def fake_judge(make_opinion):
+    async def judge_criterion(task):
+        judge, criterion, replica = task["judge_name"], task["criterion_id"], task.get("replica", 0)
+        judge_criterion.models.append((replica, task.get("model_override")))
+        if replica:
+            return {
+                "opinions": [make_opinion(judge, criterion, REPLICA_SCORES[replica], f"_rep{replica}", cited=CITED)]
+            }
+        return {"opinions": [make_opinion(judge, criterion, FIRST_PASS[criterion][judge], cited=CITED)]}
+
+    # (replica, model override) of every call
+    judge_criterion.models = []
+    return judge_criterion
+
+
+def test_uncertain_judges(make_opinion):
+    assert uncertain_judges(
+        [make_opinion("Prosecutor", "c", 2), make_opinion("Defense", "c", 5), make_opinion("TechLead", "c", 3)]
+    ) == ["Defense"]
+    assert uncertain_judges([make_opinion("Prosecutor", "c", 4), make_opinion("Defense", "c", 4)]) == []
+    failed = make_opinion("TechLead", "c", 3, argument="System Error: Judicial evaluation failed after retries.")
+    assert uncertain_judges([make_opinion("Prosecutor", "c", 4), failed]) == ["TechLead"]
+
+
+async def test_replicas_only_for_uncertain_judges_until_quorum(state, fake_judge):
+    sends = execute_judicial_layer(state)
+    assert len(sends) == 6  # one instance per judge, not three
+
+    with patch("src.nodes.judges._judge_criterion", side_effect=fake_judge) as judge:
+        updates = [await evaluate_criterion(s.arg) for s in sends]
+
+    # Defense on crit1 (5 against 2 and 3) gets replicas until two agree: 5, 3, 3
+    replica_ids = [op.opinion_id for u in updates for op in u["opinions"] if "_rep" in op.opinion_id]
+    assert replica_ids == ["Defense_crit1_rep1", "Defense_crit1_rep2"]
+    assert judge.call_count == 8
+
+    # Leader election runs among the agreeing replicas; the outvoted 5 is superseded
+    crit1 = next(u for u in updates if "crit1" in u.get("criterion_results", {}))["criterion_results"]["crit1"]
+    assert "LEADER_ELECTION_DEFENSE" in crit1.applied_rules
+    assert crit1.execution_log["raw_scores"]["Defense"] == 3
+    assert crit1.execution_log["superseded_opinions"] == ["Defense_crit1"]
+    assert not crit1.re_evaluation_required
+
+    # The Chief Justice barrier recognises the streamed verdict
+    state["opinions"] = [op for u in updates for op in u["opinions"]]
+    state["criterion_results"] = {k: v for u in updates for k, v in u.get("criterion_results", {}).items()}
+    assert chief_justice_update(state)["criterion_results"]["crit1"] is crit1
+
+    metrics = get_run_metrics(state["metadata"]["correlation_id"])
+    assert metrics.get("redundancy.replicas") == 2
+    assert metrics.get("redundancy.replicas_avoided") == 10  # of the 12 a static factor of 3 launches
+    assert metrics.get("redundancy.criteria") == 1
+
+
+async def test_quorum_exits_early(state, fake_judge):
+    REPLICA_SCORES[1] = 5
+    try:
+        sends = execute_judicial_layer(state)
+        with patch("src.nodes.judges._judge_criterion", side_effect=fake_judge) as judge:
+            for s in sends:
+                await evaluate_criterion(s.arg)
+        # The first replica agrees with Defense's 5: the third instance never runs (the
+        # confirmed outlier then goes through the usual re-evaluation)
+        assert judge.call_count == 8
+        assert get_run_metrics(state["metadata"]["correlation_id"]).get("redundancy.replicas") == 1
+    finally:
+        REPLICA_SCORES[1] = 3
+
+
+@pytest.mark.parametrize(("max_variance", "replica_model"), [(4, "small-model"), (1, None)])
+async def test_replicas_run_on_the_model_of_the_opinions_they_check(
+    state, fake_judge, monkeypatch, max_variance, replica_model
+):
+    monkeypatch.setattr(judicial_settings, "cascade_enabled", True)
+    monkeypatch.setattr(judicial_settings, "cascade_model", "small-model")
+    monkeypatch.setattr(judicial_settings, "cascade_max_variance", max_variance)
+    state["evidences"] = {
+        "repo": [
+            Evidence(
+                evidence_id="repo_orch_0",
+                source="repo",
+                evidence_class=EvidenceClass.ORCHESTRATION_PATTERN,
+                goal="test",
+                found=True,
+                content="StateGraph add_edge fan-out",
+                location="src/graph.py",
+                rationale="test",
+                confidence=0.9,
+                timestamp=datetime.now(),
+            )
+        ]
+    }
+    sends = execute_judicial_layer(state)
+    with patch("src.nodes.judges._judge_criterion", side_effect=fake_judge):
+        for s in sends:
+            await evaluate_criterion(s.arg)
+
+    # Settled on the small model: its replicas stay there. Escalated: they use the judges' models
+    assert {model for replica, model in fake_judge.models if replica} == {replica_model}
@@ -0,0 +1,91 @@
+from datetime import UTC, datetime
+
+from src.nodes.evidence_compactor import compact_evidences, compactor_node
+from src.nodes.justice import synthesize_criterion
+from src.state import REPLACE_EVIDENCES, Evidence, EvidenceClass, merge_evidences
+
+
+def _evidence(
+    id: str,
+    content: str,
+    location: str = "src/graph.py:1",
+    evidence_class: EvidenceClass = EvidenceClass.ORCHESTRATION_PATTERN,
+    found: bool = True,
+) -> Evidence:
+    return Evidence(
+        evidence_id=id,
+        source="repo",
+        evidence_class=evidence_class,
+        goal="Audit architectural patterns in source code",
+        found=found,
+        content=content,
+        location=location,
+        rationale="Extracted from AST",
+        confidence=1.0,
+        timestamp=datetime.now(UTC),
+    )
+
+
+def _repo() -> list[Evidence]:
+    items = [_evidence(f"repo_ast_{i}", f"FunctionDef fn_{i}", f"src/graph.py:{i}") for i in range(10)]
+    items.insert(3, _evidence("repo_ast_class", "ClassDef Graph"))
+    items.append(_evidence("repo_safety_0", "Found: os.system", evidence_class=EvidenceClass.SECURITY_VIOLATION))
+    items.append(_evidence("repo_ast_other", "FunctionDef main", "src/main.py:3"))
+    items.append(_evidence("repo_missing", "FunctionDef ghost", found=False))
+    return items
+
+
+def test_repetitive_findings_collapse_into_one_cluster():
+    compacted, aliases = compact_evidences({"repo": _repo()}, min_cluster=4, samples=2)
+
+    ids = [e.evidence_id for e in compacted["repo"]]
+    cluster_id = aliases["repo_ast_0"]
+    # The cluster takes its first member's place; everything else is kept verbatim and in order
+    assert ids == [cluster_id, "repo_ast_class", "repo_safety_0", "repo_ast_other", "repo_missing"]
+    assert set(aliases) == {f"repo_ast_{i}" for i in range(10)}
+    cluster = compacted["repo"][0]
+    assert cluster.content.startswith(
+        "10 x 'FunctionDef' findings in src/graph.py. Samples: repo_ast_0: FunctionDef fn_0"
+    )
+    assert cluster.content.endswith("(+8 more)")
+    assert cluster.found
+    assert cluster.location == "src/graph.py"
+
+
+def test_commits_stay_verbatim():
+    commits = [
+        _evidence(f"repo_git_{i}", f"commit {i}: step {i}", f"abc{i}", EvidenceClass.GIT_FORENSIC) for i in range(6)
+    ]
+    compacted, aliases = compact_evidences({"repo": commits}, min_cluster=4, samples=2)
+    assert compacted["repo"] == commits
+    assert aliases == {}
+
+
+def test_replacement_marker_overrides_the_merge_reducer():
+    existing = {"repo": _repo(), "docs": []}
+    compacted, _aliases = compact_evidences(existing, min_cluster=4, samples=2)
+    merged = merge_evidences(existing, {REPLACE_EVIDENCES: True, **compacted})
+    assert REPLACE_EVIDENCES not in merged
+    assert len(merged["repo"]) == 5
+    # Without the marker the reducer keeps merging by id
+    assert len(merge_evidences(existing, compacted)["repo"]) == 15
+
+
+def test_member_citations_resolve_through_aliases(make_opinion):
+    state = {"evidences": {"repo": _repo()}, "metadata": {"correlation_id": "run-compact"}}
+    update = compactor_node(state)
+    evidences = merge_evidences(state["evidences"], update["evidences"])
+    opinions = [make_opinion(judge, "c", 4, cited=["repo_ast_7"]) for judge in ("Prosecutor", "Defense", "TechLead")]
+
+    result = synthesize_criterion("c", "C", opinions, evidences, update["evidence_aliases"])
+    assert "FACT_SUPREMACY_PENALTY" not in result.applied_rules
+    # The security finding stays verbatim, so the override still fires
+    assert "SECURITY_OVERRIDE" in result.applied_rules
+
+    unresolved = synthesize_criterion("c", "C", opinions, evidences)
+    assert "FACT_SUPREMACY_PENALTY" in unresolved.applied_rules
+
+
+def test_nothing_to_compact_leaves_state_untouched():
+    state = {"evidences": {"repo": _repo()[:3]}, "metadata": {}}
+    assert compactor_node(state) == {}
@@ -0,0 +1,105 @@
+from collections import Counter
+from datetime import datetime
+
+import pytest
+
+from src.judicial import evidence_index
+from src.judicial.evidence_index import BM25Index
+from src.judicial.evidence_router import EvidenceRouter, term_counts
+from src.state import Evidence, EvidenceClass
+
+
+def _ev(eid, ev_class, content, *, found=True):
+    return Evidence(
+        evidence_id=eid,
+        source="repo",
+        evidence_class=ev_class,
+        goal="test",
+        found=found,
+        content=content,
+        location="src/x.py",
+        rationale="test",
+        confidence=0.9,
+        timestamp=datetime.now(),
+    )
+
+
+def _ids(sliced):
+    return {e.evidence_id for items in sliced.values() for e in items}
+
+
+SECURITY = _ev("repo_sec_0", EvidenceClass.SECURITY_VIOLATION, "os.system call")
+
+DOCS = [
+    term_counts("commit init project"),
+    term_counts("bulk upload of all files in one commit"),
+    term_counts("StateGraph add_edge fan-out"),
+    term_counts("commit add tests"),
+]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_bm25_ranks_rarer_and_repeated_terms_first(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(evidence_index, "np", None)
+    index = BM25Index(DOCS)
+    results = index.search({"bulk", "upload", "commit"})
+
+    assert set(results) == {0, 1, 3}
+    assert results[1][1] == 3  # matched query terms
+    assert BM25Index.top_k(results, 2) == [1, 0]
+    assert BM25Index.top_k(results, 5, candidates=[3, 2]) == [3]
+    assert index.search({"missing"}) == {}
+
+
+def test_numpy_and_fallback_scores_agree(monkeypatch):
+    vectorized = BM25Index(DOCS).search({"commit", "fan", "out"})
+    monkeypatch.setattr(evidence_index, "np", None)
+    fallback = BM25Index(DOCS).search({"commit", "fan", "out"})
+    assert vectorized.keys() == fallback.keys()
+    for doc, (score, hits) in fallback.items():
+        assert vectorized[doc][0] == pytest.approx(score)
+        assert vectorized[doc][1] == hits
+
+
+def test_failure_pattern_selects_evidence():
+    """success_pattern / failure_pattern vocabulary reaches the retrieval query."""
+    dim = {"id": "history", "name": "History", "target_artifact": "github_repo", "failure_pattern": "bulk upload"}
+    evidences = {
+        "repo": [
+            _ev("repo_orch_0", EvidenceClass.ORCHESTRATION_PATTERN, "StateGraph add_edge fan-out"),
+            _ev("repo_note", EvidenceClass.ORCHESTRATION_PATTERN, "bulk upload"),
+        ]
+    }
+    assert "repo_note" in _ids(EvidenceRouter(evidences).route(dim))
+
+
+def test_top_k_caps_term_matches_only():
+    # "graph" is carried by 8 of 40 findings, so it stays below the common-term cutoff
+    findings = [
+        _ev(
+            f"repo_ast_{i}",
+            EvidenceClass.ORCHESTRATION_PATTERN,
+            f"helper_{i} call" + " graph" * (i % 5 == 0) * (1 + i % 3),
+        )
+        for i in range(40)
+    ]
+    evidences = {"repo": [*findings, SECURITY]}
+    dim = {
+        "id": "graph_orchestration",
+        "name": "Graph",
+        "target_artifact": "github_repo",
+        "forensic_instruction": "graph",
+    }
+
+    capped = _ids(EvidenceRouter(evidences, top_k=5).route(dim))
+    assert "repo_sec_0" in capped  # security findings are always routed
+    assert len(capped - {"repo_sec_0"}) == 5
+    assert len(_ids(EvidenceRouter(evidences).route(dim))) > len(capped)
+
+
+def test_term_counts_match_extracted_terms():
+    counts = term_counts("os.system call in src/tools.py calls call")
+    assert counts["call"] == 2
+    assert "os.system" in counts
+    assert isinstance(counts, Counter)
@@ -0,0 +1,90 @@
+import datetime
+
+from src.config import judicial_settings
+from src.judicial.evidence_packer import pack_evidence
+from src.judicial.evidence_store import dimension_ref, get_evidence_store, release_evidence_store
+from src.nodes.judges import JudicialTask, _evidence_line, _evidence_text, _format_evidence
+from src.state import Evidence, EvidenceClass
+from src.utils.run_metrics import get_run_metrics, release_run_metrics
+from src.utils.tokens import estimate_tokens
+
+# No target artifact: the routed slice is all evidence
+DIMENSION = {"id": "state_management", "name": "State Management"}
+
+
+def _evidence(i: int, ev_class: EvidenceClass, content: str, confidence: float = 0.5) -> Evidence:
+    return Evidence(
+        evidence_id=f"repo_{i}",
+        source="repo",
+        evidence_class=ev_class,
+        goal="x",
+        found=True,
+        content=content,
+        location="src/module.py",
+        rationale="x",
+        confidence=confidence,
+        timestamp=datetime.datetime.now(),
+    )
+
+
+def _findings(n: int) -> dict[str, list[Evidence]]:
+    items = [_evidence(i, EvidenceClass.ORCHESTRATION_PATTERN, f"call site {i} in helper") for i in range(n)]
+    items.insert(n // 2, _evidence(900, EvidenceClass.SECURITY_VIOLATION, "os.system call", 0.9))
+    items.insert(n // 3, _evidence(901, EvidenceClass.ORCHESTRATION_PATTERN, "AgentState reducer state", 0.9))
+    return {"repo": items}
+
+
+def test_estimate_is_model_aware():
+    text = "x" * 400
+    assert estimate_tokens(text) == estimate_tokens(text, "gemini-2.5-flash") == 101
+    assert estimate_tokens(text, "qwen2.5-coder:7b") > estimate_tokens(text)
+
+
+def test_slice_within_budget_is_rendered_unchanged():
+    evidences = _findings(3)
+    text, stats = pack_evidence(evidences, 10_000, _evidence_line, [DIMENSION])
+    assert text == _format_evidence(evidences)
+    assert stats.dropped == 0
+
+
+def test_over_budget_keeps_high_priority_items_in_order():
+    evidences = _findings(200)
+    text, stats = pack_evidence(evidences, 400, _evidence_line, [DIMENSION])
+
+    assert stats.tokens <= 400
+    assert stats.dropped == 202 - stats.kept
+    assert stats.dropped_by_class == {"ORCHESTRATION_PATTERN": stats.dropped}
+    # Security findings and items relevant to the criterion survive; order is preserved
+    kept_ids = [line.split(" | ")[0].removeprefix("- ID: ") for line in text.splitlines() if line.startswith("- ID")]
+    assert {"repo_900", "repo_901"} <= set(kept_ids)
+    assert kept_ids.index("repo_901") < kept_ids.index("repo_900")
+    assert text.rstrip().endswith("they cannot be cited.")
+    assert f"OMITTED: {stats.dropped} lower-priority evidence items (ORCHESTRATION_PATTERN: {stats.dropped})" in text
+
+
+def test_judicial_prompt_records_omissions(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "prompt_token_budget", 500)
+    monkeypatch.setattr(judicial_settings, "prompt_reserve_tokens", 100)
+    store = get_evidence_store("run-pack")
+    store.publish(_findings(200), [DIMENSION])
+    task = JudicialTask(
+        judge_name="Defense",
+        criterion_id="state_management",
+        criterion_description="",
+        correlation_id="run-pack_r0",
+        run_id="run-pack",
+        evidence_ref=dimension_ref("state_management"),
+    )
+    try:
+        first = _evidence_text(task, "gemini-2.5-flash")
+        assert "OMITTED" in first
+        assert _evidence_text(task, "gemini-2.5-flash") is first  # memoized per model budget
+        assert estimate_tokens(first, "gemini-2.5-flash") <= 400
+        assert "OMITTED" not in _evidence_text(task)  # no model: no budget
+
+        omission = store.omissions()["dim:state_management@gemini-2.5-flash"]
+        assert omission["dropped"] > 0
+        assert get_run_metrics("run-pack").get("evidence_budget.dropped_items") == omission["dropped"]
+    finally:
+        release_evidence_store("run-pack")
+        release_run_metrics("run-pack")
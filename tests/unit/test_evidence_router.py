@@ -0,0 +1,84 @@
+from datetime import datetime
+
+from src.judicial.evidence_router import EvidenceRouter, extract_terms
+from src.state import Evidence, EvidenceClass
+
+
+def _ev(eid, source, ev_class, content, *, location="src/x.py", found=True):
+    return Evidence(
+        evidence_id=eid,
+        source=source,
+        evidence_class=ev_class,
+        goal="test",
+        found=found,
+        content=content,
+        location=location,
+        rationale="test",
+        confidence=0.9,
+        timestamp=datetime.now(),
+    )
+
+
+EVIDENCES = {
+    "repo": [
+        _ev("repo_git_0", "repo", EvidenceClass.GIT_FORENSIC, "commit a1: init project", location="git log"),
+        _ev("repo_state_0", "repo", EvidenceClass.STATE_MANAGEMENT, "AgentState TypedDict with reducers"),
+        _ev("repo_orch_0", "repo", EvidenceClass.ORCHESTRATION_PATTERN, "StateGraph add_edge fan-out"),
+        _ev("repo_sec_0", "repo", EvidenceClass.SECURITY_VIOLATION, "os.system call", location="src/tools.py"),
+    ],
+    "docs": [
+        _ev("docs_claim_0", "docs", EvidenceClass.DOCUMENT_CLAIM, "The report claims dialectical synthesis"),
+    ],
+}
+
+GIT_DIM = {
+    "id": "git_forensic_analysis",
+    "name": "Git Forensic Analysis",
+    "target_artifact": "github_repo",
+    "forensic_instruction": "Run git log and count the commits.",
+}
+
+DOC_DIM = {
+    "id": "theoretical_depth",
+    "name": "Theoretical Depth",
+    "target_artifact": "pdf_report",
+    "forensic_instruction": "Search the report for Dialectical Synthesis.",
+}
+
+
+def _ids(sliced):
+    return {e.evidence_id for items in sliced.values() for e in items}
+
+
+def test_route_selects_dimension_slice():
+    """Only the target artifact's relevant evidence (plus security findings) reaches the judge."""
+    router = EvidenceRouter(EVIDENCES)
+
+    assert _ids(router.route(GIT_DIM)) == {"repo_git_0", "repo_sec_0"}
+    assert _ids(router.route(DOC_DIM)) == {"docs_claim_0"}
+
+
+def test_route_without_target_artifact_returns_everything():
+    """Dimensions without routing information keep the legacy full-evidence behaviour."""
+    router = EvidenceRouter(EVIDENCES)
+    assert router.route({"id": "custom", "name": "Custom"}) is EVIDENCES
+
+
+def test_route_falls_back_to_whole_artifact_when_nothing_matches():
+    router = EvidenceRouter(EVIDENCES)
+    dim = {"id": "zzz", "name": "Quux", "target_artifact": "pdf_report", "forensic_instruction": "Blorp."}
+    assert _ids(router.route(dim)) == {"docs_claim_0"}
+
+
+def test_route_many_is_union_in_original_order():
+    router = EvidenceRouter(EVIDENCES)
+    sliced = router.route_many([DOC_DIM, GIT_DIM])
+    assert [e.evidence_id for e in sliced["repo"]] == ["repo_git_0", "repo_sec_0"]
+    assert _ids(sliced) == {"repo_git_0", "repo_sec_0", "docs_claim_0"}
+
+
+def test_extract_terms_drops_stopwords_and_short_tokens():
+    terms = extract_terms("Verify the AgentState in src/state.py is a TypedDict")
+    assert {"agentstate", "typeddict", "src/state.py"} <= terms
+    assert "the" not in terms
+    assert "is" not in terms
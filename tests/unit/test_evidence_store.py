@@ -0,0 +1,191 @@
+import datetime
+import pickle
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.exceptions import EvidenceUnavailableError
+from src.judicial.evidence_store import (
+    ALL_EVIDENCE,
+    dimension_ref,
+    get_evidence_store,
+    release_evidence_store,
+)
+from src.nodes.judges import (
+    JudicialTask,
+    _evidence_text,
+    _format_evidence,
+    evaluate_criterion,
+    execute_judicial_layer,
+)
+from src.state import Evidence, EvidenceClass, JudicialOpinion
+
+
+def _evidence(i: int, source: str = "repo") -> Evidence:
+    return Evidence(
+        evidence_id=f"{source}_{i}",
+        source=source,
+        evidence_class=EvidenceClass.GIT_FORENSIC if source == "repo" else EvidenceClass.DOCUMENT_CLAIM,
+        goal="x",
+        found=True,
+        content=f"commit {i} history" if source == "repo" else f"report claim {i}",
+        location="git log" if source == "repo" else "page 1",
+        rationale="x",
+        confidence=0.9,
+        timestamp=datetime.datetime.now(),
+    )
+
+
+DIMENSIONS = [
+    {"id": "git_forensic_analysis", "name": "Git Forensic Analysis", "target_artifact": "github_repo"},
+    {"id": "report_accuracy", "name": "Report Accuracy", "target_artifact": "pdf_report"},
+]
+
+
+def _state(n_items: int, run_id: str) -> dict:
+    return {
+        "rubric_dimensions": DIMENSIONS,
+        "evidences": {
+            "repo": [_evidence(i) for i in range(n_items)],
+            "docs": [_evidence(i, "docs") for i in range(n_items)],
+        },
+        "metadata": {"correlation_id": run_id},
+    }
+
+
+def test_send_payloads_carry_references_not_evidence():
+    """Per-task payload size does not grow with the amount of evidence."""
+    small = execute_judicial_layer(_state(1, "run-small"))
+    large = execute_judicial_layer(_state(500, "run-large"))
+
+    assert all("evidences" not in s.arg for s in large)
+    assert {s.arg["evidence_ref"] for s in large} == {dimension_ref(d["id"]) for d in DIMENSIONS}
+    assert max(len(pickle.dumps(s.arg)) for s in large) <= max(len(pickle.dumps(s.arg)) for s in small) + 16
+
+    release_evidence_store("run-small")
+    release_evidence_store("run-large")
+
+
+def test_store_resolves_routed_slices():
+    store = get_evidence_store("run-slices")
+    state = _state(3, "run-slices")
+    store.publish(state["evidences"], DIMENSIONS)
+
+    assert store.resolve(ALL_EVIDENCE) is state["evidences"]
+    assert set(store.resolve(dimension_ref("git_forensic_analysis"))) == {"repo"}
+    assert set(store.resolve(dimension_ref("report_accuracy"))) == {"docs"}
+    assert store.resolve(dimension_ref("unknown_dim")) is None
+
+    release_evidence_store("run-slices")
+    assert get_evidence_store("run-slices").resolve(ALL_EVIDENCE) is None
+
+
+@patch("src.nodes.judges.bounded_llm_call")
+@patch("src.nodes.judges.get_concurrency_controller")
+async def test_evaluate_criterion_dereferences_evidence(mock_controller, mock_bounded):
+    mock_controller.return_value = MagicMock()
+    mock_bounded.return_value = JudicialOpinion(
+        opinion_id="x",
+        judge="Defense",
+        criterion_id="git_forensic_analysis",
+        score=4,
+        argument="ok",
+        cited_evidence=["repo_0"],
+    )
+    get_evidence_store("run-ref").publish(_state(2, "run-ref")["evidences"], DIMENSIONS)
+
+    with patch("src.nodes.judges._format_evidence", return_value="") as mock_format:
+        await evaluate_criterion(
+            JudicialTask(
+                judge_name="Defense",
+                criterion_id="git_forensic_analysis",
+                criterion_description="",
+                correlation_id="run-ref_r0",
+                run_id="run-ref",
+                evidence_ref=dimension_ref("git_forensic_analysis"),
+            ),
+        )
+
+    resolved = mock_format.call_args.args[0]
+    assert [e.evidence_id for e in resolved["repo"]] == ["repo_0", "repo_1"]
+    assert "docs" not in resolved
+    release_evidence_store("run-ref")
+
+
+def test_unresolved_reference_fails_the_task():
+    """A judge never evaluates an unpublished or unknown slice as if there were no evidence."""
+    task = JudicialTask(
+        judge_name="Defense",
+        criterion_id="git_forensic_analysis",
+        criterion_description="",
+        correlation_id="run-missing_r0",
+        run_id="run-missing",
+        evidence_ref=dimension_ref("git_forensic_analysis"),
+    )
+    with pytest.raises(EvidenceUnavailableError):
+        _evidence_text(task)
+
+    get_evidence_store("run-missing").publish(_state(1, "run-missing")["evidences"], DIMENSIONS)
+    with pytest.raises(EvidenceUnavailableError):
+        _evidence_text({**task, "evidence_ref": dimension_ref("unknown_dim")})
+    release_evidence_store("run-missing")
+
+
+def test_rendered_block_is_memoized_per_digest_and_slice():
+    """The evidence block is rendered once per slice and reused across tasks and unchanged re-publishes."""
+    store = get_evidence_store("run-render")
+    state = _state(3, "run-render")
+    store.publish(state["evidences"], DIMENSIONS)
+    renderer = MagicMock(side_effect=lambda ev: f"{sum(len(v) for v in ev.values())} items")
+    ref = dimension_ref("git_forensic_analysis")
+
+    assert store.render(ref, renderer) == "3 items"
+    assert store.render(ref, renderer) == "3 items"
+    # Re-evaluation pass with identical evidence content
+    store.publish(_state(3, "run-render")["evidences"], DIMENSIONS)
+    assert store.render(ref, renderer) == "3 items"
+    assert renderer.call_count == 1
+
+    store.publish(_state(4, "run-render")["evidences"], DIMENSIONS)
+    assert store.render(ref, renderer) == "4 items"
+    assert renderer.call_count == 2
+    # Blocks of the previous evidence digest are dropped, not kept forever
+    assert list(store._rendered) == [(store.digest, ref, "")]
+    release_evidence_store("run-render")
+
+
+def test_render_does_not_hold_the_store_lock():
+    """A slow render of one slice does not serialize the tasks rendering other slices."""
+    store = get_evidence_store("run-concurrent")
+    store.publish(_state(2, "run-concurrent")["evidences"], DIMENSIONS)
+    other_done = threading.Event()
+
+    def slow(_ev):
+        # Renders the other slice from a second thread while this render is in progress
+        worker = threading.Thread(
+            target=lambda: store.render(dimension_ref("report_accuracy"), fast) and other_done.set()
+        )
+        worker.start()
+        worker.join(timeout=2)
+        return "slow"
+
+    def fast(_ev):
+        return "fast"
+
+    assert store.render(dimension_ref("git_forensic_analysis"), slow) == "slow"
+    assert other_done.is_set()
+    release_evidence_store("run-concurrent")
+
+
+def test_format_evidence_renders_models_and_dicts():
+    ev = _evidence(7)
+    as_dict = {"evidence_id": "d1", "evidence_class": "GIT_FORENSIC", "confidence": 0.5, "content": "raw"}
+    text = _format_evidence({"repo": [ev], "docs": [as_dict]})
+
+    # Buckets are rendered in sorted order regardless of insertion order
+    assert text == (
+        "- ID: d1 | Class: GIT_FORENSIC | Confidence: 0.5\n  Content: raw\n"
+        "- ID: repo_7 | Class: GIT_FORENSIC | Confidence: 0.9\n  Content: commit 7 history\n"
+    )
+    assert _format_evidence({}) == "- NO_EVIDENCE: No evidence was found by detectives."
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from src.config import judicial_settings
+from src.nodes.judicial_nodes import ConcurrencyController, FairShareQueue, reset_concurrency_controller
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    reset_concurrency_controller()
+    yield
+    reset_concurrency_controller()
+
+
+async def test_deficit_round_robin_alternates_tenants():
+    queue = FairShareQueue()
+    for _ in range(4):
+        queue.push("large-audit", "first_pass")
+    queue.push("small-audit", "first_pass")
+    order = [queue.pop()[0] for _ in range(5)]
+    # The small audit queued after four calls of the large one is served second
+    assert order[:3] == ["large-audit", "small-audit", "large-audit"]
+    assert queue.pop() is None
+    assert queue.queued() == {}
+
+
+async def test_ineligible_tenants_are_passed_over():
+    queue = FairShareQueue()
+    queue.push("capped", "re_evaluation")
+    queue.push("other", "first_pass")
+    assert queue.pop(lambda tenant: tenant != "capped")[0] == "other"
+    assert queue.pop(lambda tenant: tenant != "capped") is None
+    assert queue.queued() == {"capped": 1}
+
+
+async def test_small_audit_is_not_starved_by_a_large_one():
+    controller = ConcurrencyController(max_concurrent=2)
+    served: list[str] = []
+
+    async def call(tenant: str) -> None:
+        await controller.acquire("Judge", "dim", tenant=tenant)
+        served.append(tenant)
+        await asyncio.sleep(0.005)
+        await controller.release("Judge", "dim", tenant=tenant)
+
+    large = [asyncio.create_task(call("large")) for _ in range(20)]
+    await asyncio.sleep(0)
+    small = [asyncio.create_task(call("small")) for _ in range(3)]
+    await asyncio.gather(*large, *small)
+    # All small-audit calls run within the first few slots freed after they queued
+    assert max(i for i, tenant in enumerate(served) if tenant == "small") < 8
+    assert controller.snapshot()["tenants"] == {}
+
+
+async def test_per_audit_in_flight_cap(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "max_in_flight_per_audit", 2)
+    controller = ConcurrencyController(max_concurrent=5)
+    peak = {"a": 0, "b": 0}
+    active = {"a": 0, "b": 0}
+
+    async def call(tenant: str) -> None:
+        await controller.acquire("Judge", "dim", tenant=tenant)
+        active[tenant] += 1
+        peak[tenant] = max(peak[tenant], active[tenant])
+        await asyncio.sleep(0.005)
+        active[tenant] -= 1
+        await controller.release("Judge", "dim", tenant=tenant)
+
+    tasks = [asyncio.create_task(call("a")) for _ in range(6)]
+    await asyncio.sleep(0)
+    assert controller.snapshot()["tenants"]["a"] == {"in_flight": 2, "queued": 4}
+    # Another audit still gets the free global slots
+    tasks += [asyncio.create_task(call("b")) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert controller.active_count == 4
+    await asyncio.gather(*tasks)
+    assert peak == {"a": 2, "b": 2}
+    assert not controller._semaphore.locked()
@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from src.config import JudicialSettings, judicial_settings
+from src.nodes.judicial_nodes import (
+    ConcurrencyController,
+    LatencyTracker,
+    bounded_llm_call,
+    first_valid,
+    reset_concurrency_controller,
+)
+from src.utils.orchestration import reset_rate_limiters
+from src.utils.run_metrics import get_run_metrics, release_run_metrics
+
+FAST = JudicialSettings(retry_max_attempts=1, llm_call_timeout=2.0)
+
+
+@pytest.fixture(autouse=True)
+def hedging(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "hedging_enabled", True)
+    monkeypatch.setattr(judicial_settings, "hedge_latency_percentile", 0.9)
+    monkeypatch.setattr(judicial_settings, "hedge_min_samples", 5)
+    monkeypatch.setattr(judicial_settings, "hedge_max_per_run", 1)
+    reset_concurrency_controller()
+    reset_rate_limiters()
+    yield
+    reset_concurrency_controller()
+    reset_rate_limiters()
+    release_run_metrics("run-hedge")
+
+
+def _warm(controller: ConcurrencyController, latency: float = 0.01) -> None:
+    for _ in range(10):
+        controller.latency("google", "gemini").record(latency)
+
+
+def test_latency_percentile_needs_enough_samples():
+    tracker = LatencyTracker()
+    for latency in (0.1, 0.2, 0.3, 0.4):
+        tracker.record(latency)
+    assert tracker.percentile(0.5, min_samples=5) is None
+    tracker.record(5.0)
+    assert tracker.percentile(0.5, min_samples=5) == 0.3
+    assert tracker.percentile(0.99, min_samples=5) == 5.0
+
+
+async def test_first_valid_skips_failures_and_cancels_the_loser():
+    async def fails():
+        raise ValueError("bad schema")
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    async def ok():
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    loser = asyncio.ensure_future(slow())
+    result, winner = await first_valid([asyncio.ensure_future(fails()), asyncio.ensure_future(ok()), loser])
+    assert result == "ok"
+    await asyncio.sleep(0)
+    assert loser.cancelled()
+
+
+async def _bounded(controller, primary, hedge):
+    return await bounded_llm_call(
+        controller,
+        "Defense",
+        "crit1",
+        primary,
+        settings=FAST,
+        provider="google",
+        model="gemini",
+        run_id="run-hedge",
+        hedge_callable=hedge,
+    )
+
+
+async def test_stuck_call_is_hedged_and_cancelled():
+    controller = ConcurrencyController(max_concurrent=2)
+    _warm(controller)
+    cancelled = asyncio.Event()
+
+    async def stuck():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def hedge():
+        return "hedged"
+
+    assert await asyncio.wait_for(_bounded(controller, stuck, hedge), timeout=1) == "hedged"
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    metrics = get_run_metrics("run-hedge")
+    assert metrics.get("hedge.requests") == 1
+    assert metrics.get("hedge.wins") == 1
+
+
+async def test_hedges_are_capped_per_run():
+    controller = ConcurrencyController(max_concurrent=2)
+    _warm(controller)
+    hedges = 0
+
+    async def slow():
+        await asyncio.sleep(0.1)
+        return "primary"
+
+    async def hedge():
+        nonlocal hedges
+        hedges += 1
+        await asyncio.sleep(1)
+        return "hedged"
+
+    assert await _bounded(controller, slow, hedge) == "primary"  # the hedge lost
+    assert await _bounded(controller, slow, hedge) == "primary"  # budget exhausted: no hedge
+    assert hedges == 1
+    assert get_run_metrics("run-hedge").get("hedge.wins") == 0
+
+
+async def test_no_hedging_without_latency_history():
+    controller = ConcurrencyController(max_concurrent=2)
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "primary"
+
+    async def hedge():
+        raise AssertionError("hedged without a latency baseline")
+
+    assert await _bounded(controller, slow, hedge) == "primary"
+    assert len(controller.latency("google", "gemini")) == 1
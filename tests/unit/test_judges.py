@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 from unittest.mock import MagicMock, patch
 
@@ -5,7 +6,9 @@ from src.nodes.judges import (
     DEFENSE_PHILOSOPHY,
     PROSECUTOR_PHILOSOPHY,
     TECHLEAD_PHILOSOPHY,
+    JudicialBatchTask,
     JudicialTask,
+    evaluate_batch_criterion,
     evaluate_criterion,
     execute_judicial_layer,
 )
@@ -134,3 +137,49 @@ async def test_evaluate_criterion_timeout_fallback(mock_controller, mock_bounded
     assert op.score == 3  # Fallback score
     assert "System Error" in op.argument
     assert op.judge == "TechLead"
+
+
+@patch("src.nodes.judges.get_concurrency_controller")
+async def test_batch_fallback_runs_dimensions_concurrently(mock_controller):
+    """FR-004: a failed batch falls back to concurrent per-dimension calls keeping the correlation id."""
+    mock_controller.return_value = MagicMock()
+    in_flight = peak = 0
+    seen_correlation_ids = []
+
+    async def fake_bounded(**kwargs):
+        nonlocal in_flight, peak
+        if kwargs["dimension"] == "BATCH":
+            raise RuntimeError("batch failed")
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return JudicialOpinion(
+            opinion_id="x",
+            judge="Defense",
+            criterion_id=kwargs["dimension"],
+            score=4,
+            argument="ok",
+            cited_evidence=[],
+        )
+
+    async def fake_criterion(task):
+        seen_correlation_ids.append(task["correlation_id"])
+        return await original_evaluate_criterion(task)
+
+    original_evaluate_criterion = evaluate_criterion
+    task = JudicialBatchTask(
+        judge_name="Defense",
+        dimensions=[{"id": f"dim{i}", "description": "d"} for i in range(4)],
+        correlation_id="run-batch_r0",
+        evidences=setup_mock_state()["evidences"],
+    )
+    with (
+        patch("src.nodes.judges.bounded_llm_call", side_effect=fake_bounded),
+        patch("src.nodes.judges.evaluate_criterion", side_effect=fake_criterion),
+    ):
+        result = await evaluate_batch_criterion(task)
+
+    assert sorted(op.criterion_id for op in result["opinions"]) == ["dim0", "dim1", "dim2", "dim3"]
+    assert peak == 4
+    assert seen_correlation_ids == ["run-batch_r0"] * 4
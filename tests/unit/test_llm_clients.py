@@ -0,0 +1,58 @@
+import asyncio
+
+from src.state import JudicialOutcome
+from src.utils import llm_clients
+from src.utils.llm_clients import clear_llm_clients, get_chat_model, get_structured_model
+
+
+def test_chat_models_are_pooled_per_key():
+    """Judges, criteria and retries share one client per (provider, model, temperature, options)."""
+    clear_llm_clients()
+    a = get_chat_model("ollama", "llama3", 0.0, base_url="http://localhost:11434")
+    b = get_chat_model("ollama", "llama3", 0.0, base_url="http://localhost:11434")
+    c = get_chat_model("ollama", "llama3", 0.7, base_url="http://localhost:11434")
+
+    assert a is b
+    assert a is not c
+    clear_llm_clients()
+
+
+def test_structured_wrappers_are_pooled_per_schema():
+    clear_llm_clients()
+    s1 = get_structured_model("ollama", "llama3", 0.0, JudicialOutcome, base_url="http://localhost:11434")
+    s2 = get_structured_model("ollama", "llama3", 0.0, JudicialOutcome, base_url="http://localhost:11434")
+
+    assert s1 is s2
+    clear_llm_clients()
+
+
+def test_call_options_reuse_the_pooled_client(monkeypatch):
+    """Per-run Gemini cache names are bound per call and never grow the client pool."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    clear_llm_clients()
+    first = get_structured_model(
+        "google", "gemini-2.5-flash", 0.0, JudicialOutcome, call_options={"cached_content": "a"}
+    )
+    second = get_structured_model(
+        "google", "gemini-2.5-flash", 0.0, JudicialOutcome, call_options={"cached_content": "b"}
+    )
+    plain = get_structured_model("google", "gemini-2.5-flash", 0.0, JudicialOutcome)
+
+    assert first.first.kwargs["cached_content"] == "a"
+    assert second.first.kwargs["cached_content"] == "b"
+    assert first.first.bound is second.first.bound is plain.first.bound
+    assert len(llm_clients._shared_pool) == 2  # one chat model, one structured wrapper
+    clear_llm_clients()
+
+
+def test_async_clients_are_pooled_per_event_loop():
+    """Async HTTP pools are loop-bound: each running loop gets its own instance."""
+    clear_llm_clients()
+
+    async def fetch():
+        return get_chat_model("ollama", "llama3", 0.0)
+
+    first, second = asyncio.run(fetch()), asyncio.run(fetch())
+    assert first is not second
+    assert get_chat_model("ollama", "llama3", 0.0) is get_chat_model("ollama", "llama3", 0.0)
+    clear_llm_clients()
@@ -0,0 +1,151 @@
+import asyncio
+import time
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import Field, ValidationError
+
+from src.config import judicial_settings
+from src.state import JudicialOutcome
+from src.utils.llm_streaming import (
+    IncrementalJSONParser,
+    StreamStalledError,
+    astream_structured,
+    first_token_timeout,
+    stream_structured,
+    stream_text,
+)
+from src.utils.run_metrics import get_run_metrics, release_run_metrics
+
+OUTCOME = (
+    '{"criterion_id": "c1", "judge": "Defense", "score": 4, '
+    '"argument": "uses {braces} and \\"quotes\\"", "cited_evidence": []}'
+)
+MESSAGES = [HumanMessage(content="Evaluate")]
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Streams fixed chunks, sleeping before the ones listed in `delays`."""
+
+    chunks: list[str]
+    delays: dict[int, float] = Field(default_factory=dict)
+    pulled: list[int] = Field(default_factory=list)
+    closed: bool = False
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="".join(self.chunks)))])
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        try:
+            for i, text in enumerate(self.chunks):
+                await asyncio.sleep(self.delays.get(i, 0))
+                self.pulled.append(i)
+                yield ChatGenerationChunk(message=AIMessageChunk(content=text))
+        finally:
+            # Stands for the provider's HTTP response being closed
+            self.closed = True
+
+
+def _structured(model: ScriptedChatModel):
+    return model | PydanticOutputParser(pydantic_object=JudicialOutcome)
+
+
+def _split(text: str, size: int = 7) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.fixture(autouse=True)
+def windows(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "llm_streaming_enabled", True)
+    monkeypatch.setattr(judicial_settings, "llm_first_token_timeout", 1.0)
+    monkeypatch.setattr(judicial_settings, "llm_stall_timeout", 0.05)
+    yield
+    release_run_metrics("run-stream")
+
+
+def test_parser_skips_prose_and_invalid_objects():
+    parser = IncrementalJSONParser(JudicialOutcome)
+    text = 'Sure! Here is an example: {"score": "n/a"}\n```json\n' + OUTCOME + "\n```\nHope this helps {"
+    results = [parser.feed(chunk) for chunk in _split(text, 3)]
+
+    outcome = next(r for r in results if r is not None)
+    assert outcome.argument == 'uses {braces} and "quotes"'
+    assert outcome.score == 4
+
+
+def test_parser_raises_validation_error_without_valid_object():
+    parser = IncrementalJSONParser(JudicialOutcome)
+    assert parser.feed('{"score": "n/a"} trailing') is None
+    with pytest.raises(ValidationError):
+        parser.finish()
+
+
+async def test_returns_once_object_closes_and_stops_stream():
+    # The rambling after the object would take 10s to arrive
+    model = ScriptedChatModel(chunks=[*_split(OUTCOME), " Also, note that", " ..."], delays={len(_split(OUTCOME)): 10})
+    start = time.perf_counter()
+    outcome = await astream_structured(_structured(model), JudicialOutcome, MESSAGES)
+
+    assert outcome.judge == "Defense"
+    assert time.perf_counter() - start < 1
+    assert len(model.pulled) == len(_split(OUTCOME))
+
+
+async def test_stall_raises_retryable_timeout():
+    model = ScriptedChatModel(chunks=_split(OUTCOME), delays={2: 1.0})
+    with pytest.raises(StreamStalledError) as info:
+        await astream_structured(_structured(model), JudicialOutcome, MESSAGES, run_id="run-stream")
+
+    assert isinstance(info.value, TimeoutError)
+    assert info.value.timeout_s == pytest.approx(0.05)
+    assert info.value.phase == "stall"
+    assert get_run_metrics("run-stream").get("llm_stream.stalls") == 1
+
+
+async def test_slow_prefill_is_a_first_token_stall():
+    model = ScriptedChatModel(chunks=_split(OUTCOME), delays={0: 1.5})
+    with pytest.raises(StreamStalledError) as info:
+        await astream_structured(_structured(model), JudicialOutcome, MESSAGES, run_id="run-stream")
+
+    assert info.value.phase == "first_token"
+    assert info.value.timeout_s == pytest.approx(1.0)
+    assert get_run_metrics("run-stream").get("llm_stream.first_token_stalls") == 1
+    assert get_run_metrics("run-stream").get("llm_stream.stalls") == 0
+
+
+def test_first_token_window_scales_with_call_timeout(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "llm_first_token_timeout", None)
+    monkeypatch.setattr(judicial_settings, "llm_first_token_share", 0.5)
+    monkeypatch.setattr(judicial_settings, "llm_call_timeout", 120.0)
+    assert first_token_timeout() == 60.0
+    # Batch and panel calls prefill far larger prompts within the batch budget
+    assert first_token_timeout(300.0) == 150.0
+
+
+async def test_disabled_streaming_uses_whole_call(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "llm_streaming_enabled", False)
+    model = ScriptedChatModel(chunks=_split(OUTCOME))
+    assert (await astream_structured(_structured(model), JudicialOutcome, MESSAGES)).score == 4
+    assert model.pulled == []
+
+
+def test_sync_streaming_for_worker_threads():
+    model = ScriptedChatModel(chunks=[*_split(OUTCOME), " trailing"], delays={len(_split(OUTCOME)): 10})
+    assert stream_structured(_structured(model), JudicialOutcome, MESSAGES).score == 4
+
+    assert stream_text(ScriptedChatModel(chunks=["a diagram ", "of the graph"]), MESSAGES) == "a diagram of the graph"
+
+    # The stalled read is cancelled: the provider stream is closed, not left to a stray thread
+    hung = ScriptedChatModel(chunks=["a", "b"], delays={1: 10})
+    with pytest.raises(StreamStalledError):
+        stream_text(hung, MESSAGES, run_id="run-stream")
+    assert hung.closed
+    assert hung.pulled == [0]
+    assert get_run_metrics("run-stream").get("llm_stream.stalls") == 1
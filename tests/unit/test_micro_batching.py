@@ -0,0 +1,95 @@
+import pytest
+
+from src.config import judicial_settings
+from src.judicial.batch_packer import MicroBatchSizer, get_batch_sizer, pack_criteria, prompt_budget, reset_batch_sizers
+from src.judicial.evidence_store import release_evidence_store
+from src.nodes.judges import execute_judicial_layer
+from src.utils.run_metrics import get_run_metrics, release_run_metrics
+
+DIMS = [{"id": f"dim{i}", "description": "d"} for i in range(5)]
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    reset_batch_sizers()
+    yield
+    reset_batch_sizers()
+
+
+def _ids(batches):
+    return [[d["id"] for d in batch] for batch in batches]
+
+
+def test_packs_in_order_within_prompt_budget():
+    costs = {"dim0": 300, "dim1": 300, "dim2": 900, "dim3": 100, "dim4": 100}
+    batches = pack_criteria(
+        DIMS,
+        costs,
+        base_tokens=100,
+        prompt_tokens=800,
+        response_tokens=4000,
+        response_tokens_per_criterion=400,
+        max_criteria=8,
+    )
+    # dim2 alone exceeds the budget and gets a batch of its own
+    assert _ids(batches) == [["dim0", "dim1"], ["dim2"], ["dim3", "dim4"]]
+
+
+def test_response_budget_and_cap_bound_batch_size():
+    unbounded = {"base_tokens": 0, "prompt_tokens": 10**6}
+    batches = pack_criteria(
+        DIMS, {}, **unbounded, response_tokens=800, response_tokens_per_criterion=400, max_criteria=8
+    )
+    assert _ids(batches) == [["dim0", "dim1"], ["dim2", "dim3"], ["dim4"]]
+    batches = pack_criteria(
+        DIMS, {}, **unbounded, response_tokens=10**6, response_tokens_per_criterion=1, max_criteria=1
+    )
+    assert len(batches) == 5
+
+
+def test_prompt_budget_respects_context_window(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "model_context_windows", {"ollama:small": 8192})
+    monkeypatch.setattr(judicial_settings, "micro_batch_response_tokens", 2000)
+    assert prompt_budget("ollama", "small") == 6192
+    assert prompt_budget("google", "large") == judicial_settings.micro_batch_prompt_tokens
+
+
+def test_sizer_shrinks_on_failures_and_recovers():
+    sizer = MicroBatchSizer("m", maximum=8, failure_threshold=0.25)
+    sizer.record(8, 0)
+    assert sizer.limit == 8
+    sizer.record(8, 8)  # whole batch lost
+    assert sizer.limit == 4
+    sizer.record(4, 4)
+    assert sizer.limit == 2
+    for _ in range(3):
+        sizer.record(2, 0)
+    assert sizer.limit == 3
+    assert sizer.snapshot()["maximum"] == 8
+
+
+def test_fan_out_sends_micro_batches(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "batching_enabled", True)
+    monkeypatch.setattr(judicial_settings, "batching_axis", "judge")
+    monkeypatch.setattr(judicial_settings, "judicial_redundancy_factor", 1)
+    monkeypatch.setattr(judicial_settings, "micro_batch_max_criteria", 2)
+    state = {
+        "rubric_dimensions": DIMS,
+        "evidences": {},
+        "metadata": {"correlation_id": "run-micro"},
+    }
+    try:
+        sends = execute_judicial_layer(state)
+        prosecutor = [s.arg for s in sends if s.arg["judge_name"] == "Prosecutor"]
+        assert _ids(t["dimensions"] for t in prosecutor) == [["dim0", "dim1"], ["dim2", "dim3"], ["dim4"]]
+        assert prosecutor[0]["evidence_ref"] == "dims:dim0,dim1"
+        assert len(sends) == 9
+        assert get_run_metrics("run-micro").get("micro_batch.batches") == 9
+
+        # A model whose batches keep failing gets smaller batches on the next run
+        get_batch_sizer(judicial_settings.prosecutor_model).record(2, 2)
+        sends = execute_judicial_layer(state)
+        assert sum(s.arg["judge_name"] == "Prosecutor" for s in sends) == 5
+    finally:
+        release_evidence_store("run-micro")
+        release_run_metrics("run-micro")
@@ -0,0 +1,172 @@
+import re
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from src.config import hardened_config, judicial_settings
+from src.graph import chief_justice_update
+from src.nodes.judges import evaluate_criterion, execute_judicial_layer
+from src.nodes.justice import escalation_reasons, synthesize_criterion
+from src.state import Evidence, EvidenceClass, JudicialOutcome
+from src.utils.run_metrics import get_run_metrics
+
+EVIDENCE = Evidence(
+    evidence_id="repo_orch_0",
+    source="repo",
+    evidence_class=EvidenceClass.ORCHESTRATION_PATTERN,
+    goal="test",
+    found=True,
+    content="StateGraph add_edge fan-out",
+    location="src/graph.py",
+    rationale="test",
+    confidence=0.9,
+    timestamp=datetime.now(),
+)
+CITED = ("repo_orch_0",)
+SMALL_SCORES = {
+    "crit1": {"Prosecutor": 4, "Defense": 4, "TechLead": 3},  # agreement: settled by the small model
+    "crit2": {"Prosecutor": 2, "Defense": 5, "TechLead": 3},  # disagreement: escalated
+}
+
+
+@pytest.fixture
+def run_settings():
+    return {
+        "cascade_enabled": True,
+        "cascade_model": "small-model",
+        "cascade_max_variance": 1,
+        "streaming_synthesis_enabled": True,
+        "batching_enabled": False,
+        "judicial_redundancy_factor": 1,
+    }
+
+
+@pytest.fixture
+def run_evidences():
+    return {"repo": [EVIDENCE]}
+
+
+class FakeJudgeLLM:
+    """Scores like SMALL_SCORES on the small model (3 on any other) and reports 100 prompt tokens."""
+
+    def __init__(self, model: str):
+        self.model = model
+
+    async def ainvoke(self, messages, config=None):
+        text = "\n".join(m.content for m in messages)
+        judge = re.search(r"You are the (\w+)\.", text).group(1)
+        criterion = re.search(r"criterion '(\w+)'", text).group(1)
+        message = AIMessage(
+            content="",
+            usage_metadata={"input_tokens": 100, "output_tokens": 10, "total_tokens": 110},
+            response_metadata={"model_name": self.model},
+        )
+        for callback in config["callbacks"]:
+            callback.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]))
+        score = SMALL_SCORES[criterion][judge] if self.model == "small-model" else 3
+        return JudicialOutcome(
+            criterion_id=criterion, judge=judge, score=score, argument="a", cited_evidence=list(CITED)
+        )
+
+
+async def run_callable(**kwargs):
+    return await kwargs["llm_callable"]()
+
+
+@pytest.fixture
+def fake_judge(make_opinion):
+    async def judge_criterion(task):
+        judge, criterion = task["judge_name"], task["criterion_id"]
+        if task.get("model_override") == "small-model":
+            return {"opinions": [make_opinion(judge, criterion, SMALL_SCORES[criterion][judge], cited=CITED)]}
+        return {"opinions": [make_opinion(judge, criterion, 3, "_esc" if task.get("escalation") else "", cited=CITED)]}
+
+    return judge_criterion
+
+
+def test_escalation_reasons(make_opinion):
+    evidences = {"repo": [EVIDENCE]}
+    settled = synthesize_criterion(
+        "c",
+        "C",
+        [make_opinion("Prosecutor", "c", 4, cited=CITED), make_opinion("TechLead", "c", 3, cited=CITED)],
+        evidences,
+    )
+    assert escalation_reasons(settled, max_variance=1) == []
+
+    ops = [
+        make_opinion("Prosecutor", "c", 2, cited=["NO_EVIDENCE"]),
+        make_opinion("TechLead", "c", 4, cited=["repo_missing_9"]),
+    ]
+    flagged = synthesize_criterion("c", "C", ops, evidences)
+    assert escalation_reasons(flagged, max_variance=1) == ["disagreement", "low_confidence", "invalid_evidence"]
+
+
+async def test_only_unsettled_criteria_reach_the_large_models(state, fake_judge):
+    sends = execute_judicial_layer(state)
+    assert {s.arg["model_override"] for s in sends} == {"small-model"}
+
+    with patch("src.nodes.judges._judge_criterion", side_effect=fake_judge) as judge:
+        updates = [await evaluate_criterion(s.arg) for s in sends]
+    assert judge.call_count == 9  # 6 small-model calls + 3 escalated ones for crit2
+
+    results = {k: v for u in updates for k, v in u.get("criterion_results", {}).items()}
+    assert {op.opinion_id for op in results["crit1"].judge_opinions} == {
+        "Prosecutor_crit1",
+        "Defense_crit1",
+        "TechLead_crit1",
+    }
+    assert {op.opinion_id for op in results["crit2"].judge_opinions} == {
+        "Prosecutor_crit2_esc",
+        "Defense_crit2_esc",
+        "TechLead_crit2_esc",
+    }
+    assert results["crit2"].numeric_score == 3
+
+    metrics = get_run_metrics(state["metadata"]["correlation_id"])
+    assert metrics.get("cascade.criteria") == 2
+    assert metrics.get("cascade.escalations") == 1
+    assert metrics.get("cascade.escalations.disagreement") == 1
+    assert metrics.get("cascade.escalation_rate") == 0.5
+    assert metrics.get("cascade.large_calls_avoided") == 3
+
+    # The barrier keeps the streamed verdicts: small-model opinions of crit2 are superseded
+    state["opinions"] = [op for u in updates for op in u["opinions"]]
+    state["criterion_results"] = results
+    final = chief_justice_update(state)
+    assert final["criterion_results"]["crit2"] is results["crit2"]
+
+
+async def test_savings_net_of_small_model_spend(state, monkeypatch):
+    for judge in ("prosecutor", "defense", "techlead"):
+        monkeypatch.setitem(hardened_config.models, judge, "large-model")
+    # No latency history for the large model: the configured estimate is credited
+    monkeypatch.setattr(judicial_settings, "cascade_large_latency_estimate", 12.0)
+    monkeypatch.setattr("src.nodes.judges._get_judicial_llm", lambda model, _schema, **_kw: FakeJudgeLLM(model))
+    # Evidence far over the budget: every packed prompt records an omission
+    monkeypatch.setattr(judicial_settings, "prompt_reserve_tokens", 15900)
+    state["evidences"]["repo"] += [
+        EVIDENCE.model_copy(update={"evidence_id": f"repo_orch_{i}", "content": "fan-out " * 200}) for i in range(1, 20)
+    ]
+
+    sends = execute_judicial_layer(state)
+    with patch("src.nodes.judges.bounded_llm_call", side_effect=run_callable):
+        for send in sends:
+            await evaluate_criterion(send.arg)
+
+    metrics = get_run_metrics(state["metadata"]["correlation_id"])
+    assert metrics.get("cascade.large_calls_avoided") == 3
+    assert metrics.get("cascade.large_seconds_avoided") == pytest.approx(36.0)
+    avoided = metrics.get("cascade.large_prompt_tokens_avoided")
+    assert avoided > 0
+    # Both criteria paid for the small panel, including the escalated one
+    assert metrics.get("cascade.small_calls") == 6
+    assert metrics.get("cascade.small_prompt_tokens") == 600
+    assert metrics.get("cascade.net_prompt_tokens_saved") == avoided - 600
+    assert metrics.get("cascade.net_seconds_saved") == pytest.approx(36.0 - metrics.get("cascade.small_seconds"))
+    # Estimating the avoided calls packs no prompt. Blocks are memoized per criterion and
+    # model: small-model crit1 and crit2, large-model crit2 (escalated)
+    assert metrics.get("evidence_budget.packed_prompts") == 3
@@ -0,0 +1,98 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.nodes.judges import BatchOutcomeResponse, evaluate_panel_criterion, execute_judicial_layer
+from src.state import JudicialOutcome
+
+
+class FakePanelLLM:
+    """Renders the Prosecutor and Defense opinions of a criterion, omitting the Tech Lead."""
+
+    calls = 0
+
+    async def ainvoke(self, messages, config=None):
+        FakePanelLLM.calls += 1
+        criterion = "crit1" if "'crit1'" in messages[0].content else "crit2"
+        return BatchOutcomeResponse(
+            opinions=[
+                JudicialOutcome(criterion_id=criterion, judge="Prosecutor", score=4, argument="a", cited_evidence=[]),
+                JudicialOutcome(criterion_id=criterion, judge="Defense", score=4, argument="b", cited_evidence=[]),
+                JudicialOutcome(criterion_id="other", judge="TechLead", score=2, argument="c", cited_evidence=[]),
+            ]
+        )
+
+
+@pytest.fixture
+def fake_judge(make_opinion):
+    async def judge(task):
+        return {"opinions": [make_opinion(task["judge_name"], task["criterion_id"], 4, "_single")]}
+
+    return judge
+
+
+@pytest.fixture
+def run_settings():
+    return {
+        "batching_enabled": True,
+        "batching_axis": "criterion",
+        "streaming_synthesis_enabled": True,
+        "judicial_redundancy_factor": 1,
+    }
+
+
+@pytest.fixture(autouse=True)
+def panel_llm(monkeypatch):
+    monkeypatch.setattr("src.nodes.judges._get_judicial_llm", lambda _model, _schema, **_kw: FakePanelLLM())
+    FakePanelLLM.calls = 0
+
+
+async def run_callable(**kwargs):
+    return await kwargs["llm_callable"]()
+
+
+def test_one_panel_send_per_criterion(state):
+    sends = execute_judicial_layer(state)
+    assert [(s.node, s.arg["criterion_id"]) for s in sends] == [
+        ("evaluate_panel_criterion", "crit1"),
+        ("evaluate_panel_criterion", "crit2"),
+    ]
+    assert sends[0].arg["judges"] == ["Prosecutor", "Defense", "TechLead"]
+
+
+async def test_missing_judge_falls_back_and_criterion_streams(state, fake_judge):
+    sends = execute_judicial_layer(state)
+    with (
+        patch("src.nodes.judges.bounded_llm_call", side_effect=run_callable),
+        patch("src.nodes.judges._judge_criterion", side_effect=fake_judge) as single,
+    ):
+        updates = [await evaluate_panel_criterion(s.arg) for s in sends]
+
+    assert FakePanelLLM.calls == 2
+    # Only the Tech Lead (whose opinion named another criterion) was re-asked individually
+    assert sorted((c.args[0]["judge_name"], c.args[0]["criterion_id"]) for c in single.call_args_list) == [
+        ("TechLead", "crit1"),
+        ("TechLead", "crit2"),
+    ]
+    for update, criterion in zip(updates, ("crit1", "crit2"), strict=True):
+        assert sorted(op.judge for op in update["opinions"]) == ["Defense", "Prosecutor", "TechLead"]
+        assert update["criterion_results"][criterion].numeric_score == 4
+        # Panel opinions carry their replica suffix, so replica panels cannot collide
+        panel_ids = [op.opinion_id for op in update["opinions"] if op.judge != "TechLead"]
+        assert all(op_id.endswith("_r0") for op_id in panel_ids)
+
+
+async def test_failed_panel_falls_back_for_every_judge(state, fake_judge):
+    sends = execute_judicial_layer(state)
+
+    async def failing(**_kwargs):
+        raise RuntimeError("provider down")
+
+    with (
+        patch("src.nodes.judges.bounded_llm_call", side_effect=failing),
+        patch("src.nodes.judges._judge_criterion", side_effect=fake_judge) as single,
+    ):
+        update = await evaluate_panel_criterion(sends[0].arg)
+
+    assert single.call_count == 3
+    assert update["criterion_results"]["crit1"].numeric_score == 4
@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from src.config import judicial_settings
+from src.judicial.criterion_tracker import CriterionTracker
+from src.nodes.judicial_nodes import (
+    AdaptiveLimit,
+    ConcurrencyController,
+    PriorityWaitQueue,
+    bounded_llm_call,
+    effective_priority,
+    reset_concurrency_controller,
+)
+from src.utils.orchestration import reset_rate_limiters
+from src.utils.run_metrics import get_run_metrics, release_run_metrics
+
+
+@pytest.fixture(autouse=True)
+def cleanup(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "priority_scheduling_enabled", True)
+    monkeypatch.setattr(judicial_settings, "priority_aging_interval", 10.0)
+    reset_concurrency_controller()
+    reset_rate_limiters()
+    yield
+    reset_concurrency_controller()
+    reset_rate_limiters()
+
+
+async def _queue_order(holder, waiters):
+    """Starts `waiters` (name, acquire coroutine factory) behind a held slot, releases it and records the order."""
+    served = []
+
+    async def wait(name, acquire):
+        await acquire()
+        served.append(name)
+        await holder.release()
+
+    tasks = []
+    for name, acquire in waiters:
+        tasks.append(asyncio.create_task(wait(name, acquire)))
+        await asyncio.sleep(0)
+    await holder.release()
+    await asyncio.gather(*tasks)
+    return served
+
+
+def test_aging_and_progress_lower_the_effective_priority():
+    assert effective_priority("re_evaluation", None, 0.0, 0.0) < effective_priority("first_pass", None, 0.0, 0.0)
+    assert effective_priority("first_pass", lambda: 1.0, 0.0, 0.0) == effective_priority("fallback", None, 0.0, 0.0)
+    # A first-pass call waiting 20s catches up with a fresh re-evaluation
+    assert effective_priority("first_pass", None, 0.0, 20.0) == effective_priority("re_evaluation", None, 20.0, 20.0)
+
+
+async def test_queue_skips_cancelled_waiters():
+    queue = PriorityWaitQueue()
+    low = queue.push("first_pass")
+    high = queue.push("re_evaluation")
+    high.cancel()
+    assert len(queue) == 1
+    assert queue.pop() is low
+    assert queue.pop() is None
+
+
+async def test_controller_serves_waiters_by_priority():
+    controller = ConcurrencyController(max_concurrent=1)
+    await controller.acquire("Prosecutor", "crit0")
+
+    class Holder:
+        async def release(self):
+            await controller.release("Prosecutor", "crit0")
+
+    tracker = CriterionTracker("run")
+    tracker.expect("crit2", "Two", [("Prosecutor", "a"), ("Defense", "b")])
+    tracker.add("crit2", ("Prosecutor", "a"), [])
+
+    served = await _queue_order(
+        Holder(),
+        [
+            ("first", lambda: controller.acquire("Defense", "crit1", "first_pass")),
+            (
+                "progressed",
+                lambda: controller.acquire("Defense", "crit2", "first_pass", lambda: tracker.progress("crit2")),
+            ),
+            ("fallback", lambda: controller.acquire("TechLead", "crit3", "fallback")),
+            ("re_eval", lambda: controller.acquire("Defense", "crit4", "re_evaluation")),
+        ],
+    )
+    assert served == ["re_eval", "fallback", "progressed", "first"]
+    assert controller.active_count == 0
+    assert not controller._semaphore.locked()
+
+
+async def test_disabled_scheduling_is_fifo(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "priority_scheduling_enabled", False)
+    window = AdaptiveLimit("google:gemini", initial=1, minimum=1, maximum=1)
+    await window.acquire()
+    served = await _queue_order(
+        window,
+        [
+            ("first", lambda: window.acquire("first_pass")),
+            ("re_eval", lambda: window.acquire("re_evaluation")),
+        ],
+    )
+    assert served == ["first", "re_eval"]
+
+
+async def test_cancelled_waiter_passes_its_slot_on():
+    controller = ConcurrencyController(max_concurrent=1)
+    await controller.acquire("Prosecutor", "crit0")
+    doomed = asyncio.create_task(controller.acquire("Defense", "crit1", "re_evaluation"))
+    survivor = asyncio.create_task(controller.acquire("TechLead", "crit2"))
+    await asyncio.sleep(0)
+    await controller.release("Prosecutor", "crit0")  # hands the slot to `doomed`...
+    doomed.cancel()  # ...which is cancelled before it resumes
+    await asyncio.wait_for(survivor, timeout=1)
+    assert controller.active_count == 1
+    await controller.release("TechLead", "crit2")
+    assert not controller._semaphore.locked()
+
+
+async def test_queue_wait_is_exported_per_class():
+    controller = ConcurrencyController(max_concurrent=1)
+
+    async def call():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    await asyncio.gather(
+        bounded_llm_call(controller, "Defense", "crit1", call, run_id="run-prio"),
+        bounded_llm_call(controller, "Defense", "crit2", call, priority_class="fallback", run_id="run-prio"),
+    )
+    waits = controller.snapshot()["queue_wait"]
+    assert set(waits) == {"first_pass", "fallback"}
+    assert waits["first_pass"]["calls"] == 1
+    metrics = get_run_metrics("run-prio")
+    assert metrics.get("queue_wait.fallback.calls") == 1
+    assert metrics.get("queue_wait.fallback.seconds") + metrics.get("queue_wait.first_pass.seconds") >= 0.015
+    release_run_metrics("run-prio")
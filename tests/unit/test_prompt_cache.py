@@ -0,0 +1,105 @@
+from types import SimpleNamespace
+from typing import ClassVar
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.config import judicial_settings
+from src.judicial.prompt_cache import get_prompt_cache, release_prompt_cache
+from src.nodes.judges import JudicialTask, evaluate_criterion
+from src.state import JudicialOutcome
+from src.utils.run_metrics import get_run_metrics, release_run_metrics
+
+
+class FakeLLM:
+    """Structured-output stand-in recording the messages and client kwargs of each judicial call."""
+
+    calls: ClassVar[list] = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    async def ainvoke(self, messages, config=None):
+        FakeLLM.calls.append((self.kwargs, list(messages)))
+        return JudicialOutcome(criterion_id="c1", judge="Defense", score=4, argument="ok", cited_evidence=[])
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    FakeLLM.calls = []
+    monkeypatch.setattr("src.nodes.judges._get_judicial_llm", lambda _model, _schema, **kw: FakeLLM(**kw))
+
+    async def run_callable(**kwargs):
+        return await kwargs["llm_callable"]()
+
+    with patch("src.nodes.judges.bounded_llm_call", side_effect=run_callable):
+        yield FakeLLM
+    release_prompt_cache("run-pc")
+    release_run_metrics("run-pc")
+
+
+def _task(judge: str) -> JudicialTask:
+    return JudicialTask(
+        judge_name=judge,
+        criterion_id="c1",
+        criterion_description="desc",
+        correlation_id="run-pc_r0",
+        run_id="run-pc",
+        evidences={"repo": [{"evidence_id": "e1", "evidence_class": "GIT_FORENSIC", "confidence": 1, "content": "x"}]},
+    )
+
+
+async def test_judges_share_evidence_prefix(fake_llm, monkeypatch):
+    """The evidence block leads the prompt, ahead of persona and criterion, identically for every judge."""
+    monkeypatch.setattr(judicial_settings, "judicial_provider", "ollama")
+    for judge in ("Prosecutor", "Defense", "TechLead"):
+        await evaluate_criterion(_task(judge))
+
+    systems = [messages[0].content for _kwargs, messages in fake_llm.calls]
+    prefix = systems[0].split("You are the Prosecutor.")[0]
+    assert "ID: e1" in prefix
+    assert all(system.startswith(prefix) for system in systems)
+    assert all(isinstance(messages[0], SystemMessage) for _kwargs, messages in fake_llm.calls)
+
+
+async def test_gemini_cached_content_created_once_per_prefix(fake_llm, monkeypatch):
+    monkeypatch.setattr(judicial_settings, "judicial_provider", "google")
+    monkeypatch.setattr(judicial_settings, "prompt_cache_enabled", True)
+    monkeypatch.setattr(judicial_settings, "prompt_cache_min_tokens", 0)
+    client = MagicMock()
+    client.aio.caches.create = AsyncMock(return_value=SimpleNamespace(name="cachedContents/abc"))
+    monkeypatch.setattr(get_prompt_cache("run-pc"), "_client", client)
+
+    for judge in ("Prosecutor", "Defense"):
+        await evaluate_criterion(_task(judge))
+
+    client.aio.caches.create.assert_awaited_once()
+    for kwargs, messages in fake_llm.calls:
+        assert kwargs == {"cached_content": "cachedContents/abc"}
+        # The prefix is not resent: only the judge instructions travel with the request
+        assert len(messages) == 1
+        assert isinstance(messages[0], HumanMessage)
+        assert "ID: e1" not in messages[0].content
+
+
+def test_cache_usage_metrics(monkeypatch):
+    """Provider-reported cache reads and estimated Ollama prefix reuse feed the run's hit ratio."""
+    monkeypatch.setattr(judicial_settings, "prompt_cache_enabled", True)
+    cache = get_prompt_cache("run-metrics")
+
+    cache.record_usage(
+        "google", "gemini", "p", {"gemini": {"input_tokens": 1000, "input_token_details": {"cache_read": 800}}}
+    )
+    cache.record_usage("google", "gemini", "p", {"gemini": {"input_tokens": 1000}})
+    cache.record_usage("ollama", "llama", "x" * 400, {"llama": {"input_tokens": 120}})
+    cache.record_usage("ollama", "llama", "x" * 400, {"llama": {"input_tokens": 20}})
+
+    snapshot = get_run_metrics("run-metrics").snapshot()
+    assert snapshot["prompt_cache.requests"] == 4
+    assert snapshot["prompt_cache.hits"] == 2
+    assert snapshot["prompt_cache.saved_input_tokens"] == 800 + 101
+    assert snapshot["prompt_cache.hit_ratio"] == 0.5
+
+    release_prompt_cache("run-metrics")
+    release_run_metrics("run-metrics")
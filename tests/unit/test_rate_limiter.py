@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+import pytest
+
+from src.config import judicial_settings
+from src.utils.orchestration import (
+    ModelRateLimiter,
+    TokenBucketRateLimiter,
+    get_model_rate_limiter,
+    reset_rate_limiters,
+)
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+def test_reservations_queue_in_arrival_order():
+    bucket = TokenBucketRateLimiter(rate=10.0, capacity=1.0)
+    delays = [bucket.reserve() for _ in range(3)]
+    assert delays[0] == 0.0
+    assert delays[1] == pytest.approx(0.1, abs=0.01)
+    assert delays[2] == pytest.approx(0.2, abs=0.01)
+
+
+async def test_waiters_sleep_concurrently():
+    bucket = TokenBucketRateLimiter(rate=50.0, capacity=1.0)
+    start = time.monotonic()
+    await asyncio.gather(*(bucket.consume() for _ in range(6)))
+    # Five waiters owe 20ms each in arrival order: ~100ms in total
+    assert time.monotonic() - start < 0.3
+
+
+async def test_token_charge_is_reconciled_with_actual_usage():
+    limiter = ModelRateLimiter("google", "gemini", rpm=600, tpm=6000, burst=5)
+    charged = await limiter.acquire(estimated_tokens=4000)
+    assert charged == 4000
+    assert limiter.snapshot()["tokens_available"] == pytest.approx(2000, abs=5)
+
+    limiter.reconcile(charged, actual_tokens=1000)  # the estimate was pessimistic: refund
+    assert limiter.snapshot()["tokens_available"] == pytest.approx(5000, abs=5)
+
+
+async def test_cancelled_waiter_refunds_its_reservation():
+    limiter = ModelRateLimiter("google", "gemini", rpm=60, tpm=None, burst=1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.requests.tokens > -0.5  # the cancelled slot was given back
+
+
+def test_limits_are_per_model_with_overrides(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "rate_limit_rpm", 120.0)
+    monkeypatch.setattr(judicial_settings, "rate_limit_overrides", {"google:gemini-pro": {"rpm": 6, "tpm": 32000}})
+    flash = get_model_rate_limiter("google", "gemini-flash")
+    pro = get_model_rate_limiter("google", "gemini-pro")
+    assert flash is get_model_rate_limiter("google", "gemini-flash")
+    assert flash.requests.rate == pytest.approx(2.0)
+    assert flash.tokens is None
+    assert pro.requests.rate == pytest.approx(0.1)
+    assert pro.tokens.capacity == 32000
@@ -0,0 +1,52 @@
+from src.graph import chief_justice_update, route_after_justice_with_errors
+from src.judicial.evidence_store import get_evidence_store
+from src.nodes.justice import outlier_judges
+from src.state import merge_criterion_results
+from src.utils.run_metrics import get_run_metrics
+
+
+def test_outlier_judges_deviate_from_median(make_opinion):
+    prosecutor, defense = make_opinion("Prosecutor", "crit1", 2), make_opinion("Defense", "crit1", 5)
+    assert outlier_judges([prosecutor, defense, make_opinion("TechLead", "crit1", 3)]) == ["Defense"]
+    assert outlier_judges([prosecutor, defense]) == ["Defense", "Prosecutor"]
+
+
+def test_second_cycle_rejudges_only_outliers_and_skips_aggregator(state, make_opinion):
+    first_cycle = [make_opinion(j, "crit1", s) for j, s in (("Prosecutor", 2), ("Defense", 5), ("TechLead", 3))]
+    first_cycle += [make_opinion(j, "crit2", 4) for j in ("Prosecutor", "Defense", "TechLead")]
+    state["opinions"] = first_cycle
+    run_id = state["metadata"]["correlation_id"]
+    get_evidence_store(run_id).publish({}, state["rubric_dimensions"])
+    update = chief_justice_update(state)
+    assert set(update) == {"criterion_results", "re_eval_needed", "re_eval_count"}
+    assert update["re_eval_needed"] is True
+
+    state.update(update)
+    sends = route_after_justice_with_errors(state)
+    assert [(s.node, s.arg["judge_name"], s.arg["criterion_id"]) for s in sends] == [
+        ("evaluate_criterion", "Defense", "crit1"),
+    ]
+    assert "RE-EVALUATION" in sends[0].arg["re_evaluation"]
+    assert get_run_metrics(run_id).get("re_evaluation.tasks") == 1
+
+    # The revised Defense opinion supersedes the first one; the others are kept
+    state["opinions"] = [*first_cycle, make_opinion("Defense", "crit1", 3, "_re1")]
+    second = chief_justice_update(state)
+    result = second["criterion_results"]["crit1"]
+    assert {op.opinion_id for op in result.judge_opinions} == {
+        "Prosecutor_crit1",
+        "TechLead_crit1",
+        "Defense_crit1_re1",
+    }
+    assert result.re_evaluation_required is False
+    assert second["re_eval_needed"] is False
+
+    # Equal confidence: the re-synthesized result replaces the first-cycle one
+    merged = merge_criterion_results(state["criterion_results"], second["criterion_results"])
+    assert merged["crit1"] is result
+
+
+def test_changed_evidence_goes_back_through_aggregator(state):
+    # Nothing was published for this run: the evidence is re-collected
+    state["re_eval_needed"] = True
+    assert route_after_justice_with_errors(state) == "judges"
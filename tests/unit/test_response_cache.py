@@ -0,0 +1,96 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.config import judicial_settings
+from src.nodes.judges import JudicialTask, evaluate_criterion
+from src.state import JudicialOpinion, JudicialOutcome
+from src.utils.response_cache import ResponseCache
+from src.utils.run_metrics import get_run_metrics, release_run_metrics
+
+
+def _outcome(score: int = 4) -> JudicialOutcome:
+    return JudicialOutcome(criterion_id="c1", judge="Defense", score=score, argument="ok", cited_evidence=["e1"])
+
+
+def test_roundtrip_ttl_and_lru(tmp_path):
+    cache = ResponseCache(str(tmp_path / "responses.sqlite"), ttl_seconds=3600, max_entries=2)
+    cache.put("a", JudicialOutcome, _outcome(1))
+    cache.put("b", JudicialOutcome, _outcome(2))
+    assert cache.get("a", JudicialOutcome).score == 1  # touches "a": "b" is now least recently used
+
+    cache.put("c", JudicialOutcome, _outcome(3))
+    assert len(cache) == 2
+    assert cache.get("b", JudicialOutcome) is None
+    assert cache.get("a", JudicialOutcome).score == 1
+
+    cache.ttl_seconds = -1
+    assert cache.get("c", JudicialOutcome) is None
+    cache.close()
+
+
+@pytest.fixture
+def enabled_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(judicial_settings, "response_cache_enabled", True)
+    monkeypatch.setattr(judicial_settings, "response_cache_path", str(tmp_path / "responses.sqlite"))
+    monkeypatch.setattr("src.utils.response_cache._cache", None)
+    yield
+    release_run_metrics("run-rc")
+
+
+def _task(cache_mode: str = "use", replica: int = 0) -> JudicialTask:
+    return JudicialTask(
+        judge_name="Defense",
+        criterion_id="c1",
+        criterion_description="desc",
+        correlation_id=f"run-rc_r{replica}",
+        run_id="run-rc",
+        cache_mode=cache_mode,
+        evidences={"repo": []},
+    )
+
+
+@pytest.mark.usefixtures("enabled_cache")
+async def test_identical_request_served_from_cache():
+    """A repeated identical judicial request is answered from disk without an LLM call."""
+    opinion = JudicialOpinion(opinion_id="x", **_outcome().model_dump())
+    with (
+        patch("src.nodes.judges.get_concurrency_controller"),
+        patch("src.nodes.judges.bounded_llm_call", new_callable=AsyncMock, return_value=opinion) as bounded,
+    ):
+        first = await evaluate_criterion(_task())
+        second = await evaluate_criterion(_task())
+        assert bounded.await_count == 1
+
+        # refresh: skips the read and stores the fresh answer; bypass: no read, no write
+        await evaluate_criterion(_task("refresh"))
+        await evaluate_criterion(_task("bypass"))
+        assert bounded.await_count == 3
+
+    assert second["opinions"][0].score == first["opinions"][0].score == 4
+    snapshot = get_run_metrics("run-rc").snapshot()
+    assert snapshot["response_cache.requests"] == 3
+    assert snapshot["response_cache.hits"] == 1
+    assert snapshot["response_cache.writes"] == 2
+
+
+@pytest.mark.usefixtures("enabled_cache")
+async def test_replicas_and_sampled_requests_skip_the_cache(monkeypatch):
+    """Replicas and temperature > 0 calls must be independent answers, never cached copies."""
+    opinion = JudicialOpinion(opinion_id="x", **_outcome().model_dump())
+    with (
+        patch("src.nodes.judges.get_concurrency_controller"),
+        patch("src.nodes.judges.bounded_llm_call", new_callable=AsyncMock, return_value=opinion) as bounded,
+    ):
+        await evaluate_criterion(_task())
+        await evaluate_criterion(_task(replica=1))
+        await evaluate_criterion(_task() | {"replica": 1})
+        assert bounded.await_count == 3
+
+        monkeypatch.setattr(judicial_settings, "llm_temperature", 0.7)
+        await evaluate_criterion(_task())
+        assert bounded.await_count == 4
+
+    snapshot = get_run_metrics("run-rc").snapshot()
+    assert snapshot["response_cache.requests"] == 1
+    assert snapshot["response_cache.writes"] == 1
@@ -0,0 +1,128 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.config import judicial_settings
+from src.nodes.judges import JudicialTask, evaluate_criterion
+from src.nodes.judicial_nodes import SingleFlight, reset_concurrency_controller
+from src.state import JudicialOpinion, JudicialOutcome
+from src.utils.run_metrics import get_run_metrics, release_run_metrics
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    reset_concurrency_controller()
+    yield
+    reset_concurrency_controller()
+    release_run_metrics("run-sf")
+
+
+async def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "verdict"
+
+    results = await asyncio.gather(*(flight.do("k", call) for _ in range(4)))
+    assert calls == 1
+    assert [r for r, _ in results] == ["verdict"] * 4
+    assert sorted(shared for _, shared in results) == [False, True, True, True]
+    assert flight.inflight == 0
+
+    # Not in flight anymore: a later caller runs its own call
+    await flight.do("k", call)
+    assert calls == 2
+
+
+async def test_leader_failure_is_shared():
+    flight = SingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(*(flight.do("k", failing) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+async def test_follower_takes_over_after_leader_cancellation():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(10)
+
+    async def fast():
+        return "done"
+
+    leader = asyncio.create_task(flight.do("k", slow))
+    await started.wait()
+    follower = asyncio.create_task(flight.do("k", fast))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == ("done", False)
+
+
+def _task(judge: str = "Defense") -> JudicialTask:
+    return JudicialTask(
+        judge_name=judge,
+        criterion_id="c1",
+        criterion_description="desc",
+        correlation_id="run-sf_r0",
+        run_id="run-sf",
+        evidences={"repo": []},
+    )
+
+
+async def test_identical_judicial_requests_are_coalesced(monkeypatch):
+    """Redundancy replicas of the same request take one slot; each keeps its own opinion id."""
+    monkeypatch.setattr(judicial_settings, "llm_temperature", 0.0)
+    calls = 0
+
+    async def fake_bounded(**_kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        outcome = JudicialOutcome(criterion_id="c1", judge="Defense", score=4, argument="ok", cited_evidence=["e1"])
+        return JudicialOpinion(opinion_id="leader", **outcome.model_dump())
+
+    timestamps = iter(f"2026010100000{i}" for i in range(3))
+    with (
+        patch("src.nodes.judges.get_concurrency_controller"),
+        patch("src.nodes.judges.bounded_llm_call", side_effect=fake_bounded),
+        patch("src.nodes.judges.datetime") as dt,
+    ):
+        dt.datetime.now.return_value.strftime.side_effect = lambda _fmt: next(timestamps)
+        results = await asyncio.gather(*(evaluate_criterion(_task()) for _ in range(3)))
+
+    assert calls == 1
+    opinions = [r["opinions"][0] for r in results]
+    assert {op.score for op in opinions} == {4}
+    assert len({op.opinion_id for op in opinions}) == 3
+    snapshot = get_run_metrics("run-sf").snapshot()
+    assert snapshot["singleflight.requests"] == 3
+    assert snapshot["singleflight.hits"] == 2
+
+
+async def test_nonzero_temperature_is_not_coalesced(monkeypatch):
+    monkeypatch.setattr(judicial_settings, "llm_temperature", 0.7)
+
+    async def fake_bounded(**_kwargs):
+        await asyncio.sleep(0.01)
+        outcome = JudicialOutcome(criterion_id="c1", judge="Defense", score=3, argument="ok", cited_evidence=["e1"])
+        return JudicialOpinion(opinion_id="x", **outcome.model_dump())
+
+    with (
+        patch("src.nodes.judges.get_concurrency_controller"),
+        patch("src.nodes.judges.bounded_llm_call", side_effect=fake_bounded) as bounded,
+    ):
+        await asyncio.gather(*(evaluate_criterion(_task()) for _ in range(2)))
+
+    assert bounded.call_count == 2
+    assert "singleflight.requests" not in get_run_metrics("run-sf").snapshot()
@@ -0,0 +1,85 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.config import judicial_settings
+from src.graph import chief_justice_update
+from src.judicial.criterion_tracker import CriterionTracker
+from src.nodes.judges import evaluate_criterion, execute_judicial_layer
+from src.utils.run_metrics import get_run_metrics
+
+SCORES = {
+    "crit1": {"Prosecutor": 2, "Defense": 5, "TechLead": 3},
+    "crit2": {"Prosecutor": 4, "Defense": 4, "TechLead": 4},
+}
+
+
+@pytest.fixture
+def run_settings():
+    return {"streaming_synthesis_enabled": True, "batching_enabled": False, "judicial_redundancy_factor": 1}
+
+
+@pytest.fixture
+def fake_judge(make_opinion):
+    async def judge_criterion(task):
+        judge, criterion = task["judge_name"], task["criterion_id"]
+        if task.get("re_eval_cycle"):
+            return {"opinions": [make_opinion(judge, criterion, 3, "_re1")]}
+        return {"opinions": [make_opinion(judge, criterion, SCORES[criterion][judge])]}
+
+    return judge_criterion
+
+
+def test_tracker_completes_once(make_opinion):
+    tracker = CriterionTracker("r")
+    tracker.expect("c", "C", [("Prosecutor", "r_r0"), ("Defense", "r_r0")])
+    assert tracker.add("c", ("Prosecutor", "r_r0"), [make_opinion("Prosecutor", "c", 3)]) is None
+    assert tracker.add("c", ("TechLead", "r_r0"), [make_opinion("TechLead", "c", 3)]) is None  # untracked slot
+    assert len(tracker.add("c", ("Defense", "r_r0"), [make_opinion("Defense", "c", 3)])) == 2
+    assert tracker.add("c", ("Defense", "r_r0"), [make_opinion("Defense", "c", 3)]) is None
+
+
+async def test_criteria_are_synthesized_as_their_opinions_complete(state, fake_judge):
+    sends = execute_judicial_layer(state)
+    with patch("src.nodes.judges._judge_criterion", side_effect=fake_judge):
+        updates = [await evaluate_criterion(s.arg) for s in sends]
+
+    # Only the last task of each criterion publishes its result
+    published = [u for u in updates if "criterion_results" in u]
+    assert [next(iter(u["criterion_results"])) for u in published] == ["crit1", "crit2"]
+
+    # crit1 was re-evaluated immediately by its outlier judge only
+    crit1 = published[0]["criterion_results"]["crit1"]
+    assert [op.opinion_id for op in published[0]["opinions"] if op.opinion_id.endswith("_re1")] == ["Defense_crit1_re1"]
+    assert crit1.execution_log["re_evaluated"] is True
+    assert crit1.numeric_score == 3
+    assert published[1]["criterion_results"]["crit2"].dimension_name == "Two"
+    assert get_run_metrics(state["metadata"]["correlation_id"]).get("streaming_synthesis.criteria") == 2
+
+    # The Chief Justice barrier reuses the streamed verdicts and starts no second cycle
+    state["opinions"] = [op for u in updates for op in u["opinions"]]
+    for u in published:
+        state["criterion_results"].update(u["criterion_results"])
+    final = chief_justice_update(state)
+    assert final["criterion_results"]["crit1"] is crit1
+    assert final["re_eval_needed"] is False
+
+
+async def test_hung_follow_ups_keep_the_streamed_verdict(state, fake_judge, monkeypatch):
+    monkeypatch.setattr(judicial_settings, "streaming_follow_up_timeout", 0.05)
+
+    async def hung_re_evaluation(task):
+        if task.get("re_eval_cycle"):
+            await asyncio.sleep(10)
+        return await fake_judge(task)
+
+    sends = execute_judicial_layer(state)
+    with patch("src.nodes.judges._judge_criterion", side_effect=hung_re_evaluation):
+        updates = [await evaluate_criterion(s.arg) for s in sends if s.arg["criterion_id"] == "crit1"]
+
+    crit1 = updates[-1]["criterion_results"]["crit1"]
+    assert crit1.execution_log["follow_ups_timed_out"] is True
+    assert "re_evaluated" not in crit1.execution_log
+    assert any("TIMEOUT" in err for err in updates[-1]["errors"])
+    assert get_run_metrics(state["metadata"]["correlation_id"]).get("streaming_synthesis.follow_up_timeouts") == 1
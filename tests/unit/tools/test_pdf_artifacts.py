@@ -0,0 +1,71 @@
+import fitz
+import pytest
+
+from src.tools import pdf_artifacts
+from src.tools.pdf_artifacts import PDFArtifacts, get_pdf_artifacts, release_pdf_artifacts
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    """Two-page PDF with text on both pages and one embedded PNG on the first."""
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), False)
+    pix.clear_with(200)
+
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "StateGraph fan-out architecture")
+    page.insert_image(fitz.Rect(100, 100, 200, 200), stream=pix.tobytes("png"))
+    doc.new_page().insert_text((72, 72), "Judicial layer")
+    path = tmp_path / "spec.pdf"
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def test_shared_handle_per_run(sample_pdf):
+    first = get_pdf_artifacts(sample_pdf, "run-a")
+    assert get_pdf_artifacts(sample_pdf, "run-a") is first
+    assert get_pdf_artifacts(sample_pdf, "run-b") is not first
+    release_pdf_artifacts("run-a")
+    release_pdf_artifacts("run-b")
+    assert get_pdf_artifacts(sample_pdf, "run-a") is not first
+    release_pdf_artifacts("run-a")
+    # Without a run id there is nothing to scope (or release) the handle by
+    with pytest.raises(ValueError):
+        get_pdf_artifacts(sample_pdf, "")
+
+
+def test_document_read_once_and_artifacts_cached(sample_pdf, mocker):
+    handle = PDFArtifacts(sample_pdf)
+    open_spy = mocker.spy(pdf_artifacts.fitz, "open")
+
+    images = handle.images()
+    assert len(images) == 1
+    assert images[0]["page"] == 1
+    assert images[0]["mime_type"] == "image/png"
+    assert handle.images() is images
+
+    mocker.patch("src.tools.pdf_artifacts.DocumentConverter", None)
+    markdown = handle.markdown()
+    assert "StateGraph" in markdown
+    assert handle.markdown() is markdown
+
+    # Images and page text both came from a single parse
+    assert open_spy.call_count == 1
+    handle.close()
+
+
+def test_markdown_falls_back_to_page_text(sample_pdf, mocker):
+    mocker.patch("src.tools.pdf_artifacts.DocumentConverter", None)
+    handle = PDFArtifacts(sample_pdf)
+    markdown = handle.markdown()
+    assert "StateGraph fan-out architecture" in markdown
+    assert "Judicial layer" in markdown
+    handle.close()
+
+
+def test_missing_file_yields_no_images(tmp_path, mocker):
+    mocker.patch("src.tools.pdf_artifacts.DocumentConverter", None)
+    handle = PDFArtifacts(str(tmp_path / "missing.pdf"))
+    assert handle.images() == []
+    assert handle.markdown() == ""
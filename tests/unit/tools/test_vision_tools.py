@@ -29,3 +29,53 @@ def test_run_vision_classification_success(mocker):
     assert len(res) == 1
     assert res[0]["classification"] == "Parallel Flow. It runs in parallel."
     assert res[0]["image_index"] == 0
+
+
+def test_run_vision_classification_batched_partial_success(mocker):
+    mocker.patch("src.tools.vision_tools.detective_settings.vision_batch_size", 4)
+    mocker.patch(
+        "src.tools.vision_tools.extract_images_from_pdf",
+        return_value=[{"base64": f"img{i}", "page": i + 1} for i in range(3)],
+    )
+    batch_mock = mocker.patch(
+        "src.tools.vision_tools.classify_diagram_batch",
+        return_value={0: "Fan-out diagram", 2: "Fan-in diagram"},
+    )
+    single_mock = mocker.patch(
+        "src.tools.vision_tools.classify_diagram",
+        return_value="Single-call result",
+    )
+
+    res = run_vision_classification("fake.pdf", run_id="run-vision")
+
+    batch_mock.assert_called_once()
+    assert batch_mock.call_args.kwargs == {"run_id": "run-vision"}
+    # Only the image missing from the batch response falls back to a single call
+    single_mock.assert_called_once_with("img1", "image/jpeg", run_id="run-vision")
+    assert [r["classification"] for r in res] == [
+        "Fan-out diagram",
+        "Single-call result",
+        "Fan-in diagram",
+    ]
+
+
+def test_run_vision_classification_batch_failure_falls_back(mocker):
+    mocker.patch("src.tools.vision_tools.detective_settings.vision_batch_size", 2)
+    mocker.patch(
+        "src.tools.vision_tools.extract_images_from_pdf",
+        return_value=[{"base64": f"img{i}", "page": 1} for i in range(3)],
+    )
+    batch_mock = mocker.patch(
+        "src.tools.vision_tools.classify_diagram_batch",
+        side_effect=Exception("Malformed response"),
+    )
+    single_mock = mocker.patch(
+        "src.tools.vision_tools.classify_diagram",
+        return_value="Single-call result",
+    )
+
+    res = run_vision_classification("fake.pdf")
+
+    assert batch_mock.call_count == 2  # ceil(3 / 2) batches
+    assert single_mock.call_count == 3
+    assert len(res) == 3